@@ -0,0 +1,32 @@
+"""Dynamic container singletons initialization example."""
+
+import time
+
+import dependency_injector.containers as containers
+import dependency_injector.providers as providers
+
+
+def load(name, *dependencies):
+    """Sample slow initialization."""
+    time.sleep(0.1)
+    return name
+
+
+# Defining dynamic container:
+container = containers.DynamicContainer()
+container.database = providers.ThreadSafeSingleton(load, 'database')
+container.cache = providers.ThreadSafeSingleton(load, 'cache')
+container.model = providers.ThreadSafeSingleton(load, 'model')
+container.service = providers.ThreadSafeSingleton(load, 'service',
+                                                  container.database,
+                                                  container.cache,
+                                                  container.model)
+
+# Creating singletons: database, cache and model are created concurrently,
+# service is created after them:
+start = time.time()
+container.init_singletons(max_workers=4)
+
+# Making some asserts:
+assert time.time() - start < 0.3
+assert container.service() == 'service'
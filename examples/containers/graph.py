@@ -0,0 +1,33 @@
+"""Container dependency graph example."""
+
+import dependency_injector.containers as containers
+import dependency_injector.providers as providers
+import dependency_injector.graph as graph
+
+
+class Services(containers.DeclarativeContainer):
+    """Example container."""
+
+    database = providers.Singleton(object)
+    users = providers.Factory(dict, database=database)
+    auth = providers.Factory(dict, database=database, users=users)
+
+
+services = Services()
+services_graph = graph.build_graph(services)
+
+# Providers in order of their dependencies:
+order = [services_graph.get_name(provider)
+         for provider in services_graph.topological_order()]
+assert order == ['database', 'users', 'auth']
+
+# Most shared providers:
+assert services_graph.stats()[0]['name'] == 'database'
+assert services_graph.fan_in(services.database) == 2
+
+# No cycles:
+assert services_graph.find_cycles() == ()
+
+# Export to Graphviz and JSON:
+print(services_graph.to_dot())
+print(services_graph.to_json(indent=2))
@@ -0,0 +1,26 @@
+"""`Configuration` provider values loading example."""
+
+import os
+
+from dependency_injector import providers
+
+
+# Emulate environment variables
+os.environ['APP_DATABASE__HOST'] = 'localhost'
+os.environ['APP_DATABASE__PORT'] = '5432'
+os.environ['APP_DEBUG'] = 'true'
+
+
+config = providers.Configuration()
+
+config.from_env_prefix(
+    'APP_',
+    types={
+        'database.port': int,
+        'debug': bool,
+    },
+)
+
+assert config.database.host() == 'localhost'
+assert config.database.port() == 5432
+assert config.debug() is True
@@ -0,0 +1,31 @@
+"""`Configuration` provider reloading example."""
+
+import os
+import tempfile
+
+from dependency_injector import providers
+
+
+config = providers.Configuration()
+
+_, config_file = tempfile.mkstemp(suffix='.yml')
+with open(config_file, 'w') as opened_file:
+    opened_file.write('database:\n  pool_size: 10\n')
+
+config.from_yaml(config_file)
+config.database.pool_size.subscribe(
+    lambda old, new: print('Pool size changed from', old, 'to', new),
+)
+
+with open(config_file, 'w') as opened_file:
+    opened_file.write('database:\n  pool_size: 20\n')
+
+config.reload()  # Pool size changed from 10 to 20
+
+assert config.database.pool_size() == 20
+
+# Reload configuration in background when files change:
+watcher = config.watch(interval=1.0)
+watcher.stop()
+
+os.unlink(config_file)
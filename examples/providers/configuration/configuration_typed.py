@@ -0,0 +1,46 @@
+"""`Configuration` provider typed options example."""
+
+from dependency_injector import errors, providers
+
+
+class Client(object):
+
+    def __init__(self, host, port, timeout, debug):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.debug = debug
+
+
+config = providers.Configuration()
+
+client_factory = providers.Factory(
+    Client,
+    host=config.client.host.required(),
+    port=config.client.port.as_int().required(),
+    timeout=config.client.timeout.as_float(),
+    debug=config.debug.as_bool(),
+)
+
+config.from_dict(
+    {
+        'client': {
+            'host': 'localhost',
+            'port': '8080',
+            'timeout': '2.5',
+        },
+        'debug': 'yes',
+    },
+)
+config.validate()
+
+client = client_factory()
+
+assert client.port == 8080
+assert client.timeout == 2.5
+assert client.debug is True
+
+try:
+    config.from_dict({'client': {'port': 'http'}})
+except errors.Error:
+    assert config.client.port.as_int()() == 8080
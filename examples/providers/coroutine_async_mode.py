@@ -0,0 +1,40 @@
+"""Asynchronous resolution of `Coroutine` injections example.
+
+Current example works only fot Python 3.5+.
+"""
+
+import asyncio
+
+import dependency_injector.providers as providers
+
+
+class Service(object):
+    """Example class."""
+
+    def __init__(self, db, cache):
+        """Initialize instance."""
+        self.db = db
+        self.cache = cache
+
+
+async def connect(name):
+    """Sample coroutine function."""
+    await asyncio.sleep(0.1)
+    return name
+
+
+providers.enable_async_mode()
+
+service_factory = providers.Factory(
+    Service,
+    db=providers.Coroutine(connect, 'db'),
+    cache=providers.Coroutine(connect, 'cache'),
+)
+
+
+if __name__ == '__main__':
+    loop = asyncio.get_event_loop()
+    service = loop.run_until_complete(service_factory())
+
+    assert service.db == 'db'
+    assert service.cache == 'cache'
@@ -0,0 +1,24 @@
+"""`Factory` providers batch instance creation example."""
+
+import collections
+
+import dependency_injector.providers as providers
+
+
+Point = collections.namedtuple('Point', ['x', 'y', 'label'])
+
+
+points_factory = providers.Factory(Point, label='point')
+
+# Creating 3 points with the same context arguments:
+points = points_factory.many(3, x=0, y=0)
+assert points == [Point(0, 0, 'point')] * 3
+
+# Creating a point per keyword arguments mapping:
+points = points_factory.map([dict(x=1, y=2), dict(x=3, y=4)])
+assert points == [Point(1, 2, 'point'), Point(3, 4, 'point')]
+
+# Streaming points one by one:
+coordinates = (dict(x=x, y=x) for x in range(1000))
+for point in points_factory.imap(coordinates):
+    assert point.x == point.y
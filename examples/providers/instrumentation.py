@@ -0,0 +1,32 @@
+"""Providers instrumentation example."""
+
+import time
+
+import dependency_injector.containers as containers
+import dependency_injector.providers as providers
+
+
+def connect():
+    """Sample slow dependency."""
+    time.sleep(0.01)
+    return object()
+
+
+container = containers.DynamicContainer()
+container.connection = providers.Factory(connect)
+container.service = providers.Factory(dict, connection=container.connection)
+
+providers.enable_instrumentation()
+
+for _ in range(10):
+    container.service()
+
+providers.disable_instrumentation()
+
+stats = container.service.call_stats
+assert stats.calls == 10
+assert stats.self_time < stats.total_time
+assert stats.histogram.percentile(99) >= 10000000  # 10 ms in nanoseconds
+
+for name, provider_stats in sorted(container.stats().items()):
+    print(name, provider_stats)
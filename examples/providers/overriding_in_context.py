@@ -0,0 +1,39 @@
+"""Providers overriding in context example.
+
+Current example works only for Python 3.7+.
+"""
+
+import asyncio
+
+import dependency_injector.providers as providers
+
+
+class Storage:
+    """Example class Storage."""
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+
+storage_factory = providers.Factory(Storage, tenant='default')
+
+
+async def handle_request(tenant):
+    """Handle request of the tenant."""
+    with storage_factory.override_in_context(providers.Factory(Storage, tenant=tenant)):
+        await asyncio.sleep(0.1)
+        return storage_factory().tenant
+
+
+async def main():
+    """Handle requests of several tenants concurrently."""
+    tenants = await asyncio.gather(
+        handle_request('tenant1'),
+        handle_request('tenant2'),
+    )
+    assert tenants == ['tenant1', 'tenant2']
+    assert storage_factory().tenant == 'default'
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""`Pool` providers example."""
+
+import zlib
+
+import dependency_injector.providers as providers
+
+
+class Compressor:
+    """Example compressor that is expensive to create."""
+
+    def __init__(self, level):
+        """Initialize instance."""
+        self.level = level
+        self.context = zlib.compressobj(level)
+
+    def compress(self, data):
+        """Compress data."""
+        return self.context.compress(data) + self.context.flush(zlib.Z_SYNC_FLUSH)
+
+    def is_alive(self):
+        """Check that compressor is in good state."""
+        return self.context is not None
+
+
+compressors_pool = providers.Pool(Compressor, level=6) \
+    .set_max_size(4) \
+    .set_idle_timeout(60) \
+    .set_health_check(Compressor.is_alive)
+
+# Acquiring compressor and releasing it back to the pool on exit:
+with compressors_pool.acquire() as compressor:
+    compressed = compressor.compress(b'data')
+
+# Released compressor is reused:
+with compressors_pool.acquire() as another_compressor:
+    assert another_compressor is compressor
+
+assert compressors_pool.stats()['hits'] == 1
+assert compressors_pool.stats()['misses'] == 1
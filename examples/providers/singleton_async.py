@@ -0,0 +1,42 @@
+"""`AsyncSingleton` providers example.
+
+Current example works only fot Python 3.5+.
+"""
+
+import asyncio
+
+import dependency_injector.providers as providers
+
+
+class ConnectionPool(object):
+    """Example class."""
+
+    def __init__(self, dsn):
+        """Initialize instance."""
+        self.dsn = dsn
+
+
+async def create_connection_pool(dsn):
+    """Sample coroutine function."""
+    await asyncio.sleep(0.1)
+    return ConnectionPool(dsn)
+
+
+connection_pool = providers.AsyncSingleton(create_connection_pool,
+                                           dsn='postgresql://localhost/db')
+
+
+async def main():
+    """Run example."""
+    pool1, pool2 = await asyncio.gather(connection_pool(), connection_pool())
+    assert pool1 is pool2
+
+    connection_pool.reset()
+
+    pool3 = await connection_pool()
+    assert pool3 is not pool1
+
+
+if __name__ == '__main__':
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(main())
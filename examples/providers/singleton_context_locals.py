@@ -0,0 +1,61 @@
+"""`ContextLocalSingleton` provider and scopes example."""
+
+import asyncio
+
+import dependency_injector.containers as containers
+import dependency_injector.providers as providers
+
+
+class Session(object):
+    """Example database session."""
+
+    def __init__(self):
+        """Initialize instance."""
+        self.closed = False
+
+    async def close(self):
+        """Close session."""
+        await asyncio.sleep(0)
+        self.closed = True
+
+
+class Container(containers.DeclarativeContainer):
+    """Example container."""
+
+    session = providers.ContextLocalSingleton(Session).set_teardown(
+        Session.close,
+    )
+
+
+async def handler(container):
+    """Handle part of request, session of the request is injected."""
+    await asyncio.sleep(0)
+    return container.session()
+
+
+async def request(container):
+    """Handle request, every request has its own session."""
+    async with container.scope():
+        return await asyncio.gather(handler(container), handler(container))
+
+
+async def main():
+    """Handle two requests concurrently."""
+    container = Container()
+
+    (session1, session2), (session3, session4) = await asyncio.gather(
+        request(container),
+        request(container),
+    )
+
+    # Handlers of the same request share the session:
+    assert session1 is session2
+    assert session3 is session4
+
+    # Every request has its own session, that is closed with the scope:
+    assert session1 is not session3
+    assert session1.closed and session3.closed
+
+
+if __name__ == '__main__':
+    asyncio.get_event_loop().run_until_complete(main())
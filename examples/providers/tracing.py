@@ -0,0 +1,44 @@
+"""Providers tracing example."""
+
+import dependency_injector.containers as containers
+import dependency_injector.providers as providers
+
+
+class Database(object):
+    """Example class."""
+
+
+class Cache(object):
+    """Example class."""
+
+
+class Service(object):
+    """Example class."""
+
+    def __init__(self, database, cache):
+        """Initialize instance."""
+        self.database = database
+        self.cache = cache
+
+
+container = containers.DynamicContainer()
+container.database = providers.Singleton(Database)
+container.cache = providers.Factory(Cache)
+container.service = providers.Factory(Service,
+                                      container.database,
+                                      cache=container.cache)
+
+exporter = providers.InMemoryExporter()
+providers.add_tracer(exporter)
+
+container.service()
+
+providers.remove_tracer(exporter)
+
+root, = exporter.spans
+assert root.name == 'Factory(Service)'
+assert [span.frame for span in root.children] == ['0=Singleton(Database)',
+                                                  'cache=Factory(Cache)']
+
+# Collapsed stacks could be rendered to flame graph with flamegraph.pl:
+print(providers.render_collapsed_stacks(exporter.spans))
@@ -10,6 +10,12 @@ Powered by Cython.
 
 
 # Utils
+cpdef object _compile_providers_template(dict providers)
+
+
+cpdef list _get_singletons_levels(dict providers, bint include_async)
+
+
 cpdef bint is_container(object instance)
 
 
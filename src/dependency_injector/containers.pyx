@@ -3,13 +3,35 @@
 Powered by Cython.
 """
 
+import os
+import threading
+
 import six
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+try:
+    import concurrent.futures as futures
+except ImportError:
+    futures = None
+
 from .errors import Error
 
 from .providers cimport (
     Provider,
+    BaseSingleton,
+    ThreadLocalSingleton,
+    ContextLocalSingleton,
+    AsyncSingleton,
+    AbstractSingleton,
+    Selector,
+    Scope,
     deepcopy,
+    _compile_providers_copiers,
+    _copy_providers_table,
 )
 
 
@@ -23,12 +45,6 @@ class DynamicContainer(object):
         services.users = providers.Factory(UsersService,
                                            auth_service=services.auth)
 
-    .. py:attribute:: providers
-
-        Read-only dictionary of all providers.
-
-        :type: dict[str, :py:class:`dependency_injector.providers.Provider`]
-
     .. py:attribute:: overridden
 
         Tuple of overriding containers.
@@ -50,7 +66,10 @@ class DynamicContainer(object):
         :rtype: None
         """
         self.provider_type = Provider
-        self.providers = dict()
+        self._providers = dict()
+        self._lazy_providers = None
+        self._lazy_memo = None
+        self._lazy_lock = None
         self.overridden = tuple()
         super(DynamicContainer, self).__init__()
 
@@ -69,6 +88,22 @@ class DynamicContainer(object):
 
         return copied
 
+    def __getattr__(self, str name):
+        """Return provider that is not copied yet.
+
+        :param name: Attribute's name
+        :type name: str
+
+        :rtype: :py:class:`dependency_injector.providers.Provider`
+        """
+        lazy_providers = self.__dict__.get('_lazy_providers')
+        if lazy_providers and name in lazy_providers:
+            return self._copy_lazy_provider(name)
+        raise AttributeError(
+            '\'{cls}\' object has no attribute '
+            '\'{attribute_name}\''.format(cls=self.__class__.__name__,
+                                          attribute_name=name))
+
     def __setattr__(self, str name, object value):
         """Set instance attribute.
 
@@ -85,7 +120,9 @@ class DynamicContainer(object):
         """
         if isinstance(value, Provider):
             _check_provider_type(self, value)
-            self.providers[name] = value
+            self._providers[name] = value
+            if self._lazy_providers:
+                self._lazy_providers.pop(name, None)
         super(DynamicContainer, self).__setattr__(name, value)
 
     def __delattr__(self, str name):
@@ -99,10 +136,26 @@ class DynamicContainer(object):
 
         :rtype: None
         """
-        if name in self.providers:
-            del self.providers[name]
+        if self._lazy_providers and name in self._lazy_providers:
+            del self._lazy_providers[name]
+            return
+        if name in self._providers:
+            del self._providers[name]
         super(DynamicContainer, self).__delattr__(name)
 
+    @property
+    def providers(self):
+        """Read-only dictionary of all providers.
+
+        Providers that are not copied yet are copied on access.
+
+        :rtype: dict[str, :py:class:`dependency_injector.providers.Provider`]
+        """
+        if self._lazy_providers:
+            for name in tuple(self._lazy_providers):
+                self._copy_lazy_provider(name)
+        return self._providers
+
     def set_providers(self, **providers):
         """Set container providers.
 
@@ -115,6 +168,49 @@ class DynamicContainer(object):
         for name, provider in six.iteritems(providers):
             setattr(self, name, provider)
 
+    def _set_lazy_providers(self, dict providers):
+        """Set container providers that are copied on first access.
+
+        Every provider is copied with its dependencies when it is accessed
+        first time. Copies share memo dictionary, so providers that depend on
+        the same provider get the same copy of it.
+
+        :param providers: Dictionary of providers
+        :type providers:
+            dict[str, :py:class:`dependency_injector.providers.Provider`]
+
+        :rtype: None
+        """
+        for provider in six.itervalues(providers):
+            _check_provider_type(self, provider)
+        self._lazy_providers = dict(providers)
+        self._lazy_memo = dict()
+        self._lazy_lock = threading.RLock()
+
+    def _set_copied_providers(self, dict providers):
+        """Set copies of providers, that are already checked.
+
+        Providers are set all at once without checking their types.
+
+        :param providers: Dictionary of providers
+        :type providers:
+            dict[str, :py:class:`dependency_injector.providers.Provider`]
+
+        :rtype: None
+        """
+        self._providers.update(providers)
+        self.__dict__.update(providers)
+
+    def _copy_lazy_provider(self, str name):
+        """Copy provider that is not copied yet and set it to container."""
+        with self._lazy_lock:
+            provider = self._providers.get(name)
+            if provider is not None:
+                return provider
+            provider = deepcopy(self._lazy_providers[name], self._lazy_memo)
+            setattr(self, name, provider)
+            return provider
+
     def override(self, object overriding):
         """Override current container by overriding container.
 
@@ -174,6 +270,309 @@ class DynamicContainer(object):
         for provider in six.itervalues(self.providers):
             provider.reset_override()
 
+    def stats(self):
+        """Return statistics of container providers calls.
+
+        Statistics are collected only while instrumentation is enabled, see
+        :py:func:`dependency_injector.providers.enable_instrumentation`.
+        Providers that have not been called are skipped.
+
+        :rtype: dict[str, dict]
+        """
+        stats = dict()
+        for name, provider in six.iteritems(self.providers):
+            call_stats = provider.call_stats
+            if call_stats is not None:
+                stats[name] = call_stats.to_dict()
+        return stats
+
+    def scope(self):
+        """Return new scope of container context-local singletons.
+
+        .. code-block:: python
+
+            async with container.scope():
+                session = container.session()
+
+        Instances of :py:class:`dependency_injector.providers.ContextLocalSingleton`
+        providers of the container and providers, that they depend on, are
+        cached in the scope and torn down, when it is closed. Context-local
+        singletons of other containers are not affected by the scope.
+
+        :rtype: :py:class:`dependency_injector.providers.Scope`
+        """
+        return Scope(_get_context_local_singletons(self.providers))
+
+    def init_singletons(self, executor=None, max_workers=None):
+        """Create instances of singleton providers concurrently.
+
+        Singletons are grouped into levels by their dependencies: every
+        singleton depends only on singletons from previous levels. Singletons
+        of the same level are created concurrently, level after level.
+
+        Thread-local, context-local and asynchronous singletons are skipped.
+
+        :param executor: Executor that creates instances. If it is not
+                         defined, thread pool executor is created and shut
+                         down after initialization.
+        :type executor: :py:class:`concurrent.futures.Executor`
+
+        :param max_workers: Maximum number of workers of created thread pool
+                            executor. Default number of workers of
+                            :py:class:`concurrent.futures.ThreadPoolExecutor`
+                            is used, if it is not defined.
+        :type max_workers: int
+
+        :rtype: None
+        """
+        levels = _get_singletons_levels(self.providers, False)
+        if not levels:
+            return
+
+        shutdown = False
+        if executor is None:
+            if futures is None:
+                raise Error('Package concurrent.futures is not available')
+            executor = futures.ThreadPoolExecutor(
+                max_workers=max_workers or _get_default_max_workers(levels),
+            )
+            shutdown = True
+
+        try:
+            for level in levels:
+                level_futures = [executor.submit(provider)
+                                 for provider in level]
+                futures.wait(level_futures)
+                for future in level_futures:
+                    future.result()
+        finally:
+            if shutdown:
+                executor.shutdown()
+
+    async def async_init_singletons(self, executor=None):
+        """Create instances of singleton providers concurrently.
+
+        Works as :py:meth:`init_singletons`, but in asyncio event loop.
+        Asynchronous singletons are awaited, other singletons are created in
+        the executor.
+
+        :param executor: Executor that creates instances of synchronous
+                         singletons. Default executor of event loop is used,
+                         if it is not defined.
+        :type executor: :py:class:`concurrent.futures.Executor`
+
+        :rtype: None
+        """
+        loop = asyncio.get_event_loop()
+
+        for level in _get_singletons_levels(self.providers, True):
+            await asyncio.gather(*[
+                provider()
+                if isinstance(provider, AsyncSingleton) else
+                loop.run_in_executor(executor, provider)
+                for provider in level
+            ])
+
+
+class ProvidersTemplate(object):
+    """Precompiled template of the providers graph.
+
+    Template keeps flat table of all providers that are reachable from
+    container providers. Table is ordered so that every provider goes after
+    the providers it depends on. Container providers refer to the table by
+    index.
+
+    Copying of the providers is done with a single pass over the table.
+    Copiers of the table refer to provider dependencies by their indexes, so
+    ``Callable``, ``Factory``, ``Singleton`` and ``List`` providers are
+    copied with injections, that take already created copies from the list
+    of copies. Other providers are copied with
+    :py:func:`dependency_injector.providers.deepcopy`.
+
+    .. py:attribute:: table
+
+        Tuple of providers ordered by dependencies.
+
+        :type: tuple[:py:class:`dependency_injector.providers.Provider`]
+
+    .. py:attribute:: indexes
+
+        Dictionary of container providers indexes in the table.
+
+        :type: dict[str, int]
+
+    .. py:attribute:: copiers
+
+        Tuple of compiled copiers of the table providers.
+
+        :type: tuple[object]
+    """
+
+    def __init__(self, tuple table, dict indexes):
+        """Initializer.
+
+        :rtype: None
+        """
+        self.table = table
+        self.indexes = indexes
+        self.copiers = _compile_providers_copiers(table)
+        super(ProvidersTemplate, self).__init__()
+
+    def copy_providers(self):
+        """Return dictionary of container providers copies.
+
+        :rtype: dict[str, :py:class:`dependency_injector.providers.Provider`]
+        """
+        cdef list copies = _copy_providers_table(self.table, self.copiers)
+
+        providers = dict()
+        for name, index in six.iteritems(self.indexes):
+            providers[name] = copies[index]
+        return providers
+
+
+cpdef object _compile_providers_template(dict providers):
+    """Compile template of the providers graph.
+
+    :param providers: Dictionary of providers
+    :type providers:
+        dict[str, :py:class:`dependency_injector.providers.Provider`]
+
+    :rtype: :py:class:`ProvidersTemplate`
+    """
+    cdef list table = list()
+    cdef dict indexes = dict()
+    cdef dict names_indexes = dict()
+    cdef set visited = set()
+    cdef list stack
+
+    for root in six.itervalues(providers):
+        if id(root) in visited:
+            continue
+        visited.add(id(root))
+
+        stack = [(root, iter(getattr(root, 'related', tuple())))]
+        while stack:
+            provider, related = stack[-1]
+            for dependency in related:
+                if id(dependency) not in visited:
+                    visited.add(id(dependency))
+                    stack.append(
+                        (dependency, iter(getattr(dependency, 'related', tuple()))),
+                    )
+                    break
+            else:
+                stack.pop()
+                indexes[id(provider)] = len(table)
+                table.append(provider)
+
+    for name, provider in six.iteritems(providers):
+        names_indexes[name] = indexes[id(provider)]
+
+    return ProvidersTemplate(tuple(table), names_indexes)
+
+
+cpdef list _get_singletons_levels(dict providers, bint include_async):
+    """Return singleton providers grouped by dependency levels.
+
+    Singleton of every level depends only on singletons of previous levels.
+    Branches of :py:class:`dependency_injector.providers.Selector` providers
+    are not traversed, because only one of them is selected on call.
+
+    :param providers: Dictionary of providers
+    :type providers:
+        dict[str, :py:class:`dependency_injector.providers.Provider`]
+
+    :param include_async: Include asynchronous singletons.
+    :type include_async: bool
+
+    :rtype: list[list[:py:class:`dependency_injector.providers.Provider`]]
+    """
+    cdef dict depths = dict()
+    cdef list levels = list()
+    cdef list stack
+    cdef int depth
+
+    for root in six.itervalues(providers):
+        if id(root) in depths:
+            continue
+        depths[id(root)] = 0
+
+        stack = [(root, iter(_get_singleton_dependencies(root)))]
+        while stack:
+            provider, related = stack[-1]
+            for dependency in related:
+                if id(dependency) not in depths:
+                    depths[id(dependency)] = 0
+                    stack.append(
+                        (dependency, iter(_get_singleton_dependencies(dependency))),
+                    )
+                    break
+            else:
+                stack.pop()
+                depth = 0
+                for dependency in _get_singleton_dependencies(provider):
+                    depth = max(depth,
+                                depths[id(dependency)] +
+                                _is_initializable_singleton(dependency,
+                                                            include_async))
+                depths[id(provider)] = depth
+
+                if _is_initializable_singleton(provider, include_async):
+                    while len(levels) <= depth:
+                        levels.append(list())
+                    levels[depth].append(provider)
+
+    return [level for level in levels if level]
+
+
+cdef tuple _get_singleton_dependencies(object provider):
+    """Return providers, that are called by provider unconditionally."""
+    if isinstance(provider, Selector):
+        return tuple()
+    return tuple(getattr(provider, 'related', tuple()))
+
+
+cdef int _get_default_max_workers(list levels):
+    """Return number of workers for initialization of singletons levels.
+
+    It is the default of :py:class:`concurrent.futures.ThreadPoolExecutor`
+    on Python 3.8+, but not more than the widest level needs.
+    """
+    cpu_count = getattr(os, 'cpu_count', None)
+    cpus = cpu_count() if cpu_count is not None else None
+    return min(32, (cpus or 1) + 4, max(len(level) for level in levels))
+
+
+cdef frozenset _get_context_local_singletons(dict providers):
+    """Return context-local singletons of providers and their dependencies."""
+    cdef set visited = set()
+    cdef list singletons = list()
+    cdef list stack = list(six.itervalues(providers))
+
+    while stack:
+        provider = stack.pop()
+        if id(provider) in visited:
+            continue
+        visited.add(id(provider))
+        if isinstance(provider, ContextLocalSingleton):
+            singletons.append(provider)
+        stack.extend(getattr(provider, 'related', tuple()))
+
+    return frozenset(singletons)
+
+
+cdef bint _is_initializable_singleton(object provider, bint include_async):
+    if not isinstance(provider, BaseSingleton):
+        return False
+    if isinstance(provider, (ThreadLocalSingleton, ContextLocalSingleton)):
+        return False
+    if isinstance(provider, AsyncSingleton):
+        return include_async
+    if isinstance(provider, AbstractSingleton):
+        return provider.last_overriding is not None
+    return True
+
 
 class DeclarativeContainerMetaClass(type):
     """Declarative inversion of control container meta class."""
@@ -209,6 +608,8 @@ class DeclarativeContainerMetaClass(type):
         for provider in six.itervalues(cls.providers):
             _check_provider_type(cls, provider)
 
+        cls.providers_template = _compile_providers_template(cls.providers)
+
         return cls
 
     def __setattr__(cls, str name, object value):
@@ -229,6 +630,7 @@ class DeclarativeContainerMetaClass(type):
             _check_provider_type(cls, value)
             cls.providers[name] = value
             cls.cls_providers[name] = value
+            cls.providers_template = None
         super(DeclarativeContainerMetaClass, cls).__setattr__(name, value)
 
     def __delattr__(cls, str name):
@@ -245,6 +647,7 @@ class DeclarativeContainerMetaClass(type):
         if name in cls.providers and name in cls.cls_providers:
             del cls.providers[name]
             del cls.cls_providers[name]
+            cls.providers_template = None
         super(DeclarativeContainerMetaClass, cls).__delattr__(name)
 
 
@@ -305,6 +708,22 @@ class DeclarativeContainer(object):
     :type: tuple[:py:class:`DeclarativeContainer`]
     """
 
+    providers_template = None
+    """Providers template that is used for instantiating container.
+
+    Template is compiled when container class is created and is recompiled
+    after providers are added or deleted.
+
+    :type: :py:class:`ProvidersTemplate`
+    """
+
+    lazy_instantiation = False
+    """Copy providers on first access instead of copying all of them on
+    instantiating declarative container.
+
+    :type: bool
+    """
+
     def __new__(cls, **overriding_providers):
         """Constructor.
 
@@ -313,7 +732,16 @@ class DeclarativeContainer(object):
         """
         container = cls.instance_type()
         container.provider_type = cls.provider_type
-        container.set_providers(**deepcopy(cls.providers))
+        if cls.lazy_instantiation:
+            container._set_lazy_providers(cls.providers)
+        else:
+            if cls.providers_template is None:
+                cls.providers_template = _compile_providers_template(cls.providers)
+            providers = cls.providers_template.copy_providers()
+            if type(container).__setattr__ is DynamicContainer.__setattr__:
+                container._set_copied_providers(providers)
+            else:
+                container.set_providers(**providers)
         container.override_providers(**overriding_providers)
         return container
 
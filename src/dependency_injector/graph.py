@@ -0,0 +1,439 @@
+"""Dependency injector providers graph."""
+
+import collections
+import json
+
+import six
+
+from . import providers
+from .errors import Error
+
+
+Edge = collections.namedtuple('Edge', ('source', 'target', 'kind', 'name'))
+"""Edge of providers graph.
+
+Source provider depends on target provider. Kind describes how target is
+related to the source: ``arg``, ``kwarg``, ``attribute``, ``provides``,
+``provider``, ``factory``, ``override`` or ``related``. Name is an index of
+positional argument or a name of keyword argument, attribute, provider or
+factory; it is ``None`` for other kinds.
+"""
+
+
+class Graph(object):
+    """Dependency graph of providers.
+
+    .. code-block:: python
+
+        graph = build_graph(container)
+
+        for provider in graph.topological_order():
+            print(graph.get_name(provider))
+
+    .. py:attribute:: nodes
+
+        Tuple of graph providers.
+
+        :type: tuple[:py:class:`dependency_injector.providers.Provider`]
+
+    .. py:attribute:: edges
+
+        Tuple of graph edges.
+
+        :type: tuple[:py:class:`Edge`]
+    """
+
+    def __init__(self, nodes, edges, names=None):
+        """Initialize graph.
+
+        :param nodes: Graph providers.
+        :type nodes: tuple[:py:class:`dependency_injector.providers.Provider`]
+
+        :param edges: Graph edges.
+        :type edges: tuple[:py:class:`Edge`]
+
+        :param names: Dictionary of providers names.
+        :type names:
+            dict[str, :py:class:`dependency_injector.providers.Provider`]
+        """
+        self.nodes = tuple(nodes)
+        self.edges = tuple(edges)
+        self._indexes = dict((id(node), index)
+                             for index, node in enumerate(self.nodes))
+        self._names = dict()
+        for name, provider in sorted(six.iteritems(names or dict())):
+            self._names.setdefault(id(provider), name)
+        self._dependencies = collections.defaultdict(collections.OrderedDict)
+        self._dependents = collections.defaultdict(collections.OrderedDict)
+        for edge in self.edges:
+            self._dependencies[id(edge.source)][id(edge.target)] = edge.target
+            self._dependents[id(edge.target)][id(edge.source)] = edge.source
+        super(Graph, self).__init__()
+
+    def __len__(self):
+        """Return number of providers in graph."""
+        return len(self.nodes)
+
+    def __contains__(self, provider):
+        """Check if provider is in graph."""
+        return id(provider) in self._indexes
+
+    def get_name(self, provider):
+        """Return name of provider in container.
+
+        :rtype: str | None
+        """
+        return self._names.get(id(provider))
+
+    def dependencies(self, provider):
+        """Return providers that provider depends on.
+
+        :rtype: tuple[:py:class:`dependency_injector.providers.Provider`]
+        """
+        dependencies = self._dependencies.get(id(provider))
+        if dependencies is None:
+            return tuple()
+        return tuple(dependencies.values())
+
+    def dependents(self, provider):
+        """Return providers that depend on provider.
+
+        :rtype: tuple[:py:class:`dependency_injector.providers.Provider`]
+        """
+        dependents = self._dependents.get(id(provider))
+        if dependents is None:
+            return tuple()
+        return tuple(dependents.values())
+
+    def fan_in(self, provider):
+        """Return number of providers that depend on provider.
+
+        :rtype: int
+        """
+        return len(self._dependents.get(id(provider), ()))
+
+    def fan_out(self, provider):
+        """Return number of providers that provider depends on.
+
+        :rtype: int
+        """
+        return len(self._dependencies.get(id(provider), ()))
+
+    def stats(self):
+        """Return fan-in and fan-out of providers.
+
+        Providers are sorted by fan-in, most shared providers go first.
+
+        :rtype: list[dict]
+        """
+        stats = [
+            {
+                'id': self._get_node_id(node),
+                'name': self.get_name(node),
+                'type': _get_type_name(node),
+                'fan_in': self.fan_in(node),
+                'fan_out': self.fan_out(node),
+            }
+            for node in self.nodes
+        ]
+        stats.sort(key=lambda node_stats: (-node_stats['fan_in'],
+                                           -node_stats['fan_out']))
+        return stats
+
+    def topological_order(self):
+        """Return providers ordered by dependencies.
+
+        Every provider goes after all providers that it depends on.
+
+        :raise: :py:exc:`dependency_injector.errors.Error` if graph has
+                cycles.
+
+        :rtype: tuple[:py:class:`dependency_injector.providers.Provider`]
+        """
+        order = list()
+        counts = dict((id(node), self.fan_out(node)) for node in self.nodes)
+        ready = collections.deque(node for node in self.nodes
+                                  if counts[id(node)] == 0)
+
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for dependent in self.dependents(node):
+                counts[id(dependent)] -= 1
+                if counts[id(dependent)] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.nodes):
+            cycle = self.find_cycles()[0]
+            raise Error('Providers graph has cycle: {0}'.format(
+                ' -> '.join(self._represent(node)
+                            for node in cycle + cycle[:1])))
+
+        return tuple(order)
+
+    def find_cycles(self):
+        """Return cycles of the graph.
+
+        Every cycle is a tuple of providers that depend on each other.
+
+        :rtype: tuple[tuple[:py:class:`dependency_injector.providers.Provider`]]
+        """
+        return _CyclesFinder(self).find()
+
+    def to_dict(self):
+        """Return dictionary representation of the graph.
+
+        :rtype: dict
+        """
+        return {
+            'nodes': [
+                {
+                    'id': self._get_node_id(node),
+                    'name': self.get_name(node),
+                    'type': _get_type_name(node),
+                }
+                for node in self.nodes
+            ],
+            'edges': [
+                {
+                    'source': self._get_node_id(edge.source),
+                    'target': self._get_node_id(edge.target),
+                    'kind': edge.kind,
+                    'name': edge.name,
+                }
+                for edge in self.edges
+            ],
+        }
+
+    def to_json(self, **kwargs):
+        """Return JSON representation of the graph.
+
+        :param kwargs: Keyword arguments of :py:func:`json.dumps`.
+
+        :rtype: str
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_dot(self, name='providers'):
+        """Return representation of the graph in DOT language.
+
+        :param name: Name of the graph.
+        :type name: str
+
+        :rtype: str
+        """
+        lines = ['digraph {0} {{'.format(_quote(name))]
+        for node in self.nodes:
+            lines.append('    {0} [label={1}];'.format(
+                self._get_node_id(node),
+                _quote(self._represent(node)),
+            ))
+        for edge in self.edges:
+            label = edge.kind
+            if edge.name is not None:
+                label = '{0} {1}'.format(edge.kind, edge.name)
+            lines.append('    {0} -> {1} [label={2}];'.format(
+                self._get_node_id(edge.source),
+                self._get_node_id(edge.target),
+                _quote(label),
+            ))
+        lines.append('}')
+        return '\n'.join(lines) + '\n'
+
+    def _get_node_id(self, node):
+        return 'n{0}'.format(self._indexes[id(node)])
+
+    def _represent(self, node):
+        name = self.get_name(node)
+        if name is None:
+            return _get_type_name(node)
+        return '{0} ({1})'.format(name, _get_type_name(node))
+
+
+class _CyclesFinder(object):
+    """Finder of graph cycles.
+
+    It is an iterative version of Tarjan's strongly connected components
+    algorithm.
+    """
+
+    def __init__(self, graph):
+        """Initialize finder."""
+        self.graph = graph
+        self.indexes = dict()
+        self.lowlinks = dict()
+        self.stack = list()
+        self.on_stack = set()
+        self.cycles = list()
+
+    def find(self):
+        """Return cycles of the graph."""
+        for root in self.graph.nodes:
+            if id(root) not in self.indexes:
+                self._visit(root)
+        return tuple(self.cycles)
+
+    def _visit(self, root):
+        work = [self._push(root)]
+
+        while work:
+            node, dependencies = work[-1]
+            dependency = self._get_next_unvisited(node, dependencies)
+            if dependency is not None:
+                work.append(self._push(dependency))
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                self.lowlinks[id(parent)] = min(self.lowlinks[id(parent)],
+                                                self.lowlinks[id(node)])
+            if self.lowlinks[id(node)] == self.indexes[id(node)]:
+                self._pop_component(node)
+
+    def _push(self, node):
+        self.indexes[id(node)] = self.lowlinks[id(node)] = len(self.indexes)
+        self.stack.append(node)
+        self.on_stack.add(id(node))
+        return node, iter(self.graph.dependencies(node))
+
+    def _get_next_unvisited(self, node, dependencies):
+        for dependency in dependencies:
+            if id(dependency) not in self.indexes:
+                return dependency
+            elif id(dependency) in self.on_stack:
+                self.lowlinks[id(node)] = min(self.lowlinks[id(node)],
+                                              self.indexes[id(dependency)])
+        return None
+
+    def _pop_component(self, node):
+        component = list()
+        while True:
+            member = self.stack.pop()
+            self.on_stack.discard(id(member))
+            component.append(member)
+            if member is node:
+                break
+
+        is_loop = any(dependency is node
+                      for dependency in self.graph.dependencies(node))
+        if len(component) > 1 or is_loop:
+            component.reverse()
+            self.cycles.append(tuple(component))
+
+
+def build_graph(container):
+    """Build dependency graph of container providers.
+
+    Graph includes container providers and all providers that they depend on:
+    injections, wrapped, aggregated and overriding providers.
+
+    :param container: Container or dictionary of providers.
+    :type container: :py:class:`dependency_injector.containers.DynamicContainer`
+        | dict[str, :py:class:`dependency_injector.providers.Provider`]
+
+    :rtype: :py:class:`Graph`
+    """
+    if isinstance(container, dict):
+        names = container
+    else:
+        names = container.providers
+
+    nodes = list()
+    edges = list()
+    visited = set()
+    queue = collections.deque()
+
+    for provider in six.itervalues(names):
+        if id(provider) not in visited:
+            visited.add(id(provider))
+            queue.append(provider)
+
+    while queue:
+        provider = queue.popleft()
+        nodes.append(provider)
+        for kind, name, dependency in _get_dependencies(provider):
+            edges.append(Edge(provider, dependency, kind, name))
+            if id(dependency) not in visited:
+                visited.add(id(dependency))
+                queue.append(dependency)
+
+    return Graph(nodes, edges, names)
+
+
+def _get_dependencies(provider):
+    """Return list of (kind, name, dependency) of provider."""
+    dependencies = _get_own_dependencies(provider)
+
+    for overriding in provider.overridden:
+        dependencies.append(('override', None, overriding))
+
+    known = set(id(dependency) for _, _, dependency in dependencies)
+    for dependency in provider.related:
+        if id(dependency) not in known:
+            known.add(id(dependency))
+            dependencies.append(('related', None, dependency))
+
+    return dependencies
+
+
+def _get_own_dependencies(provider):
+    """Return list of dependencies, that depend on kind of provider."""
+    if isinstance(provider, (providers.Callable,
+                             providers.Factory,
+                             providers.BaseSingleton,
+                             providers.Pool)):
+        return _get_injections_dependencies(provider)
+    elif isinstance(provider, providers.List):
+        return _get_args_dependencies(provider.args)
+    elif isinstance(provider, (providers.Selector,
+                               providers.DependenciesContainer)):
+        return _get_named_dependencies('provider', provider.providers)
+    elif isinstance(provider, providers.FactoryAggregate):
+        return _get_named_dependencies('factory', provider.factories)
+    elif isinstance(provider, providers.Delegate):
+        return [('provides', None, provider.provides)]
+    return list()
+
+
+def _get_injections_dependencies(provider):
+    """Return list of provided type and injections dependencies."""
+    dependencies = list()
+
+    if isinstance(provider, providers.Callable):
+        provides = provider.provides
+    else:
+        provides = provider.cls
+    if isinstance(provides, providers.Provider):
+        dependencies.append(('provides', None, provides))
+
+    dependencies.extend(_get_args_dependencies(provider.args))
+    dependencies.extend(_get_named_dependencies('kwarg', provider.kwargs))
+    if not isinstance(provider, providers.Callable):
+        dependencies.extend(
+            _get_named_dependencies('attribute', provider.attributes),
+        )
+
+    return dependencies
+
+
+def _get_args_dependencies(args):
+    return [('arg', index, value)
+            for index, value in enumerate(args)
+            if isinstance(value, providers.Provider)]
+
+
+def _get_named_dependencies(kind, values):
+    return [(kind, name, value)
+            for name, value in sorted(six.iteritems(values))
+            if isinstance(value, providers.Provider)]
+
+
+def _get_type_name(provider):
+    return '.'.join((provider.__class__.__module__,
+                     provider.__class__.__name__))
+
+
+def _quote(value):
+    return '"{0}"'.format(str(value).replace('\\', '\\\\')
+                          .replace('"', '\\"'))
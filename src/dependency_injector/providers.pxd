@@ -5,14 +5,28 @@ Powered by Cython.
 
 cimport cython
 
+from cpython.dict cimport PyDict_GetItem, PyDict_Update
+from cpython.object cimport PyObject
+from cpython.object cimport PyObject_Call
+from cpython.ref cimport Py_INCREF
+from cpython.tuple cimport (
+    PyTuple_GET_ITEM,
+    PyTuple_GET_SIZE,
+    PyTuple_New,
+    PyTuple_SET_ITEM,
+)
+
 
 # Base providers
 cdef class Provider(object):
     cdef tuple __overridden
-    cdef Provider __last_overriding
+    cdef object __overriding_lock
+    cdef object __context_overriding
+    cdef object __call_stats
 
     cpdef object _provide(self, tuple args, dict kwargs)
     cpdef void _copy_overridings(self, Provider copied, dict memo)
+    cdef void _set_overridden(self, tuple overridden) except *
 
 
 cdef class Object(Provider):
@@ -46,17 +60,28 @@ cdef class OverridingContext(object):
     cdef Provider __overriding
 
 
+cdef class ContextOverridingContext(object):
+    cdef Provider __overridden
+    cdef Provider __overriding
+    cdef object __token
+
+
 # Callable providers
 cdef class Callable(Provider):
     cdef object __provides
 
     cdef tuple __args
     cdef int __args_len
+    cdef tuple __args_constants
 
     cdef tuple __kwargs
     cdef int __kwargs_len
+    cdef dict __kwargs_template
+    cdef tuple __kwargs_providers
+    cdef int __kwargs_providers_len
 
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef void _compile_injections(self) except *
 
 
 cdef class DelegatedCallable(Callable):
@@ -89,18 +114,60 @@ cdef class CoroutineDelegate(Delegate):
 
 
 # Configuration providers
+cdef class _ConfigurationVersion(object):
+    cdef unsigned long long value
+
+
 cdef class ConfigurationOption(Provider):
     cdef tuple __name
     cdef object __root_ref
+    cdef _ConfigurationVersion __version
     cdef dict __children
+    cdef ConfigurationOption __parent
+    cdef tuple __keys
+    cdef object __selector
+    cdef bint __cacheable
     cdef object __cache
+    cdef unsigned long long __cache_version
+    cdef dict __typed
+
+    cdef object _resolve(self)
+    cdef TypedConfigurationOption _get_typed(self, object converter,
+                                             bint required)
+
+
+cdef class TypedConfigurationOption(Provider):
+    cdef ConfigurationOption __option
+    cdef object __converter
+    cdef bint __required
+    cdef _ConfigurationVersion __version
+    cdef object __source
+    cdef object __cache
+    cdef unsigned long long __cache_version
 
 
 cdef class Configuration(Object):
     cdef str __name
     cdef dict __children
+    cdef _ConfigurationVersion __version
+    cdef list __sources
+    cdef list __subscriptions
+    cdef list __typed_options
+    cdef object __reload_lock
     cdef object __weakref__
 
+    cdef void _add_source(self, str kind, object filepath, object loader,
+                          tuple keys, object stamp, object value) except *
+    cdef void _apply_changes(self, list changes) except *
+
+
+cdef class ConfigurationWatcher(object):
+    cdef Configuration __configuration
+    cdef double __interval
+    cdef object __on_error
+    cdef object __stopped
+    cdef object __thread
+
 
 # Factory providers
 cdef class Factory(Provider):
@@ -110,6 +177,7 @@ cdef class Factory(Provider):
     cdef int __attributes_len
 
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef object _get_batch_overriding(self)
 
 
 cdef class DelegatedFactory(Factory):
@@ -134,11 +202,14 @@ cdef class FactoryAggregate(Provider):
 cdef class BaseSingleton(Provider):
     cdef Factory __instantiator
 
+    cdef void _forget_instance(self, object instance) except *
+
 
 cdef class Singleton(BaseSingleton):
     cdef object __storage
 
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef void _forget_instance(self, object instance) except *
 
 
 cdef class DelegatedSingleton(Singleton):
@@ -150,6 +221,7 @@ cdef class ThreadSafeSingleton(BaseSingleton):
     cdef object __storage_lock
 
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef void _forget_instance(self, object instance) except *
 
 
 cdef class DelegatedThreadSafeSingleton(ThreadSafeSingleton):
@@ -157,15 +229,45 @@ cdef class DelegatedThreadSafeSingleton(ThreadSafeSingleton):
 
 
 cdef class ThreadLocalSingleton(BaseSingleton):
-    cdef object __storage
+    cdef object __slot
 
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef void _forget_instance(self, object instance) except *
 
 
 cdef class DelegatedThreadLocalSingleton(ThreadLocalSingleton):
     pass
 
 
+cdef class ContextLocalSingleton(BaseSingleton):
+    cdef object __storage
+    cdef object __teardown
+
+    cpdef object _provide(self, tuple args, dict kwargs)
+    cdef void _forget_instance(self, object instance) except *
+
+
+cdef class DelegatedContextLocalSingleton(ContextLocalSingleton):
+    pass
+
+
+cdef class Scope(object):
+    cdef dict __instances
+    cdef object __providers
+    cdef Scope __parent
+    cdef object __token
+
+
+cdef class AsyncSingleton(BaseSingleton):
+    cdef object __future
+
+    cpdef object _provide(self, tuple args, dict kwargs)
+
+
+cdef class DelegatedAsyncSingleton(AsyncSingleton):
+    pass
+
+
 cdef class AbstractSingleton(BaseSingleton):
     pass
 
@@ -174,6 +276,49 @@ cdef class SingletonDelegate(Delegate):
     pass
 
 
+# Pool providers
+cdef class Pool(Provider):
+    cdef Factory __instantiator
+
+    cdef int __max_size
+    cdef object __idle_timeout
+    cdef object __acquire_timeout
+    cdef object __health_check
+    cdef object __reset_hook
+
+    cdef object __lock
+    cdef object __condition
+    cdef int __sync_waiters
+    cdef object __idle
+    cdef dict __leased
+    cdef object __async_waiters
+    cdef int __size
+
+    cdef int __hits
+    cdef int __misses
+    cdef int __waits
+    cdef int __evictions
+
+    cpdef object _provide(self, tuple args, dict kwargs)
+    cdef object _acquire_nowait(self)
+    cdef object _create(self, tuple args, dict kwargs)
+    cdef bint _check_health(self, object instance) except -1
+    cdef void _discard_leased(self, object instance) except *
+    cdef void _discard(self) except *
+    cdef void _evict_expired(self, double now) except *
+    cdef object _get_timeout_error(self)
+    cdef void _notify(self) except *
+    cdef void _notify_all(self) except *
+    cdef void _wake_async_waiters(self, int number) except *
+
+
+cdef class PoolContext(object):
+    cdef Pool __pool
+    cdef tuple __args
+    cdef dict __kwargs
+    cdef object __instance
+
+
 # Miscellaneous providers
 
 cdef class List(Provider):
@@ -214,6 +359,46 @@ cdef class NamedInjection(Injection):
     cdef object __name
 
 
+# Instrumentation
+cdef class LatencyHistogram(object):
+    cdef unsigned long long __counts[704]
+    cdef unsigned long long __count
+    cdef unsigned long long __total
+    cdef unsigned long long __min
+    cdef unsigned long long __max
+
+    cdef void record(self, unsigned long long value)
+
+
+cdef class ProviderStats(object):
+    cdef unsigned long long __calls
+    cdef unsigned long long __total_time
+    cdef unsigned long long __self_time
+    cdef LatencyHistogram __histogram
+
+    cdef void record(self, unsigned long long total_time,
+                     unsigned long long self_time)
+
+
+cdef class Span(object):
+    cdef object __provider
+    cdef Span __parent
+    cdef list __children
+    cdef object __injection
+    cdef long long __start
+    cdef long long __end
+    cdef object __error
+
+
+cdef class Tracer(object):
+    pass
+
+
+cdef class InMemoryExporter(Tracer):
+    cdef list __spans
+    cdef object __lock
+
+
 cpdef tuple parse_positional_injections(tuple args)
 
 
@@ -224,6 +409,43 @@ cpdef tuple parse_named_injections(dict kwargs)
 cdef object CLASS_TYPES
 
 
+cdef object ATOMIC_TYPES
+
+
+cdef bint ASYNC_MODE_ENABLED
+
+
+cdef bint CALL_HOOKS_ENABLED
+
+
+cdef bint INSTRUMENTATION_ENABLED
+
+
+cdef bint TRACING_ENABLED
+
+
+cdef object _hooked_call(Provider provider, tuple args, dict kwargs)
+
+
+cdef object _traced_injection_call(Injection injection)
+
+
+cdef bint _has_awaitables(tuple args, dict kwargs, dict attributes) except -1
+
+
+cdef object _resolve_async_call(object provides,
+                                tuple args,
+                                dict kwargs,
+                                dict attributes,
+                                bint await_result)
+
+
+cdef object _async_mode_factory_call(Factory self,
+                                     tuple args,
+                                     dict kwargs,
+                                     bint await_result)
+
+
 cpdef bint is_provider(object instance)
 
 
@@ -239,14 +461,55 @@ cpdef str represent_provider(object provider, object provides)
 cpdef object deepcopy(object instance, dict memo=*)
 
 
+cpdef tuple _compile_providers_copiers(tuple table)
+
+
+cpdef list _copy_providers_table(tuple table, tuple copiers)
+
+
 # Inline helper functions
+cdef inline object __get_overriding(Provider self):
+    cdef object overriding
+
+    if self.__context_overriding is not None:
+        overriding = self.__context_overriding.get(None)
+        if overriding is not None:
+            return overriding
+    return __get_last_overriding(self)
+
+
+cdef inline object __get_last_overriding(Provider self):
+    cdef tuple overridden = self.__overridden
+    cdef Py_ssize_t overridden_len = PyTuple_GET_SIZE(overridden)
+
+    if overridden_len == 0:
+        return None
+    return <object>PyTuple_GET_ITEM(overridden, overridden_len - 1)
+
+
 cdef inline object __get_name(NamedInjection self):
     return self.__name
 
 
+cdef inline object __call_provider(Provider provider):
+    cdef object overriding
+
+    if CALL_HOOKS_ENABLED:
+        return _hooked_call(provider, tuple(), dict())
+
+    overriding = __get_overriding(provider)
+    if overriding is not None:
+        return overriding()
+    return provider._provide(tuple(), dict())
+
+
 cdef inline object __get_value(Injection self):
     if self.__call == 0:
         return self.__value
+    elif TRACING_ENABLED:
+        return _traced_injection_call(self)
+    elif self.__call == 2:
+        return __call_provider(<Provider>self.__value)
     return self.__value()
 
 
@@ -256,19 +519,27 @@ cdef inline tuple __provide_positional_args(tuple args,
                                             tuple inj_args,
                                             int inj_args_len):
     cdef int index
-    cdef list positional_args
-    cdef PositionalInjection injection
+    cdef int args_len
+    cdef tuple positional_args
+    cdef object value
 
     if inj_args_len == 0:
         return args
 
-    positional_args = list()
+    args_len = len(args)
+    positional_args = PyTuple_New(inj_args_len + args_len)
+
     for index in range(inj_args_len):
-        injection = <PositionalInjection>inj_args[index]
-        positional_args.append(__get_value(injection))
-    positional_args.extend(args)
+        value = __get_value(<PositionalInjection>inj_args[index])
+        Py_INCREF(value)
+        PyTuple_SET_ITEM(positional_args, index, value)
+
+    for index in range(args_len):
+        value = args[index]
+        Py_INCREF(value)
+        PyTuple_SET_ITEM(positional_args, inj_args_len + index, value)
 
-    return tuple(positional_args)
+    return positional_args
 
 
 @cython.boundscheck(False)
@@ -295,6 +566,24 @@ cdef inline dict __provide_keyword_args(dict kwargs,
     return kwargs
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline dict __provide_templated_keyword_args(dict kwargs,
+                                                  dict template,
+                                                  tuple inj_kwargs,
+                                                  int inj_kwargs_len):
+    cdef int index
+    cdef NamedInjection kw_injection
+
+    PyDict_Update(kwargs, template)
+
+    for index in range(inj_kwargs_len):
+        kw_injection = <NamedInjection>inj_kwargs[index]
+        kwargs[__get_name(kw_injection)] = __get_value(kw_injection)
+
+    return kwargs
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef inline object __inject_attributes(object instance,
@@ -312,19 +601,42 @@ cdef inline object __callable_call(Callable self, tuple args, dict kwargs):
     cdef tuple positional_args
     cdef dict keyword_args
 
-    positional_args = __provide_positional_args(args,
-                                                self.__args,
-                                                self.__args_len)
-    keyword_args = __provide_keyword_args(kwargs,
-                                          self.__kwargs,
-                                          self.__kwargs_len)
+    if self.__args_constants is not None:
+        positional_args = self.__args_constants + args
+    else:
+        positional_args = __provide_positional_args(args,
+                                                    self.__args,
+                                                    self.__args_len)
+
+    if self.__kwargs_template is not None and len(kwargs) == 0:
+        keyword_args = __provide_templated_keyword_args(
+            kwargs,
+            self.__kwargs_template,
+            self.__kwargs_providers,
+            self.__kwargs_providers_len,
+        )
+    else:
+        keyword_args = __provide_keyword_args(kwargs,
+                                              self.__kwargs,
+                                              self.__kwargs_len)
+
+    if (ASYNC_MODE_ENABLED and
+            _has_awaitables(positional_args, keyword_args, None)):
+        return _resolve_async_call(self.__provides,
+                                   positional_args,
+                                   keyword_args,
+                                   None,
+                                   isinstance(self, Coroutine))
 
-    return self.__provides(*positional_args, **keyword_args)
+    return PyObject_Call(self.__provides, positional_args, keyword_args)
 
 
 cdef inline object __factory_call(Factory self, tuple args, dict kwargs):
     cdef object instance
 
+    if ASYNC_MODE_ENABLED:
+        return _async_mode_factory_call(self, args, kwargs, False)
+
     instance = __callable_call(self.__instantiator, args, kwargs)
 
     if self.__attributes_len > 0:
@@ -3,12 +3,20 @@
 Powered by Cython.
 """
 
+import collections
 import copy
+import functools
+import hashlib
+import itertools
+import json
 import os
+import pickle
 import re
 import sys
+import tempfile
 import types
 import threading
+import time
 import weakref
 
 try:
@@ -23,6 +31,11 @@ else:
     else:
         _is_coroutine_marker = True
 
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
 try:
     import ConfigParser as iniconfigparser
 except ImportError:
@@ -39,18 +52,86 @@ from .errors import (
 )
 
 cimport cython
+from cpython.object cimport PyObject
+
+
+cdef extern from "Python.h":
+    PyObject* PyThreadState_GetDict()
+
+
+cdef extern from *:
+    """
+    #if defined(_WIN32)
+    #include <windows.h>
+    static PY_LONG_LONG __pyx_di_monotonic_ns(void) {
+        LARGE_INTEGER frequency, counter;
+        QueryPerformanceFrequency(&frequency);
+        QueryPerformanceCounter(&counter);
+        return (PY_LONG_LONG)((double)counter.QuadPart * 1e9 /
+                              (double)frequency.QuadPart);
+    }
+    #else
+    #include <time.h>
+    static PY_LONG_LONG __pyx_di_monotonic_ns(void) {
+        struct timespec ts;
+        clock_gettime(CLOCK_MONOTONIC, &ts);
+        return (PY_LONG_LONG)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+    }
+    #endif
+    """
+    long long _monotonic_ns "__pyx_di_monotonic_ns" () nogil
 
 
 if sys.version_info[0] == 3:  # pragma: no cover
     CLASS_TYPES = (type,)
+    ATOMIC_TYPES = frozenset((type(None), bool, int, float, complex, str,
+                              bytes, type, types.FunctionType,
+                              types.BuiltinFunctionType))
 else:  # pragma: no cover
     CLASS_TYPES = (type, types.ClassType)
+    ATOMIC_TYPES = frozenset((type(None), bool, int, long, float, complex,
+                              str, unicode, type, types.ClassType,
+                              types.FunctionType, types.BuiltinFunctionType))
 
     copy._deepcopy_dispatch[types.MethodType] = \
         lambda obj, memo: type(obj)(obj.im_func,
                                     copy.deepcopy(obj.im_self, memo),
                                     obj.im_class)
 
+cdef object _NOT_COPIED = object()
+cdef object _POOL_EXHAUSTED = object()
+cdef object _POOL_SLOT = object()
+
+ASYNC_MODE_ENABLED = False
+CALL_HOOKS_ENABLED = False
+INSTRUMENTATION_ENABLED = False
+TRACING_ENABLED = False
+
+cdef tuple _tracers = tuple()
+cdef object _tracers_lock = threading.Lock()
+cdef object _hooks_local = threading.local()
+
+cdef str _THREAD_SLOTS_KEY = 'dependency_injector.providers.ThreadLocalSingleton'
+cdef object _thread_local_slots_counter = itertools.count()
+cdef object _thread_slots_registry = weakref.WeakSet()
+cdef object _thread_slots_lock = threading.RLock()
+
+cdef object _NOT_CREATED = object()
+cdef object _MISSING = object()
+
+cdef bint _yaml_cache_enabled = False
+cdef object _yaml_cache_dir = None
+cdef dict _yaml_marking_loaders = dict()
+cdef int _YAML_CACHE_FORMAT = 2
+if contextvars is not None:
+    _current_scope = contextvars.ContextVar('dependency_injector_scope',
+                                            default=None)
+else:
+    _current_scope = None
+
+_monotonic = getattr(time, 'monotonic', time.time)
+_replace_file = getattr(os, 'replace', os.rename)
+
 if yaml:
     yaml_env_marker_pattern = re.compile(r'\$\{([^}^{]+)\}')
     def yaml_env_marker_constructor(_, node):
@@ -60,6 +141,22 @@ if yaml:
     yaml.add_implicit_resolver('!path', yaml_env_marker_pattern)
     yaml.add_constructor('!path', yaml_env_marker_constructor)
 
+    if hasattr(yaml, 'CLoader'):
+        yaml.add_implicit_resolver('!path', yaml_env_marker_pattern,
+                                   Loader=yaml.CLoader)
+        yaml.add_constructor('!path', yaml_env_marker_constructor,
+                             Loader=yaml.CLoader)
+
+    class _YamlEnvMarker(str):
+        """Environment variable marker, that is not expanded yet."""
+
+    class _YamlNotCacheable(Exception):
+        """Yaml configuration has markers, that could not be cached."""
+
+    def _yaml_env_marker_keeping_constructor(_, node):
+        """Keep environment variable marker for expanding it later."""
+        return _YamlEnvMarker(node.value)
+
 if sys.version_info[0] == 3:
     class EnvInterpolation(iniconfigparser.BasicInterpolation):
         """Interpolation which expands environment variables in values."""
@@ -127,6 +224,11 @@ cdef class Provider(object):
 
     All providers should extend this class.
 
+    Overriding providers are stored in immutable tuple that is replaced on
+    every change. Reading of overriding providers does not require locking.
+    Changes are serialized with :py:attr:`Provider.overriding_lock`, which is
+    created for every provider separately.
+
     .. py:attribute:: overridden
        :noindex:
 
@@ -137,16 +239,10 @@ cdef class Provider(object):
 
     __IS_PROVIDER__ = True
 
-    overriding_lock = threading.RLock()
-    """Overriding reentrant lock.
-
-    :type: :py:class:`threading.RLock`
-    """
-
     def __init__(self):
         """Initializer."""
         self.__overridden = tuple()
-        self.__last_overriding = None
+        self.__overriding_lock = threading.RLock()
         super(Provider, self).__init__()
 
     def __call__(self, *args, **kwargs):
@@ -154,8 +250,14 @@ cdef class Provider(object):
 
         Callable interface implementation.
         """
-        if self.__last_overriding is not None:
-            return self.__last_overriding(*args, **kwargs)
+        cdef object overriding
+
+        if CALL_HOOKS_ENABLED:
+            return _hooked_call(self, args, kwargs)
+
+        overriding = __get_overriding(self)
+        if overriding is not None:
+            return overriding(*args, **kwargs)
         return self._provide(args, kwargs)
 
     def __deepcopy__(self, memo):
@@ -184,11 +286,37 @@ cdef class Provider(object):
         """
         return self.__str__()
 
+    @property
+    def call_stats(self):
+        """Return statistics of provider calls.
+
+        Statistics are collected only while instrumentation is enabled, see
+        :py:func:`enable_instrumentation`. If provider has not been called
+        yet, ``None`` is returned.
+
+        :rtype: :py:class:`ProviderStats` | None
+        """
+        return self.__call_stats
+
+    def reset_call_stats(self):
+        """Drop statistics of provider calls.
+
+        :rtype: None
+        """
+        self.__call_stats = None
+
+    @property
+    def overriding_lock(self):
+        """Return overriding reentrant lock.
+
+        :rtype: :py:class:`threading.RLock`
+        """
+        return self.__overriding_lock
+
     @property
     def overridden(self):
         """Return tuple of overriding providers."""
-        with self.overriding_lock:
-            return self.__overridden
+        return self.__overridden
 
     @property
     def last_overriding(self):
@@ -196,7 +324,18 @@ cdef class Provider(object):
 
         If provider is not overridden, then None is returned.
         """
-        return self.__last_overriding
+        return __get_last_overriding(self)
+
+    @property
+    def related(self):
+        """Return tuple of related providers.
+
+        Related providers are the providers that current provider depends on:
+        injected, wrapped and overriding providers.
+
+        :rtype: tuple[:py:class:`Provider`]
+        """
+        return self.__overridden
 
     def override(self, provider):
         """Override provider with another provider.
@@ -216,12 +355,55 @@ cdef class Provider(object):
         if not is_provider(provider):
             provider = Object(provider)
 
-        with self.overriding_lock:
-            self.__overridden += (provider,)
-            self.__last_overriding = provider
+        with self.__overriding_lock:
+            self._set_overridden(self.__overridden + (provider,))
 
         return OverridingContext(self, provider)
 
+    def override_in_context(self, provider):
+        """Override provider with another provider in current context only.
+
+        Overriding is stored in :py:class:`contextvars.ContextVar`, so it is
+        visible only in current thread or asyncio task and in the tasks that
+        are created from it. Context overriding takes precedence over regular
+        overriding.
+
+        .. code-block:: python
+
+            with provider.override_in_context(another_provider):
+                assert provider() is another_provider()
+
+        :param provider: Overriding provider.
+        :type provider: :py:class:`Provider`
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+
+        :return: Context overriding context.
+        :rtype: :py:class:`ContextOverridingContext`
+        """
+        if contextvars is None:
+            raise Error('Package contextvars is not available')
+
+        if provider is self:
+            raise Error('Provider {0} could not be overridden '
+                        'with itself'.format(self))
+
+        if not is_provider(provider):
+            provider = Object(provider)
+
+        if self.__context_overriding is None:
+            with self.__overriding_lock:
+                if self.__context_overriding is None:
+                    self.__context_overriding = contextvars.ContextVar(
+                        'overriding_{0}'.format(hex(id(self))),
+                    )
+
+        return ContextOverridingContext(
+            self,
+            provider,
+            self.__context_overriding.set(provider),
+        )
+
     def reset_last_overriding(self):
         """Reset last overriding provider.
 
@@ -230,24 +412,19 @@ cdef class Provider(object):
 
         :rtype: None
         """
-        with self.overriding_lock:
+        with self.__overriding_lock:
             if len(self.__overridden) == 0:
                 raise Error('Provider {0} is not overridden'.format(str(self)))
 
-            self.__overridden = self.__overridden[:-1]
-            try:
-                self.__last_overriding = self.__overridden[-1]
-            except IndexError:
-                self.__last_overriding = None
+            self._set_overridden(self.__overridden[:-1])
 
     def reset_override(self):
         """Reset all overriding providers.
 
         :rtype: None
         """
-        with self.overriding_lock:
-            self.__overridden = tuple()
-            self.__last_overriding = None
+        with self.__overriding_lock:
+            self._set_overridden(tuple())
 
     def delegate(self):
         """Return provider's delegate.
@@ -275,8 +452,25 @@ cdef class Provider(object):
 
     cpdef void _copy_overridings(self, Provider copied, dict memo):
         """Copy provider overridings to a newly copied provider."""
-        copied.__overridden = deepcopy(self.__overridden, memo)
-        copied.__last_overriding = deepcopy(self.__last_overriding, memo)
+        cdef object overriding
+        cdef list overridden
+
+        if len(self.__overridden) == 0:
+            return
+
+        overridden = list()
+        for overriding in self.__overridden:
+            overridden.append(_deepcopy(overriding, memo))
+        copied._set_overridden(tuple(overridden))
+
+    cdef void _set_overridden(self, tuple overridden) except *:
+        """Replace tuple of overriding providers.
+
+        Tuple is published with a single assignment. Last overriding provider
+        is always taken from the tuple, so readers never see it out of sync
+        with overriding providers.
+        """
+        self.__overridden = overridden
 
 
 cdef class Object(Provider):
@@ -383,6 +577,16 @@ cdef class Delegate(Provider):
         """
         return self.__str__()
 
+    @property
+    def provides(self):
+        """Return provider."""
+        return self.__provides
+
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return (self.__provides,) + super(Delegate, self).related
+
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return provided instance.
 
@@ -452,12 +656,16 @@ cdef class Dependency(Provider):
 
         :rtype: object
         """
+        cdef object overriding = __get_overriding(self)
         cdef object instance
 
-        if self.__last_overriding is None:
+        if overriding is None:
             raise Error('Dependency is not defined')
 
-        instance = self.__last_overriding(*args, **kwargs)
+        if CALL_HOOKS_ENABLED:
+            instance = _call_with_hooks(self, overriding, args, kwargs)
+        else:
+            instance = overriding(*args, **kwargs)
 
         if not isinstance(instance, self.instance_of):
             raise Error('{0} is not an '.format(instance) +
@@ -604,6 +812,12 @@ cdef class DependenciesContainer(Object):
         """Read-only dictionary of dependency providers."""
         return self.__providers
 
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return (tuple(self.__providers.values()) +
+                super(DependenciesContainer, self).related)
+
     def override(self, provider):
         """Override provider with another provider.
 
@@ -618,6 +832,13 @@ cdef class DependenciesContainer(Object):
         self._override_providers(container=provider)
         return super(DependenciesContainer, self).override(provider)
 
+    def override_in_context(self, provider):
+        """Override provider with another provider in current context only.
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+        """
+        raise Error('{0} does not support context overriding'.format(self.__class__))
+
     def reset_last_overriding(self):
         """Reset last overriding provider.
 
@@ -692,6 +913,54 @@ cdef class OverridingContext(object):
         self.__overridden.reset_last_overriding()
 
 
+cdef class ContextOverridingContext(object):
+    """Provider context overriding context.
+
+    :py:class:`ContextOverridingContext` is used by
+    :py:meth:`Provider.override_in_context` for implementing ``with``
+    contexts. When :py:class:`ContextOverridingContext` is closed or reset,
+    context variable of overridden provider is restored to its previous value.
+
+    .. code-block:: python
+
+        with provider.override_in_context(another_provider):
+            assert provider() is another_provider()
+        assert provider() is not another_provider()
+    """
+
+    def __init__(self, Provider overridden, Provider overriding, object token):
+        """Initializer.
+
+        :param overridden: Overridden provider.
+        :type overridden: :py:class:`Provider`
+
+        :param overriding: Overriding provider.
+        :type overriding: :py:class:`Provider`
+
+        :param token: Token of context variable change.
+        :type token: :py:class:`contextvars.Token`
+        """
+        self.__overridden = overridden
+        self.__overriding = overriding
+        self.__token = token
+        super(ContextOverridingContext, self).__init__()
+
+    def __enter__(self):
+        """Do nothing."""
+        return self.__overriding
+
+    def __exit__(self, *_):
+        """Exit overriding context."""
+        self.reset()
+
+    def reset(self):
+        """Reset context overriding.
+
+        :rtype: None
+        """
+        self.__token.var.reset(self.__token)
+
+
 cdef class Callable(Provider):
     r"""Callable provider calls wrapped callable on every call.
 
@@ -729,13 +998,13 @@ cdef class Callable(Provider):
                                          provides))
         self.__provides = provides
 
-        self.__args = tuple()
-        self.__args_len = 0
-        self.set_args(*args)
+        self.__args = parse_positional_injections(args)
+        self.__args_len = len(self.__args)
 
-        self.__kwargs = tuple()
-        self.__kwargs_len = 0
-        self.set_kwargs(**kwargs)
+        self.__kwargs = parse_named_injections(kwargs)
+        self.__kwargs_len = len(self.__kwargs)
+
+        self._compile_injections()
 
         super(Callable, self).__init__()
 
@@ -747,11 +1016,10 @@ cdef class Callable(Provider):
 
         provides = self.provides
         if isinstance(provides, Provider):
-            provides = deepcopy(provides, memo)
+            provides = _deepcopy(provides, memo)
 
-        copied = self.__class__(provides,
-                                *deepcopy(self.args, memo),
-                                **deepcopy(self.kwargs, memo))
+        copied = self.__class__(provides)
+        _copy_callable_injections(self, copied, memo)
 
         self._copy_overridings(copied, memo)
 
@@ -789,6 +1057,7 @@ cdef class Callable(Provider):
         """
         self.__args += parse_positional_injections(args)
         self.__args_len = len(self.__args)
+        self._compile_injections()
         return self
 
     def set_args(self, *args):
@@ -800,6 +1069,7 @@ cdef class Callable(Provider):
         """
         self.__args = parse_positional_injections(args)
         self.__args_len = len(self.__args)
+        self._compile_injections()
         return self
 
     def clear_args(self):
@@ -809,6 +1079,7 @@ cdef class Callable(Provider):
         """
         self.__args = tuple()
         self.__args_len = len(self.__args)
+        self._compile_injections()
         return self
 
     @property
@@ -831,6 +1102,7 @@ cdef class Callable(Provider):
         """
         self.__kwargs += parse_named_injections(kwargs)
         self.__kwargs_len = len(self.__kwargs)
+        self._compile_injections()
         return self
 
     def set_kwargs(self, **kwargs):
@@ -842,6 +1114,7 @@ cdef class Callable(Provider):
         """
         self.__kwargs = parse_named_injections(kwargs)
         self.__kwargs_len = len(self.__kwargs)
+        self._compile_injections()
         return self
 
     def clear_kwargs(self):
@@ -851,12 +1124,67 @@ cdef class Callable(Provider):
         """
         self.__kwargs = tuple()
         self.__kwargs_len = len(self.__kwargs)
+        self._compile_injections()
         return self
 
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return (_filter_providers((self.__provides,)) +
+                _filter_providers(self.args) +
+                _filter_providers(tuple(self.kwargs.values())) +
+                super(Callable, self).related)
+
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return result of provided callable's call."""
         return __callable_call(self, args, kwargs)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _compile_injections(self) except *:
+        """Fold constant injections.
+
+        Values of injections that are not called are collected once, so calls
+        only copy them and resolve injected providers. Keyword injections
+        template is built only if there are constants to fold.
+        """
+        cdef int index
+        cdef list args_constants = list()
+        cdef dict kwargs_injections = dict()
+        cdef dict kwargs_template = dict()
+        cdef list kwargs_providers = list()
+        cdef PositionalInjection arg
+        cdef NamedInjection kwarg
+
+        for index in range(self.__args_len):
+            arg = <PositionalInjection>self.__args[index]
+            if arg.__call != 0:
+                args_constants = None
+                break
+            args_constants.append(arg.__value)
+
+        for index in range(self.__kwargs_len):
+            kwarg = <NamedInjection>self.__kwargs[index]
+            kwargs_injections[kwarg.__name] = kwarg
+
+        for kwarg in kwargs_injections.values():
+            if kwarg.__call == 0:
+                kwargs_template[kwarg.__name] = kwarg.__value
+            else:
+                kwargs_template[kwarg.__name] = None
+                kwargs_providers.append(kwarg)
+
+        if args_constants is None:
+            self.__args_constants = None
+        else:
+            self.__args_constants = tuple(args_constants)
+        if len(kwargs_providers) == len(kwargs_template):
+            self.__kwargs_template = None
+        else:
+            self.__kwargs_template = kwargs_template
+        self.__kwargs_providers = tuple(kwargs_providers)
+        self.__kwargs_providers_len = len(kwargs_providers)
+
 
 cdef class DelegatedCallable(Callable):
     """Callable that is injected "as is".
@@ -882,9 +1210,12 @@ cdef class AbstractCallable(Callable):
 
         Callable interface implementation.
         """
-        if self.__last_overriding is None:
+        cdef object overriding = __get_overriding(self)
+        if overriding is None:
             raise Error('{0} must be overridden before calling'.format(self))
-        return self.__last_overriding(*args, **kwargs)
+        if CALL_HOOKS_ENABLED:
+            return _call_with_hooks(self, overriding, args, kwargs)
+        return overriding(*args, **kwargs)
 
     def override(self, provider):
         """Override provider with another provider.
@@ -902,6 +1233,22 @@ cdef class AbstractCallable(Callable):
                         '{1} providers'.format(self, Callable))
         return super(AbstractCallable, self).override(provider)
 
+    def override_in_context(self, provider):
+        """Override provider with another provider in current context only.
+
+        :param provider: Overriding provider.
+        :type provider: :py:class:`Provider`
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+
+        :return: Context overriding context.
+        :rtype: :py:class:`ContextOverridingContext`
+        """
+        if not isinstance(provider, Callable):
+            raise Error('{0} must be overridden only by '
+                        '{1} providers'.format(self, Callable))
+        return super(AbstractCallable, self).override_in_context(provider)
+
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return result of provided callable's call."""
         raise NotImplementedError('Abstract provider forward providing logic '
@@ -998,9 +1345,12 @@ cdef class AbstractCoroutine(Coroutine):
 
         Callable interface implementation.
         """
-        if self.__last_overriding is None:
+        cdef object overriding = __get_overriding(self)
+        if overriding is None:
             raise Error('{0} must be overridden before calling'.format(self))
-        return self.__last_overriding(*args, **kwargs)
+        if CALL_HOOKS_ENABLED:
+            return _call_with_hooks(self, overriding, args, kwargs)
+        return overriding(*args, **kwargs)
 
     def override(self, provider):
         """Override provider with another provider.
@@ -1018,6 +1368,22 @@ cdef class AbstractCoroutine(Coroutine):
                         '{1} providers'.format(self, Coroutine))
         return super(AbstractCoroutine, self).override(provider)
 
+    def override_in_context(self, provider):
+        """Override provider with another provider in current context only.
+
+        :param provider: Overriding provider.
+        :type provider: :py:class:`Provider`
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+
+        :return: Context overriding context.
+        :rtype: :py:class:`ContextOverridingContext`
+        """
+        if not isinstance(provider, Coroutine):
+            raise Error('{0} must be overridden only by '
+                        '{1} providers'.format(self, Coroutine))
+        return super(AbstractCoroutine, self).override_in_context(provider)
+
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return result of provided callable's call."""
         raise NotImplementedError('Abstract provider forward providing logic '
@@ -1046,6 +1412,17 @@ cdef class CoroutineDelegate(Delegate):
         super(CoroutineDelegate, self).__init__(coroutine)
 
 
+cdef class _ConfigurationVersion(object):
+    """Version of configuration value.
+
+    Version is shared by configuration and its options. It is changed, when
+    configuration is changed, so options know that their caches are outdated.
+    """
+
+    def __init__(self):
+        self.value = 1
+
+
 cdef class ConfigurationOption(Provider):
     """Child configuration option provider.
 
@@ -1056,10 +1433,8 @@ cdef class ConfigurationOption(Provider):
     UNDEFINED = object()
 
     def __init__(self, name, root):
-        self.__name = name
-        self.__root_ref = weakref.ref(root)
-        self.__children = {}
-        self.__cache = self.UNDEFINED
+        _init_option(self, name, root, _get_option_keys(name, False),
+                     _get_option_selector(name))
         super().__init__()
 
     def __deepcopy__(self, memo):
@@ -1069,15 +1444,22 @@ cdef class ConfigurationOption(Provider):
         if copied is not None:
             return copied
 
-        copied_name = deepcopy(self.__name, memo)
+        copied_name = _copy_option_name(self.__name, memo)
 
         root = self.__root_ref()
         copied_root = memo.get(id(root))
         if copied_root is None:
             copied_root = deepcopy(root, memo)
 
-        copied = self.__class__(copied_name, copied_root)
-        copied.__children = deepcopy(self.__children, memo)
+        if copied_name is self.__name:
+            copied = <ConfigurationOption>_create_provider(self.__class__)
+            _init_option(copied, copied_name, copied_root, self.__keys,
+                         self.__selector)
+        else:
+            copied = self.__class__(copied_name, copied_root)
+        copied.__children = _copy_option_children(self.__children, memo)
+        for child in copied.__children.values():
+            _set_option_parent(child, copied)
 
         return copied
 
@@ -1095,6 +1477,7 @@ cdef class ConfigurationOption(Provider):
         if child is None:
             child_name = self.__name + (item,)
             child = ConfigurationOption(child_name, self.__root_ref())
+            _set_option_parent(child, self)
             self.__children[item] = child
         return child
 
@@ -1103,20 +1486,59 @@ cdef class ConfigurationOption(Provider):
         if child is None:
             child_name = self.__name + (item,)
             child = ConfigurationOption(child_name, self.__root_ref())
+            _set_option_parent(child, self)
             self.__children[item] = child
         return child
 
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return ((self.__root_ref(),) +
+                _filter_providers(self.__name) +
+                super(ConfigurationOption, self).related)
+
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return new instance."""
-        if self.__cache is not self.UNDEFINED:
+        return self._resolve()
+
+    cdef object _resolve(self):
+        """Return value of option.
+
+        Value is resolved from the value of parent option, so values of
+        intermediate options are cached too. Cache is valid until version of
+        the root configuration is changed.
+        """
+        cdef unsigned long long version = self.__version.value
+        cdef tuple keys
+
+        if self.__cacheable and self.__cache_version == version:
             return self.__cache
 
-        root = self.__root_ref()
-        value = root.get(self._get_self_name())
-        self.__cache = value
+        if self.__parent is not None:
+            value = self.__parent._resolve()
+            keys = self.__keys
+            if keys is None:
+                keys = _get_option_keys(self.__name[-1:], True)
+        else:
+            root = self.__root_ref()
+            if root is None:
+                raise Error('Configuration of option {0} does not exist '
+                            'anymore'.format(self._get_self_name()))
+            value = root.__call__()
+            keys = self.__keys
+            if keys is None:
+                keys = _get_option_keys(self.__name, True)
+
+        value = _get_option_value(value, keys)
+
+        if self.__cacheable:
+            self.__cache = value
+            self.__cache_version = version
         return value
 
     def _get_self_name(self):
+        if self.__selector is not None:
+            return self.__selector
         return '.'.join(
             segment() if is_provider(segment) else segment for segment in self.__name
         )
@@ -1131,6 +1553,9 @@ cdef class ConfigurationOption(Provider):
         root = self.__root_ref()
         return root.set(self._get_self_name(), value)
 
+    def override_in_context(self, value):
+        raise Error('Configuration option does not support this method')
+
     def reset_last_overriding(self):
         raise Error('Configuration option does not support this method')
 
@@ -1138,9 +1563,93 @@ cdef class ConfigurationOption(Provider):
         raise Error('Configuration option does not support this method')
 
     def reset_cache(self):
-        self.__cache = self.UNDEFINED
-        for child in self.__children.values():
-            child.reset_cache()
+        root = self.__root_ref()
+        if root is not None:
+            root.reset_cache()
+
+    def as_int(self):
+        """Return provider of option value converted to ``int``.
+
+        :rtype: :py:class:`TypedConfigurationOption`
+        """
+        return self._get_typed(int, False)
+
+    def as_float(self):
+        """Return provider of option value converted to ``float``.
+
+        :rtype: :py:class:`TypedConfigurationOption`
+        """
+        return self._get_typed(float, False)
+
+    def as_bool(self):
+        """Return provider of option value converted to ``bool``.
+
+        Strings ``1``, ``true``, ``yes``, ``on`` and ``0``, ``false``,
+        ``no``, ``off`` are recognized.
+
+        :rtype: :py:class:`TypedConfigurationOption`
+        """
+        return self._get_typed(_to_bool, False)
+
+    def as_(self, converter):
+        """Return provider of option value converted with converter.
+
+        .. code-block:: python
+
+            timeout = config.timeout.as_(decimal.Decimal)
+
+        :param converter: Callable, that converts option value.
+        :type converter: callable
+
+        :rtype: :py:class:`TypedConfigurationOption`
+        """
+        return self._get_typed(_get_converter(converter), False)
+
+    def required(self):
+        """Return provider of option value, that raises error if undefined.
+
+        :rtype: :py:class:`TypedConfigurationOption`
+        """
+        return self._get_typed(None, True)
+
+    cdef TypedConfigurationOption _get_typed(self, object converter,
+                                             bint required):
+        """Return typed option, creating it once for the converter."""
+        cdef Configuration root
+        cdef TypedConfigurationOption typed
+
+        key = (converter, required)
+        typed = self.__typed.get(key)
+        if typed is None:
+            typed = TypedConfigurationOption(self, converter, required)
+            root = self.__root_ref()
+            if root is not None:
+                root.__typed_options.append(typed)
+            self.__typed[key] = typed
+        return typed
+
+    def subscribe(self, callback):
+        """Subscribe to changes of option value on configuration reload.
+
+        See :py:meth:`Configuration.subscribe`.
+
+        :param callback: Callable, that gets old and new values.
+        :type callback: callable
+
+        :rtype: None
+        """
+        cdef Configuration root = self.__root_ref()
+        root.__subscriptions.append((self, callback))
+
+    def unsubscribe(self, callback):
+        """Unsubscribe from changes of option value.
+
+        :param callback: Subscribed callable.
+        :type callback: callable
+
+        :rtype: None
+        """
+        _remove_subscription(self.__root_ref(), self, callback)
 
     def update(self, value):
         """Set configuration options.
@@ -1160,50 +1669,50 @@ cdef class ConfigurationOption(Provider):
         """Load configuration from the ini file.
 
         Loaded configuration is merged recursively over existing configuration.
+        File is remembered for :py:meth:`Configuration.reload`.
 
         :param filepath: Path to the configuration file.
         :type filepath: str
 
         :rtype: None
         """
-        parser = _parse_ini_file(filepath)
-
-        config = {}
-        for section in parser.sections():
-            config[section] = dict(parser.items(section))
+        stamp = _get_file_stamp(filepath)
+        config = _load_ini_file(filepath)
 
         current_config = self.__call__()
         if not current_config:
             current_config = {}
         self.override(merge_dicts(current_config, config))
+        _add_option_source(self, 'ini', filepath, None, stamp, config)
 
-    def from_yaml(self, filepath):
+    def from_yaml(self, filepath, loader=None):
         """Load configuration from the yaml file.
 
         Loaded configuration is merged recursively over existing configuration.
+        File is remembered for :py:meth:`Configuration.reload`.
 
         :param filepath: Path to the configuration file.
         :type filepath: str
 
+        :param loader: YAML loader class. By default, ``yaml.CLoader`` of
+                       libyaml is used, if it is available, and ``yaml.Loader``
+                       otherwise.
+        :type loader: type
+
         :rtype: None
         """
-        if yaml is None:
-            raise Error(
-                'Unable to load yaml configuration - PyYAML is not installed. '
-                'Install PyYAML or install Dependency Injector with yaml extras: '
-                '"pip install dependency-injector[yaml]"'
-            )
-
+        stamp = _get_file_stamp(filepath)
         try:
-            with open(filepath) as opened_file:
-                config = yaml.load(opened_file, yaml.Loader)
+            config = _load_yaml_file(filepath, loader)
         except IOError:
+            _add_option_source(self, 'yaml', filepath, loader, stamp, None)
             return
 
         current_config = self.__call__()
         if not current_config:
             current_config = {}
         self.override(merge_dicts(current_config, config))
+        _add_option_source(self, 'yaml', filepath, loader, stamp, config)
 
     def from_dict(self, options):
         """Load configuration from the dictionary.
@@ -1234,6 +1743,47 @@ cdef class ConfigurationOption(Provider):
         value = os.getenv(name, default)
         self.override(value)
 
+    def from_env_prefix(self, prefix, separator='__', types=None,
+                        lowercase=True):
+        """Load configuration from the environment variables with prefix.
+
+        Environment is scanned once. Names of variables without prefix are
+        split by separator into option keys, e.g. ``APP_DATABASE__PORT``
+        with ``APP_`` prefix becomes ``database.port``. If variable is both
+        option and section, section wins. Loaded configuration is merged
+        recursively over existing configuration at once.
+
+        .. code-block:: python
+
+            config.from_env_prefix('APP_', types={'database.port': int})
+
+        :param prefix: Prefix of environment variable names.
+        :type prefix: str
+
+        :param separator: Separator of option keys in variable names.
+        :type separator: str
+
+        :param types: Dictionary of option selectors and their types. Type
+                      could be a callable, that converts string, or one of
+                      ``'str'``, ``'int'``, ``'float'``, ``'bool'`` and
+                      ``'json'``.
+        :type types: dict[str, callable | str]
+
+        :param lowercase: Lowercase option keys.
+        :type lowercase: bool
+
+        :raise: :py:exc:`dependency_injector.errors.Error` with all values,
+                that could not be converted.
+
+        :rtype: None
+        """
+        config = _load_env_prefix(prefix, separator, types, lowercase)
+
+        current_config = self.__call__()
+        if not current_config:
+            current_config = {}
+        self.override(merge_dicts(current_config, config))
+
 
 cdef class Configuration(Object):
     """Configuration provider provides configuration options to the other providers.
@@ -1265,6 +1815,11 @@ cdef class Configuration(Object):
             value = default.copy()
 
         self.__children = {}
+        self.__version = _ConfigurationVersion()
+        self.__sources = []
+        self.__subscriptions = []
+        self.__typed_options = []
+        self.__reload_lock = threading.Lock()
 
         super().__init__(value)
 
@@ -1278,8 +1833,10 @@ cdef class Configuration(Object):
         copied = self.__class__(self.__name, self.__provides)
         memo[id(self)] = copied
 
-        copied.__children = deepcopy(self.__children, memo)
+        copied.__children = _copy_option_children(self.__children, memo)
         self._copy_overridings(copied, memo)
+        copied.__sources = [_copy_configuration_source(source, memo)
+                            for source in self.__sources]
 
         return copied
 
@@ -1302,7 +1859,7 @@ cdef class Configuration(Object):
     def __getitem__(self, item):
         child = self.__children.get(item)
         if child is None:
-            child = ConfigurationOption(item, self)
+            child = ConfigurationOption((item,), self)
             self.__children[item] = child
         return child
 
@@ -1318,20 +1875,15 @@ cdef class Configuration(Object):
         :return: Option value.
         :rtype: Any
         """
-        keys = selector.split('.')
-        value = self.__call__()
-
-        while len(keys) > 0:
-            key = keys.pop(0)
-            value = value.get(key)
-            if value is None:
-                break
-
-        return value
+        return _get_option_value(self.__call__(), tuple(selector.split('.')))
 
     def set(self, selector, value):
         """Override configuration option.
 
+        Current configuration value is not modified. New value is created by
+        copying dictionaries on the path of the option, other dictionaries are
+        shared with the current value.
+
         :param selector: Selector string, e.g. "option1.option2"
         :type selector: str
 
@@ -1341,19 +1893,9 @@ cdef class Configuration(Object):
         :return: Overriding context.
         :rtype: :py:class:`OverridingContext`
         """
-        keys = selector.split('.')
-        original_value = current_value = self.__call__()
-
-        while len(keys) > 0:
-            key = keys.pop(0)
-            if len(keys) == 0:
-                current_value[key] = value
-                break
-            temp_value = current_value.get(key, {})
-            current_value[key] = temp_value
-            current_value = temp_value
-
-        return self.override(original_value)
+        value = _set_path_value(self.__call__(),
+                                tuple(selector.split('.')), 0, value)
+        return self.override(value)
 
     def override(self, provider):
         """Override provider with another provider.
@@ -1366,10 +1908,34 @@ cdef class Configuration(Object):
         :return: Overriding context.
         :rtype: :py:class:`OverridingContext`
         """
+        if not is_provider(provider):
+            _check_typed_options(self, provider, False)
         context = super().override(provider)
         self.reset_cache()
         return context
 
+    def validate(self):
+        """Check values of typed and required options.
+
+        All typed options, that are created with ``as_*()`` and
+        ``required()`` methods, are checked at once. Values of typed options
+        are also checked every time, when configuration value is changed, but
+        required options are not, since they could be loaded later.
+
+        :raise: :py:exc:`dependency_injector.errors.Error` with all invalid
+                and undefined required options.
+
+        :rtype: None
+        """
+        _check_typed_options(self, self.__call__(), True)
+
+    def override_in_context(self, provider):
+        """Override provider with another provider in current context only.
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+        """
+        raise Error('{0} does not support context overriding'.format(self.__class__))
+
     def reset_last_overriding(self):
         """Reset last overriding provider.
 
@@ -1392,11 +1958,172 @@ cdef class Configuration(Object):
     def reset_cache(self):
         """Reset children providers cache.
 
+        Version of configuration is changed, so caches of all options become
+        outdated at once.
+
         :rtype: None
         """
-        for child in self.__children.values():
-            child.reset_cache()
-
+        self.__version.value += 1
+
+    def reload(self, force=False):
+        """Reload configuration files, if they have changed.
+
+        Files, that were loaded with ``from_yaml()`` and ``from_ini()``
+        methods of configuration and its options, are checked by modification
+        time, size and inode. Changed files are parsed again and their changes
+        are applied to the configuration values, that were loaded with them,
+        and to the values, that were set over them later.
+
+        Only options, which values are still equal to the previous content of
+        the file, are changed. Options, that were changed after file has been
+        loaded, e.g. with :py:meth:`set` or :py:meth:`override`, are kept.
+        Options, that are removed from files, are kept too. Overriding
+        providers stay in the same order, so leaving overriding context
+        restores configuration as expected.
+
+        New configuration value is built aside and swapped in at once, so
+        readers never see partially reloaded configuration. Caches of only
+        those options, which values have changed, are invalidated. Subscribers
+        of changed options are notified after that, see :py:meth:`subscribe`.
+
+        :param force: Parse files again, even if they have not changed.
+        :type force: bool
+
+        :return: ``True`` if configuration files have changed.
+        :rtype: bool
+        """
+        cdef _ConfigurationSource source
+        cdef list changes = list()
+
+        with self.__reload_lock:
+            for source in list(self.__sources):
+                old_value = source.value
+                if source.refresh(force):
+                    changes.append((source, old_value))
+            if not changes:
+                return False
+
+            subscriptions = list(self.__subscriptions)
+            old_values = [provider() for provider, _ in subscriptions]
+            self._apply_changes(changes)
+            _notify_subscribers(subscriptions, old_values)
+            return True
+
+    def watch(self, interval=1.0, on_error=None):
+        """Start watching configuration files and reloading on changes.
+
+        Files are polled by a background thread every ``interval`` seconds,
+        see :py:meth:`reload`.
+
+        .. code-block:: python
+
+            config.from_yaml('config.yml')
+            watcher = config.watch(interval=5.0)
+            ...
+            watcher.stop()
+
+        :param interval: Polling interval in seconds.
+        :type interval: float
+
+        :param on_error: Callable, that gets exceptions of reloading. By
+                         default, reloading errors are ignored and reloading
+                         is retried on the next change.
+        :type on_error: callable
+
+        :return: Started watcher.
+        :rtype: :py:class:`ConfigurationWatcher`
+        """
+        watcher = ConfigurationWatcher(self, interval, on_error)
+        watcher.start()
+        return watcher
+
+    def subscribe(self, callback):
+        """Subscribe to changes of configuration on reload.
+
+        Callback is called with old and new values, when value has changed
+        after :py:meth:`reload`.
+
+        :param callback: Callable, that gets old and new values.
+        :type callback: callable
+
+        :rtype: None
+        """
+        self.__subscriptions.append((self, callback))
+
+    def unsubscribe(self, callback):
+        """Unsubscribe from changes of configuration.
+
+        :param callback: Subscribed callable.
+        :type callback: callable
+
+        :rtype: None
+        """
+        _remove_subscription(self, self, callback)
+
+    cdef void _add_source(self, str kind, object filepath, object loader,
+                          tuple keys, object stamp, object value) except *:
+        """Remember loaded configuration file.
+
+        It is called after configuration is overridden with file value, so
+        last overriding provider is a layer, that file is loaded into.
+        """
+        cdef _ConfigurationSource source
+
+        with self.__reload_lock:
+            for source in list(self.__sources):
+                if (source.kind == kind and source.filepath == filepath and
+                        source.keys == keys):
+                    self.__sources.remove(source)
+            self.__sources.append(
+                _ConfigurationSource(kind, filepath, loader, keys, stamp,
+                                     value, __get_last_overriding(self)),
+            )
+
+    cdef void _apply_changes(self, list changes) except *:
+        """Apply changes of files to configuration layers.
+
+        Layer of every changed file and layers over it are patched. Patched
+        layers are replaced in place, so the order of overriding providers
+        is kept. If configuration is not overridden, new layer is added.
+        """
+        cdef _ConfigurationSource source
+        cdef unsigned long long old_version
+        cdef dict replaced = dict()
+        cdef list layers
+        cdef int start
+
+        with self.__overriding_lock:
+            layers = list(self.__overridden)
+            if not layers:
+                layers.append(Object(self.__provides))
+
+            for source, old_value in changes:
+                start = _get_layer_index(layers, source.layer, replaced)
+                for index in range(start, len(layers)):
+                    layer = layers[index]
+                    if type(layer) is not Object:
+                        continue
+                    value = (<Object>layer).__provides
+                    patched = _patch_configuration_source(value, source,
+                                                          old_value)
+                    if patched is not value:
+                        layers[index] = Object(patched)
+                        replaced[id(layer)] = layers[index]
+
+            if not replaced:
+                return
+
+            _check_typed_options(self, layers[-1](), False)
+            self._set_overridden(tuple(layers))
+
+            for source in self.__sources:
+                source.layer = replaced.get(id(source.layer), source.layer)
+
+        old_version = self.__version.value
+        self.__version.value += 1
+        for child in list(self.__children.values()):
+            _refresh_option_cache(child, old_version)
+
     def update(self, value):
         """Set configuration options.
 
@@ -1415,50 +2142,50 @@ cdef class Configuration(Object):
         """Load configuration from the ini file.
 
         Loaded configuration is merged recursively over existing configuration.
+        File is remembered for :py:meth:`Configuration.reload`.
 
         :param filepath: Path to the configuration file.
         :type filepath: str
 
         :rtype: None
         """
-        parser = _parse_ini_file(filepath)
-
-        config = {}
-        for section in parser.sections():
-            config[section] = dict(parser.items(section))
+        stamp = _get_file_stamp(filepath)
+        config = _load_ini_file(filepath)
 
         current_config = self.__call__()
         if not current_config:
             current_config = {}
         self.override(merge_dicts(current_config, config))
+        self._add_source('ini', filepath, None, tuple(), stamp, config)
 
-    def from_yaml(self, filepath):
+    def from_yaml(self, filepath, loader=None):
         """Load configuration from the yaml file.
 
         Loaded configuration is merged recursively over existing configuration.
+        File is remembered for :py:meth:`Configuration.reload`.
 
         :param filepath: Path to the configuration file.
         :type filepath: str
 
+        :param loader: YAML loader class. By default, ``yaml.CLoader`` of
+                       libyaml is used, if it is available, and ``yaml.Loader``
+                       otherwise.
+        :type loader: type
+
         :rtype: None
         """
-        if yaml is None:
-            raise Error(
-                'Unable to load yaml configuration - PyYAML is not installed. '
-                'Install PyYAML or install Dependency Injector with yaml extras: '
-                '"pip install dependency-injector[yaml]"'
-            )
-
+        stamp = _get_file_stamp(filepath)
         try:
-            with open(filepath) as opened_file:
-                config = yaml.load(opened_file, yaml.Loader)
+            config = _load_yaml_file(filepath, loader)
         except IOError:
+            self._add_source('yaml', filepath, loader, tuple(), stamp, None)
             return
 
         current_config = self.__call__()
         if not current_config:
             current_config = {}
         self.override(merge_dicts(current_config, config))
+        self._add_source('yaml', filepath, loader, tuple(), stamp, config)
 
     def from_dict(self, options):
         """Load configuration from the dictionary.
@@ -1489,6 +2216,688 @@ cdef class Configuration(Object):
         value = os.getenv(name, default)
         self.override(value)
 
+    def from_env_prefix(self, prefix, separator='__', types=None,
+                        lowercase=True):
+        """Load configuration from the environment variables with prefix.
+
+        Environment is scanned once. Names of variables without prefix are
+        split by separator into option keys, e.g. ``APP_DATABASE__PORT``
+        with ``APP_`` prefix becomes ``database.port``. If variable is both
+        option and section, section wins. Loaded configuration is merged
+        recursively over existing configuration at once.
+
+        .. code-block:: python
+
+            config.from_env_prefix('APP_', types={'database.port': int})
+
+        :param prefix: Prefix of environment variable names.
+        :type prefix: str
+
+        :param separator: Separator of option keys in variable names.
+        :type separator: str
+
+        :param types: Dictionary of option selectors and their types. Type
+                      could be a callable, that converts string, or one of
+                      ``'str'``, ``'int'``, ``'float'``, ``'bool'`` and
+                      ``'json'``.
+        :type types: dict[str, callable | str]
+
+        :param lowercase: Lowercase option keys.
+        :type lowercase: bool
+
+        :raise: :py:exc:`dependency_injector.errors.Error` with all values,
+                that could not be converted.
+
+        :rtype: None
+        """
+        config = _load_env_prefix(prefix, separator, types, lowercase)
+
+        current_config = self.__call__()
+        if not current_config:
+            current_config = {}
+        self.override(merge_dicts(current_config, config))
+
+
+cdef class TypedConfigurationOption(Provider):
+    """Typed configuration option provider.
+
+    Provider converts value of configuration option. Converted value is
+    computed once for every version of configuration. It is created by
+    :py:meth:`ConfigurationOption.as_int`, :py:meth:`ConfigurationOption.as_`,
+    :py:meth:`ConfigurationOption.required` and other methods of
+    configuration option.
+
+    .. code-block:: python
+
+        timeout = config.timeout.as_int().required()
+    """
+
+    def __init__(self, ConfigurationOption option, converter=None,
+                 bint required=False):
+        """Initializer.
+
+        :param option: Configuration option.
+        :type option: :py:class:`ConfigurationOption`
+
+        :param converter: Callable, that converts option value.
+        :type converter: callable | None
+
+        :param required: Raise error, if option is undefined.
+        :type required: bool
+        """
+        self.__option = option
+        self.__converter = converter
+        self.__required = required
+        self.__version = option.__version
+        self.__source = None
+        self.__cache = None
+        self.__cache_version = 0
+        super(TypedConfigurationOption, self).__init__()
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        cdef TypedConfigurationOption copied
+
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+
+        option = deepcopy(self.__option, memo)
+        copied = (<ConfigurationOption?>option)._get_typed(self.__converter,
+                                                           self.__required)
+        memo[id(self)] = copied
+
+        self._copy_overridings(copied, memo)
+
+        return copied
+
+    def __str__(self):
+        """Return string representation of provider.
+
+        :rtype: str
+        """
+        return represent_provider(provider=self,
+                                  provides=self.__option.get_name())
+
+    @property
+    def option(self):
+        """Return configuration option."""
+        return self.__option
+
+    @property
+    def converter(self):
+        """Return converter of option value."""
+        return self.__converter
+
+    @property
+    def is_required(self):
+        """Check if option is required."""
+        return self.__required
+
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return ((self.__option,) +
+                super(TypedConfigurationOption, self).related)
+
+    def required(self):
+        """Return required version of typed option.
+
+        :rtype: :py:class:`TypedConfigurationOption`
+        """
+        return self.__option._get_typed(self.__converter, True)
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return converted value of option."""
+        cdef unsigned long long version = self.__version.value
+
+        if self.__cache_version == version and self.__option.__cacheable:
+            return self.__cache
+
+        source = self.__option._resolve()
+        if (source is not None and source is self.__source and
+                self.__option.__cacheable):
+            value = self.__cache
+        else:
+            value = _convert_option_value(self.__option, source,
+                                          self.__converter, self.__required)
+
+        self.__source = source
+        self.__cache = value
+        self.__cache_version = version
+        return value
+
+
+cdef object _convert_option_value(ConfigurationOption option, object value,
+                                  object converter, bint required):
+    """Return converted value of option."""
+    if value is None:
+        if required:
+            raise Error('Undefined configuration option "{0}"'.format(
+                option.get_name()))
+        return None
+
+    if converter is None:
+        return value
+
+    try:
+        return converter(value)
+    except Exception as exception:
+        raise Error('Invalid value of configuration option "{0}": '
+                    '{1!r} ({2})'.format(option.get_name(), value, exception))
+
+
+cdef void _check_typed_options(Configuration root, object value,
+                               bint check_required) except *:
+    """Check that values of typed options could be converted.
+
+    All options are checked, errors are reported in a single exception. If
+    there are no errors, converted values are kept by typed options, so they
+    are not converted again on the next call.
+    """
+    cdef TypedConfigurationOption typed
+    cdef list converted = list()
+    cdef list errors = list()
+    cdef tuple keys
+
+    for typed in root.__typed_options:
+        keys = _get_option_keys(typed.__option.__name, False)
+        if keys is None:
+            continue
+        try:
+            option_value = _get_option_value(value, keys)
+        except Exception:
+            continue
+        if option_value is not None and option_value is typed.__source:
+            continue
+        try:
+            converted.append((
+                typed,
+                option_value,
+                _convert_option_value(typed.__option,
+                                      option_value,
+                                      typed.__converter,
+                                      typed.__required and check_required),
+            ))
+        except Error as exception:
+            errors.append(str(exception))
+
+    if errors:
+        raise Error('Invalid configuration: {0}'.format('; '.join(errors)))
+
+    for typed, option_value, typed_value in converted:
+        if option_value is not None:
+            typed.__source = option_value
+            typed.__cache = typed_value
+
+
+cdef class ConfigurationWatcher(object):
+    """Configuration watcher reloads configuration, when its files change.
+
+    Watcher polls files in a background daemon thread. It is created by
+    :py:meth:`Configuration.watch` and could be used as a context manager:
+
+    .. code-block:: python
+
+        with config.watch(interval=5.0):
+            ...
+    """
+
+    def __init__(self, Configuration configuration, interval=1.0,
+                 on_error=None):
+        """Initializer.
+
+        :param configuration: Watched configuration.
+        :type configuration: :py:class:`Configuration`
+
+        :param interval: Polling interval in seconds.
+        :type interval: float
+
+        :param on_error: Callable, that gets exceptions of reloading.
+        :type on_error: callable
+        """
+        self.__configuration = configuration
+        self.__interval = interval
+        self.__on_error = on_error
+        self.__stopped = threading.Event()
+        self.__thread = None
+        super(ConfigurationWatcher, self).__init__()
+
+    def __enter__(self):
+        """Return watcher."""
+        return self
+
+    def __exit__(self, *_):
+        """Stop watching."""
+        self.stop()
+
+    @property
+    def running(self):
+        """Return ``True`` if watcher is running."""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self):
+        """Start watching.
+
+        :rtype: None
+        """
+        if self.__thread is not None:
+            raise Error('Watcher {0} is already started'.format(self))
+        self.__thread = threading.Thread(target=self._run,
+                                         name='ConfigurationWatcher')
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """Stop watching and wait for the watching thread.
+
+        :rtype: None
+        """
+        self.__stopped.set()
+        if (self.__thread is not None and
+                self.__thread is not threading.current_thread()):
+            self.__thread.join()
+
+    def _run(self):
+        """Poll configuration files."""
+        while not self.__stopped.wait(self.__interval):
+            try:
+                self.__configuration.reload()
+            except Exception as exception:
+                if self.__on_error is not None:
+                    self.__on_error(exception)
+
+
+cdef class _ConfigurationSource(object):
+    """Configuration file, that is loaded into configuration.
+
+    Layer is an overriding provider of configuration, that file is loaded
+    into, or ``None`` if file is loaded under all overriding providers.
+    """
+
+    cdef str kind
+    cdef object filepath
+    cdef object loader
+    cdef tuple keys
+    cdef object stamp
+    cdef object value
+    cdef object layer
+
+    def __init__(self, str kind, filepath, loader, tuple keys, stamp, value,
+                 layer):
+        self.kind = kind
+        self.filepath = filepath
+        self.loader = loader
+        self.keys = keys
+        self.stamp = stamp
+        self.value = value
+        self.layer = layer
+
+    cdef bint refresh(self, bint force) except -1:
+        """Parse file again, if it has changed."""
+        stamp = _get_file_stamp(self.filepath)
+        if stamp == self.stamp and not force:
+            return False
+
+        value = None
+        if stamp is not None:
+            try:
+                value = _load_configuration_file(self.kind, self.filepath,
+                                                 self.loader)
+            except IOError:
+                stamp = None
+
+        self.stamp = stamp
+        self.value = value
+        return True
+
+
+cdef _ConfigurationSource _copy_configuration_source(
+        _ConfigurationSource source, dict memo):
+    layer = None
+    if source.layer is not None:
+        layer = memo.get(id(source.layer), source.layer)
+    return _ConfigurationSource(source.kind, source.filepath, source.loader,
+                                source.keys, source.stamp, source.value,
+                                layer)
+
+
+cdef int _get_layer_index(list layers, object layer,
+                          dict replaced) except -2:
+    """Return index of the first layer, that file changes are applied to.
+
+    If layer of file is not in overriding providers anymore, ``len(layers)``
+    is returned, so changes are not applied at all.
+    """
+    if layer is None:
+        return 0
+    layer = replaced.get(id(layer), layer)
+    for index, current in enumerate(layers):
+        if current is layer:
+            return index
+    return len(layers)
+
+
+cdef void _add_option_source(ConfigurationOption option, str kind,
+                             object filepath, object loader, object stamp,
+                             object value) except *:
+    """Remember file, that is loaded into configuration option."""
+    root = option.__root_ref()
+    (<Configuration?>root)._add_source(
+        kind, filepath, loader, _get_option_keys(option.__name, True), stamp,
+        value,
+    )
+
+
+cdef object _get_file_stamp(object filepath):
+    """Return modification stamp of file or ``None`` if it does not exist."""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return (_get_file_mtime(stat), stat.st_size, stat.st_ino)
+
+
+cdef object _get_file_mtime(object stat):
+    """Return modification time of file in the most precise units.
+
+    Nanoseconds are not available on Python 2, there seconds are used.
+    """
+    mtime = getattr(stat, 'st_mtime_ns', None)
+    if mtime is None:
+        mtime = stat.st_mtime
+    return mtime
+
+
+cdef object _load_configuration_file(str kind, object filepath,
+                                     object loader):
+    if kind == 'yaml':
+        return _load_yaml_file(filepath, loader)
+    return _load_ini_file(filepath)
+
+
+cdef object _load_yaml_file(object filepath, object loader):
+    """Return configuration loaded from the yaml file."""
+    if yaml is None:
+        raise Error(
+            'Unable to load yaml configuration - PyYAML is not installed. '
+            'Install PyYAML or install Dependency Injector with yaml extras: '
+            '"pip install dependency-injector[yaml]"'
+        )
+
+    if loader is None:
+        loader = getattr(yaml, 'CLoader', yaml.Loader)
+
+    if _yaml_cache_enabled:
+        return _load_cached_yaml_file(filepath, loader)
+
+    with open(filepath) as opened_file:
+        return yaml.load(opened_file, loader)
+
+
+cdef object _load_cached_yaml_file(object filepath, object loader):
+    """Return configuration loaded from the yaml file or its parsed cache.
+
+    Cache keeps configuration with environment variable markers, that are not
+    expanded, and paths of the markers. Markers are expanded on every load.
+    """
+    cdef list markers
+
+    stat = os.stat(filepath)
+    key = (os.path.abspath(filepath), _get_file_mtime(stat), stat.st_size,
+           '.'.join((loader.__module__, loader.__name__)))
+    cache_path = _get_yaml_cache_path(filepath, loader)
+
+    cached = _read_yaml_cache(cache_path)
+    if (isinstance(cached, tuple) and len(cached) == 4 and
+            cached[0] == _YAML_CACHE_FORMAT and cached[1] == key):
+        config, markers = cached[2], cached[3]
+    else:
+        with open(filepath) as opened_file:
+            config = yaml.load(opened_file, _get_yaml_marking_loader(loader))
+        markers = list()
+        try:
+            config = _collect_yaml_env_markers(config, tuple(), markers)
+        except _YamlNotCacheable:
+            config, markers = None, None
+        _write_yaml_cache(cache_path,
+                          (_YAML_CACHE_FORMAT, key, config, markers))
+
+    if markers is None:
+        with open(filepath) as opened_file:
+            return yaml.load(opened_file, loader)
+    return _expand_yaml_env_markers(config, markers)
+
+
+cdef object _get_yaml_marking_loader(object loader):
+    """Return subclass of loader, that keeps environment variable markers."""
+    marking_loader = _yaml_marking_loaders.get(loader)
+    if marking_loader is None:
+        marking_loader = type(loader.__name__, (loader,), dict())
+        marking_loader.add_constructor('!path',
+                                       _yaml_env_marker_keeping_constructor)
+        _yaml_marking_loaders[loader] = marking_loader
+    return marking_loader
+
+
+cdef object _collect_yaml_env_markers(object value, tuple path, list markers):
+    """Replace markers with plain strings and collect their paths.
+
+    Markers in keys of mappings and in sets are not collected, since their
+    expansion changes keys. :py:class:`_YamlNotCacheable` is raised for them.
+    """
+    if isinstance(value, _YamlEnvMarker):
+        markers.append(path)
+        return str(value)
+    if isinstance(value, (dict, set, frozenset)):
+        if any(isinstance(key, _YamlEnvMarker) for key in value):
+            raise _YamlNotCacheable()
+    if isinstance(value, dict):
+        for key, item in list(value.items()):
+            value[key] = _collect_yaml_env_markers(item, path + (key,),
+                                                   markers)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            value[index] = _collect_yaml_env_markers(item, path + (index,),
+                                                     markers)
+    return value
+
+
+cdef object _expand_yaml_env_markers(object config, list markers):
+    """Expand environment variable markers by their paths."""
+    for path in markers:
+        if not path:
+            return os.path.expandvars(config)
+        container = config
+        for key in path[:-1]:
+            container = container[key]
+        container[path[-1]] = os.path.expandvars(container[path[-1]])
+    return config
+
+
+cdef object _get_yaml_cache_path(object filepath, object loader):
+    """Return path of parsed cache of the yaml file."""
+    filepath = os.path.abspath(filepath)
+    loader_name = loader.__name__.lower()
+    if _yaml_cache_dir is None:
+        return os.path.join(
+            os.path.dirname(filepath),
+            '__pycache__',
+            '{0}.{1}.pickle'.format(os.path.basename(filepath), loader_name),
+        )
+    digest = hashlib.sha1(filepath.encode('utf-8')).hexdigest()
+    return os.path.join(_yaml_cache_dir,
+                        '{0}.{1}.pickle'.format(digest, loader_name))
+
+
+cdef object _read_yaml_cache(object cache_path):
+    """Return content of the cache file, or ``None`` if it is not readable."""
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            return pickle.load(cache_file)
+    except Exception:
+        return None
+
+
+cdef void _write_yaml_cache(object cache_path, object content) except *:
+    """Write cache file atomically. Errors are ignored."""
+    directory = os.path.dirname(cache_path)
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        descriptor, temp_path = tempfile.mkstemp(dir=directory,
+                                                 suffix='.tmp')
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(descriptor, 'wb') as temp_file:
+            pickle.dump(content, temp_file, pickle.HIGHEST_PROTOCOL)
+        _replace_file(temp_path, cache_path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+cdef dict _load_ini_file(object filepath):
+    """Return configuration loaded from the ini file."""
+    parser = _parse_ini_file(filepath)
+
+    config = {}
+    for section in parser.sections():
+        config[section] = dict(parser.items(section))
+    return config
+
+
+cdef object _patch_configuration_source(object value,
+                                        _ConfigurationSource source,
+                                        object old_value):
+    """Return value with changes of source applied.
+
+    Value is not modified: dictionaries on the changed paths are copied.
+    """
+    if source.value is None:
+        return value
+    if old_value is None:
+        old_value = _MISSING
+
+    current = value
+    for key in source.keys:
+        if not isinstance(current, dict):
+            current = _MISSING
+            break
+        current = current.get(key, _MISSING)
+
+    patched = _patch_value(current, old_value, source.value)
+    if patched is current:
+        return value
+    return _set_path_value(value, source.keys, 0, patched)
+
+
+cdef object _patch_value(object current, object old_value,
+                         object new_value):
+    """Return current value with changes from old to new value applied.
+
+    Current value is replaced only, if it is still equal to the old value.
+    Dictionaries are patched key by key. Keys, that are removed from new
+    value, are kept.
+    """
+    cdef dict patched = None
+
+    if new_value is old_value:
+        return current
+    if current is old_value or (current is not _MISSING and
+                                old_value is not _MISSING and
+                                _safe_equal(current, old_value)):
+        return new_value
+    if not isinstance(current, dict) or not isinstance(new_value, dict):
+        return current
+
+    if not isinstance(old_value, dict):
+        old_value = dict()
+    for key, value in new_value.items():
+        current_value = current.get(key, _MISSING)
+        patched_value = _patch_value(current_value,
+                                     old_value.get(key, _MISSING), value)
+        if patched_value is not current_value:
+            if patched is None:
+                patched = dict(current)
+            patched[key] = patched_value
+
+    if patched is None:
+        return current
+    return patched
+
+
+cdef object _set_path_value(object value, tuple keys, int index,
+                            object new_value):
+    """Return copy of value with new value by path keys."""
+    if index == len(keys):
+        return new_value
+
+    copied = dict(value) if isinstance(value, dict) else dict()
+    copied[keys[index]] = _set_path_value(copied.get(keys[index]), keys,
+                                          index + 1, new_value)
+    return copied
+
+
+cdef void _refresh_option_cache(ConfigurationOption option,
+                                unsigned long long old_version) except *:
+    """Refresh option cache after configuration is changed.
+
+    Cached value is kept, if the new value is equal to it, so only caches of
+    changed options are updated. Options, that are not cached, are skipped.
+    """
+    if not option.__cacheable or option.__cache_version != old_version:
+        return
+
+    old_value = option.__cache
+    new_value = option._resolve()
+    if new_value is not old_value and _safe_equal(new_value, old_value):
+        option.__cache = old_value
+
+    for child in list(option.__children.values()):
+        _refresh_option_cache(child, old_version)
+
+
+cdef bint _safe_equal(object value1, object value2):
+    try:
+        return bool(value1 == value2)
+    except Exception:
+        return False
+
+
+cdef void _remove_subscription(Configuration root, Provider provider,
+                               object callback) except *:
+    for subscription in list(root.__subscriptions):
+        if subscription[0] is provider and subscription[1] == callback:
+            root.__subscriptions.remove(subscription)
+            return
+    raise Error('Callback {0} is not subscribed to {1}'.format(callback,
+                                                               provider))
+
+
+cdef void _notify_subscribers(list subscriptions, list old_values) except *:
+    """Call subscribers of changed values.
+
+    All subscribers are called, even if some of them fail. First exception is
+    raised after that.
+    """
+    error = None
+    for (provider, callback), old_value in zip(subscriptions, old_values):
+        new_value = provider()
+        if new_value is old_value or _safe_equal(new_value, old_value):
+            continue
+        try:
+            callback(old_value, new_value)
+        except Exception as exception:
+            if error is None:
+                error = exception
+    if error is not None:
+        raise error
+
 
 cdef class Factory(Provider):
     r"""Factory provider creates new instance on every call.
@@ -1569,12 +2978,10 @@ cdef class Factory(Provider):
 
         cls = self.cls
         if isinstance(cls, Provider):
-            cls = deepcopy(cls, memo)
+            cls = _deepcopy(cls, memo)
 
-        copied = self.__class__(cls,
-                                *deepcopy(self.args, memo),
-                                **deepcopy(self.kwargs, memo))
-        copied.set_attributes(**deepcopy(self.attributes, memo))
+        copied = self.__class__(cls)
+        _copy_factory_injections(self, copied, memo)
 
         self._copy_overridings(copied, memo)
 
@@ -1702,10 +3109,96 @@ cdef class Factory(Provider):
         self.__attributes_len = len(self.__attributes)
         return self
 
+    def many(self, int n, *args, **kwargs):
+        """Return list of ``n`` new instances.
+
+        Context arguments are passed to every instance. Overriding is checked
+        once for the whole batch.
+
+        :param n: Number of instances.
+        :type n: int
+
+        :rtype: list
+        """
+        cdef int index
+        cdef list instances = list()
+        cdef object overriding = self._get_batch_overriding()
+
+        if overriding is not None:
+            for index in range(n):
+                instances.append(overriding(*args, **kwargs))
+        else:
+            for index in range(n):
+                instances.append(self._provide(args, kwargs.copy()))
+
+        return instances
+
+    def map(self, iterable):
+        """Return list of new instances, one per keyword arguments mapping.
+
+        Overriding is checked once for the whole batch.
+
+        :param iterable: Keyword context arguments of every instance.
+        :type iterable: iterable[dict]
+
+        :rtype: list
+        """
+        cdef list instances = list()
+        cdef object overriding = self._get_batch_overriding()
+        cdef object kwargs
+
+        if overriding is not None:
+            for kwargs in iterable:
+                instances.append(overriding(**kwargs))
+        else:
+            for kwargs in iterable:
+                instances.append(self._provide(tuple(), dict(kwargs)))
+
+        return instances
+
+    def imap(self, iterable):
+        """Return generator of new instances, one per keyword arguments mapping.
+
+        Streaming version of :py:meth:`Factory.map`. Overriding is checked
+        once, when generator is started.
+
+        :param iterable: Keyword context arguments of every instance.
+        :type iterable: iterable[dict]
+
+        :rtype: generator
+        """
+        cdef object overriding = self._get_batch_overriding()
+        cdef object kwargs
+
+        if overriding is not None:
+            for kwargs in iterable:
+                yield overriding(**kwargs)
+        else:
+            for kwargs in iterable:
+                yield self._provide(tuple(), dict(kwargs))
+
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return (self.__instantiator.related +
+                _filter_providers(tuple(self.attributes.values())) +
+                super(Factory, self).related)
+
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return new instance."""
         return __factory_call(self, args, kwargs)
 
+    cdef object _get_batch_overriding(self):
+        """Return callable that creates instances of batch instead of factory.
+
+        It is an overriding provider, if any, or factory itself, if its
+        subclass implements custom ``__call__()`` or if instrumentation or
+        tracing is enabled, so every instance creation is recorded.
+        """
+        if CALL_HOOKS_ENABLED or type(self).__call__ is not Provider.__call__:
+            return self
+        return __get_overriding(self)
+
 
 cdef class DelegatedFactory(Factory):
     """Factory that is injected "as is".
@@ -1744,9 +3237,12 @@ cdef class AbstractFactory(Factory):
 
         Callable interface implementation.
         """
-        if self.__last_overriding is None:
+        cdef object overriding = __get_overriding(self)
+        if overriding is None:
             raise Error('{0} must be overridden before calling'.format(self))
-        return self.__last_overriding(*args, **kwargs)
+        if CALL_HOOKS_ENABLED:
+            return _call_with_hooks(self, overriding, args, kwargs)
+        return overriding(*args, **kwargs)
 
     def override(self, provider):
         """Override provider with another provider.
@@ -1764,6 +3260,22 @@ cdef class AbstractFactory(Factory):
                         '{1} providers'.format(self, Factory))
         return super(AbstractFactory, self).override(provider)
 
+    def override_in_context(self, provider):
+        """Override provider with another provider in current context only.
+
+        :param provider: Overriding provider.
+        :type provider: :py:class:`Provider`
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+
+        :return: Context overriding context.
+        :rtype: :py:class:`ContextOverridingContext`
+        """
+        if not isinstance(provider, Factory):
+            raise Error('{0} must be overridden only by '
+                        '{1} providers'.format(self, Factory))
+        return super(AbstractFactory, self).override_in_context(provider)
+
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return result of provided callable's call."""
         raise NotImplementedError('Abstract provider forward providing logic '
@@ -1842,7 +3354,10 @@ cdef class FactoryAggregate(Provider):
 
         Callable interface implementation.
         """
-        return self.__get_factory(factory_name)(*args, **kwargs)
+        factory = self.__get_factory(factory_name)
+        if CALL_HOOKS_ENABLED:
+            return _call_with_hooks(self, factory, args, kwargs)
+        return factory(*args, **kwargs)
 
     def __getattr__(self, factory_name):
         """Return aggregated factory."""
@@ -1860,6 +3375,12 @@ cdef class FactoryAggregate(Provider):
         """Return dictionary of factories, read-only."""
         return self.__factories
 
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return (tuple(self.__factories.values()) +
+                super(FactoryAggregate, self).related)
+
     def override(self, _):
         """Override provider with another provider.
 
@@ -1871,6 +3392,17 @@ cdef class FactoryAggregate(Provider):
         raise Error(
             '{0} providers could not be overridden'.format(self.__class__))
 
+    def override_in_context(self, _):
+        """Override provider with another provider in current context only.
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+
+        :return: Context overriding context.
+        :rtype: :py:class:`ContextOverridingContext`
+        """
+        raise Error(
+            '{0} providers could not be overridden'.format(self.__class__))
+
     cdef Factory __get_factory(self, str factory_name):
         if factory_name not in self.__factories:
             raise NoSuchProviderError(
@@ -1915,12 +3447,12 @@ cdef class BaseSingleton(Provider):
 
         cls = self.cls
         if isinstance(cls, Provider):
-            cls = deepcopy(cls, memo)
+            cls = _deepcopy(cls, memo)
 
-        copied = self.__class__(cls,
-                                *deepcopy(self.args, memo),
-                                **deepcopy(self.kwargs, memo))
-        copied.set_attributes(**deepcopy(self.attributes, memo))
+        copied = self.__class__(cls)
+        _copy_factory_injections(self.__instantiator,
+                                 (<BaseSingleton?>copied).__instantiator,
+                                 memo)
 
         self._copy_overridings(copied, memo)
 
@@ -2024,6 +3556,11 @@ cdef class BaseSingleton(Provider):
         self.__instantiator.clear_attributes()
         return self
 
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return self.__instantiator.related + super(BaseSingleton, self).related
+
     def reset(self):
         """Reset cached instance, if any.
 
@@ -2031,6 +3568,9 @@ cdef class BaseSingleton(Provider):
         """
         raise NotImplementedError()
 
+    cdef void _forget_instance(self, object instance) except *:
+        """Forget cached instance, if it is still cached."""
+
 
 cdef class Singleton(BaseSingleton):
     """Singleton provider returns same instance on every call.
@@ -2083,10 +3623,15 @@ cdef class Singleton(BaseSingleton):
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return single instance."""
         if self.__storage is None:
-            self.__storage = __factory_call(self.__instantiator,
-                                            args, kwargs)
+            self.__storage = _get_singleton_instance(
+                self, __factory_call(self.__instantiator, args, kwargs))
         return self.__storage
 
+    cdef void _forget_instance(self, object instance) except *:
+        """Forget cached instance, if it is still cached."""
+        if self.__storage is instance:
+            self.__storage = None
+
 
 cdef class DelegatedSingleton(Singleton):
     """Delegated singleton is injected "as is".
@@ -2111,22 +3656,41 @@ cdef class DelegatedSingleton(Singleton):
 
 
 cdef class ThreadSafeSingleton(BaseSingleton):
-    """Thread-safe singleton provider."""
+    """Thread-safe singleton provider.
 
-    storage_lock = threading.RLock()
-    """Storage reentrant lock.
+    Every :py:class:`ThreadSafeSingleton` uses its own reentrant lock, so
+    creation of one singleton does not block resolving of the others. Lock is
+    taken only while instance is not created yet. When instance is created,
+    it is returned without locking.
 
-    :type: :py:class:`threading.RLock`
-    """
+    Shared lock could be configured for all instances of the provider class
+    by defining :py:attr:`ThreadSafeSingleton.storage_lock` in a subclass:
 
-    def __init__(self, provides, *args, **kwargs):
-        """Initializer.
+    .. code-block:: python
 
-        :param provides: Provided type.
-        :type provides: type
+        class SharedLockSingleton(ThreadSafeSingleton):
+            storage_lock = threading.RLock()
+
+    .. py:attribute:: storage_lock
+
+        Storage reentrant lock that is shared by all instances of the provider
+        class. If it is ``None``, every provider creates its own lock.
+
+        :type: :py:class:`threading.RLock` | None
+    """
+
+    storage_lock = None
+
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
+
+        :param provides: Provided type.
+        :type provides: type
         """
         self.__storage = None
         self.__storage_lock = self.__class__.storage_lock
+        if self.__storage_lock is None:
+            self.__storage_lock = threading.RLock()
         super(ThreadSafeSingleton, self).__init__(provides, *args, **kwargs)
 
     def reset(self):
@@ -2134,15 +3698,28 @@ cdef class ThreadSafeSingleton(BaseSingleton):
 
         :rtype: None
         """
-        self.__storage = None
+        with self.__storage_lock:
+            self.__storage = None
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return single instance."""
+        cdef object storage
+
+        storage = self.__storage
+        if storage is not None:
+            return storage
+
         with self.__storage_lock:
             if self.__storage is None:
-                self.__storage = __factory_call(self.__instantiator,
-                                                args, kwargs)
-        return self.__storage
+                self.__storage = _get_singleton_instance(
+                    self, __factory_call(self.__instantiator, args, kwargs))
+            return self.__storage
+
+    cdef void _forget_instance(self, object instance) except *:
+        """Forget cached instance, if it is still cached."""
+        with self.__storage_lock:
+            if self.__storage is instance:
+                self.__storage = None
 
 
 cdef class DelegatedThreadSafeSingleton(ThreadSafeSingleton):
@@ -2170,6 +3747,10 @@ cdef class DelegatedThreadSafeSingleton(ThreadSafeSingleton):
 cdef class ThreadLocalSingleton(BaseSingleton):
     """Thread-local singleton provides single objects in scope of thread.
 
+    Every provider has its own slot in the storage of every thread, so
+    instance is looked up without locking. Instance is released, when its
+    thread finishes.
+
     .. py:attribute:: provided_type
 
         If provided type is defined, provider checks that providing class is
@@ -2192,27 +3773,89 @@ cdef class ThreadLocalSingleton(BaseSingleton):
         :param provides: Provided type.
         :type provides: type
         """
-        self.__storage = threading.local()
+        self.__slot = next(_thread_local_slots_counter)
         super(ThreadLocalSingleton, self).__init__(provides, *args, **kwargs)
 
+    def __dealloc__(self):
+        """Release instances of provider in all threads."""
+        if self.__slot is not None and _thread_slots_registry is not None:
+            _release_thread_local_slot(self.__slot)
+
     def reset(self):
-        """Reset cached instance, if any.
+        """Reset cached instance of current thread, if any.
+
+        :rtype: None
+        """
+        _get_thread_slots().instances.pop(self.__slot, None)
+
+    def reset_all(self):
+        """Reset cached instances of all threads.
 
         :rtype: None
         """
-        del self.__storage.instance
+        _release_thread_local_slot(self.__slot)
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return single instance."""
-        cdef object instance
+        cdef dict instances = _get_thread_slots().instances
+        cdef PyObject* instance = PyDict_GetItem(instances, self.__slot)
+        cdef object created
 
-        try:
-            instance = self.__storage.instance
-        except AttributeError:
-            instance = __factory_call(self.__instantiator, args, kwargs)
-            self.__storage.instance = instance
-        finally:
-            return instance
+        if instance != NULL:
+            return <object>instance
+
+        created = _get_singleton_instance(
+            self, __factory_call(self.__instantiator, args, kwargs))
+        instances[self.__slot] = created
+        return created
+
+    cdef void _forget_instance(self, object instance) except *:
+        """Forget cached instance of current thread, if it is still cached."""
+        cdef dict instances = _get_thread_slots().instances
+
+        if instances.get(self.__slot) is instance:
+            del instances[self.__slot]
+
+
+cdef class _ThreadSlots(object):
+    """Storage of thread-local singletons instances of a thread.
+
+    Storage is kept in the dictionary of thread state, so it is released by
+    interpreter when thread finishes.
+    """
+
+    cdef dict instances
+    cdef object __weakref__
+
+    def __init__(self):
+        self.instances = dict()
+
+
+cdef inline _ThreadSlots _get_thread_slots():
+    """Return storage of thread-local singletons of current thread."""
+    cdef dict thread_dict = <dict>PyThreadState_GetDict()
+    cdef PyObject* slots = PyDict_GetItem(thread_dict, _THREAD_SLOTS_KEY)
+    cdef _ThreadSlots created
+
+    if slots != NULL:
+        return <_ThreadSlots>slots
+
+    created = _ThreadSlots()
+    with _thread_slots_lock:
+        _thread_slots_registry.add(created)
+    thread_dict[_THREAD_SLOTS_KEY] = created
+    return created
+
+
+cdef void _release_thread_local_slot(object slot) except *:
+    """Drop instances of thread-local singleton in all threads."""
+    cdef _ThreadSlots thread_slots
+
+    with _thread_slots_lock:
+        registered = list(_thread_slots_registry)
+
+    for thread_slots in registered:
+        thread_slots.instances.pop(slot, None)
 
 
 cdef class DelegatedThreadLocalSingleton(ThreadLocalSingleton):
@@ -2237,109 +3880,58 @@ cdef class DelegatedThreadLocalSingleton(ThreadLocalSingleton):
     __IS_DELEGATED__ = True
 
 
-cdef class AbstractSingleton(BaseSingleton):
-    """Abstract singleton provider.
-
-    :py:class:`AbstractSingleton` is a :py:class:`Singleton` provider that must
-    be explicitly overridden before calling.
-
-    Overriding of :py:class:`AbstractSingleton` is possible only by another
-    :py:class:`BaseSingleton` provider.
-    """
-
-    def __call__(self, *args, **kwargs):
-        """Return provided object.
+cdef class ContextLocalSingleton(BaseSingleton):
+    """Context-local singleton provides single objects in scope of context.
 
-        Callable interface implementation.
-        """
-        if self.__last_overriding is None:
-            raise Error('{0} must be overridden before calling'.format(self))
-        return self.__last_overriding(*args, **kwargs)
+    Instance is stored in :py:class:`contextvars.ContextVar`, so every
+    asyncio task or thread gets its own instance. Tasks that are created from
+    the context, where instance is already created, share it.
 
-    def override(self, provider):
-        """Override provider with another provider.
+    Inside of :py:class:`Scope` instance is cached in the scope. All tasks,
+    that are created in the scope, share the instance and it is torn down,
+    when scope is closed:
 
-        :param provider: Overriding provider.
-        :type provider: :py:class:`Provider`
+    .. code-block:: python
 
-        :raise: :py:exc:`dependency_injector.errors.Error`
+        session = ContextLocalSingleton(Session).set_teardown(Session.close)
 
-        :return: Overriding context.
-        :rtype: :py:class:`OverridingContext`
-        """
-        if not isinstance(provider, BaseSingleton):
-            raise Error('{0} must be overridden only by '
-                        '{1} providers'.format(self, BaseSingleton))
-        return super(AbstractSingleton, self).override(provider)
+        async with Scope():
+            assert session() is session()
+        # session is closed
 
-    def reset(self):
-        """Reset cached instance, if any.
+    Requires Python 3.7+.
 
-        :rtype: None
-        """
-        if self.__last_overriding is None:
-            raise Error('{0} must be overridden before calling'.format(self))
-        return self.__last_overriding.reset()
+    .. py:attribute:: provided_type
 
+        If provided type is defined, provider checks that providing class is
+        its subclass.
 
-cdef class SingletonDelegate(Delegate):
-    """Singleton delegate injects delegating singleton "as is".
+        :type: type | None
 
-    .. py:attribute:: provides
+    .. py:attribute:: cls
+       :noindex:
 
-        Value that have to be provided.
+        Class that provides object.
+        Alias for :py:attr:`provides`.
 
-        :type: object
+        :type: type
     """
 
-    def __init__(self, singleton):
+    def __init__(self, provides, *args, **kwargs):
         """Initializer.
 
-        :param singleton: Value that have to be provided.
-        :type singleton: py:class:`BaseSingleton`
+        :param provides: Provided type.
+        :type provides: type
         """
-        if isinstance(singleton, BaseSingleton) is False:
-            raise Error('{0} can wrap only {1} providers'.format(
-                self.__class__, BaseSingleton))
-        super(SingletonDelegate, self).__init__(singleton)
-
-
-cdef class List(Provider):
-    """List provider provides a list of values.
-
-    :py:class:`List` provider is needed for injecting a list of dependencies. It handles
-    positional argument injections the same way as :py:class:`Factory` provider.
-
-    Keyword argument injections are not supported.
-
-    .. code-block:: python
-
-        dispatcher_factory = Factory(
-            Dispatcher,
-            modules=List(
-                Factory(ModuleA, dependency_a),
-                Factory(ModuleB, dependency_b),
-            ),
-        )
-
-        dispatcher = dispatcher_factory()
-
-        # is equivalent to:
+        if contextvars is None:
+            raise Error('Package contextvars is not available')
 
-        dispatcher = Dispatcher(
-            modules=[
-                ModuleA(dependency_a),
-                ModuleB(dependency_b),
-            ],
+        self.__storage = contextvars.ContextVar(
+            'context_local_singleton_{0}'.format(hex(id(self))),
+            default=_NOT_CREATED,
         )
-    """
-
-    def __init__(self, *args):
-        """Initializer."""
-        self.__args = tuple()
-        self.__args_len = 0
-        self.set_args(*args)
-        super(List, self).__init__()
+        self.__teardown = None
+        super(ContextLocalSingleton, self).__init__(provides, *args, **kwargs)
 
     def __deepcopy__(self, memo):
         """Create and return full copy of provider."""
@@ -2347,383 +3939,3258 @@ cdef class List(Provider):
         if copied is not None:
             return copied
 
-        copied = self.__class__(*deepcopy(self.args, memo))
-        self._copy_overridings(copied, memo)
-
+        copied = super(ContextLocalSingleton, self).__deepcopy__(memo)
+        (<ContextLocalSingleton?>copied).__teardown = self.__teardown
         return copied
 
-    def __str__(self):
-        """Return string representation of provider.
-
-        :rtype: str
-        """
-        return represent_provider(provider=self, provides=list(self.args))
-
     @property
-    def args(self):
-        """Return positional argument injections."""
-        cdef int index
-        cdef PositionalInjection arg
-        cdef list args
+    def teardown(self):
+        """Return teardown callable."""
+        return self.__teardown
 
-        args = list()
-        for index in range(self.__args_len):
-            arg = self.__args[index]
-            args.append(arg.__value)
-        return tuple(args)
+    def set_teardown(self, teardown):
+        """Set teardown callable.
 
-    def add_args(self, *args):
-        """Add positional argument injections.
+        Teardown callable is called with instance, when scope that cached the
+        instance is closed. If it returns awaitable, scope has to be closed
+        asynchronously.
+
+        :param teardown: Teardown callable.
+        :type teardown: callable | None
 
         :return: Reference ``self``
         """
-        self.__args += parse_positional_injections(args)
-        self.__args_len = len(self.__args)
+        self.__teardown = teardown
         return self
 
-    def set_args(self, *args):
-        """Set positional argument injections.
+    def reset(self):
+        """Reset cached instance of current scope or context, if any.
 
-        Existing positional argument injections are dropped.
+        Instance is not torn down.
 
-        :return: Reference ``self``
+        :rtype: None
         """
-        self.__args = parse_positional_injections(args)
-        self.__args_len = len(self.__args)
-        return self
+        cdef Scope scope = _get_scope(self)
 
-    def clear_args(self):
-        """Drop positional argument injections.
+        if scope is not None:
+            scope.__instances.pop(self, None)
+        else:
+            self.__storage.set(_NOT_CREATED)
 
-        :return: Reference ``self``
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return single instance."""
+        cdef Scope scope = _get_scope(self)
+        cdef PyObject* instance
+        cdef object created
+
+        if scope is not None:
+            instance = PyDict_GetItem(scope.__instances, self)
+            if instance != NULL:
+                return <object>instance
+            created = _get_singleton_instance(
+                self, __factory_call(self.__instantiator, args, kwargs))
+            scope.__instances[self] = created
+            return created
+
+        created = self.__storage.get()
+        if created is _NOT_CREATED:
+            created = _get_singleton_instance(
+                self, __factory_call(self.__instantiator, args, kwargs))
+            self.__storage.set(created)
+        return created
+
+    cdef void _forget_instance(self, object instance) except *:
+        """Forget cached instance of current scope or context.
+
+        Instance is forgotten only if it is still cached.
         """
-        self.__args = tuple()
-        self.__args_len = len(self.__args)
-        return self
+        cdef Scope scope = _get_scope(self)
 
-    cpdef object _provide(self, tuple args, dict kwargs):
-        """Return result of provided callable's call."""
-        return list(__provide_positional_args(args, self.__args, self.__args_len))
+        if scope is not None:
+            if scope.__instances.get(self) is instance:
+                del scope.__instances[self]
+        elif self.__storage.get() is instance:
+            self.__storage.set(_NOT_CREATED)
 
 
-cdef class Container(Provider):
-    """Container provider provides an instance of declarative container.
+cdef class DelegatedContextLocalSingleton(ContextLocalSingleton):
+    """Delegated context-local singleton is injected "as is".
 
-    .. warning::
-        Provider is experimental. Its interface may change.
-    """
+    .. py:attribute:: provided_type
 
-    def __init__(self, container_cls, container=None, **overriding_providers):
-        """Initialize provider."""
-        self.container_cls = container_cls
-        self.overriding_providers = overriding_providers
+        If provided type is defined, provider checks that providing class is
+        its subclass.
 
-        if container is None:
-            container = container_cls()
-            container.override_providers(**overriding_providers)
-        self.container = container
+        :type: type | None
 
-        super(Container, self).__init__()
+    .. py:attribute:: cls
+       :noindex:
 
-    def __deepcopy__(self, memo):
-        """Create and return full copy of provider."""
-        copied = memo.get(id(self))
-        if copied is not None:
-            return copied
+        Class that provides object.
+        Alias for :py:attr:`provides`.
 
-        copied = self.__class__(
-            self.container_cls,
-            deepcopy(self.container, memo),
-            **deepcopy(self.overriding_providers, memo),
-        )
+        :type: type
+    """
 
-        return copied
+    __IS_DELEGATED__ = True
 
-    def __getattr__(self, name):
-        """Return dependency provider."""
-        if name.startswith('__') and name.endswith('__'):
-            raise AttributeError(
-                '\'{cls}\' object has no attribute '
-                '\'{attribute_name}\''.format(cls=self.__class__.__name__,
-                                              attribute_name=name))
-        return getattr(self.container, name)
 
-    def override(self, provider):
-        """Override provider with another provider."""
-        raise Error('Provider {0} can not be overridden'.format(self))
+cdef class Scope(object):
+    """Scope of context-local singletons.
 
-    cpdef object _provide(self, tuple args, dict kwargs):
-        """Return single instance."""
-        return self.container
+    While scope is active, :py:class:`ContextLocalSingleton` providers cache
+    instances in the scope instead of the context. Scope is stored in
+    :py:class:`contextvars.ContextVar`, so it is active in current thread or
+    asyncio task and in the tasks that are created from it.
 
+    When scope is closed, instances are torn down in reverse order of their
+    creation with :py:meth:`ContextLocalSingleton.set_teardown` callables.
 
-cdef class Selector(Provider):
-    """Selector provider selects provider based on the configuration value or other callable.
+    Scope could be limited to some providers. Other providers use the scope,
+    that was active before it, or the context.
 
-    :py:class:`Selector` provider has a callable called ``selector`` and a dictionary of providers.
+    .. code-block:: python
 
-    The ``selector`` callable is provided as a first positional argument. It can be
-    :py:class:`Configuration` provider or any other callable. It has to return a string value.
-    That value is used as a key for selecting the provider from the dictionary of providers.
+        with Scope():
+            ...
 
-    The providers are provided as keyword arguments. Argument name is used as a key for
-    selecting the provider.
+        async with Scope(providers=[session]):
+            ...
 
-    .. code-block:: python
+    Requires Python 3.7+.
+    """
 
-        config = Configuration()
+    def __init__(self, providers=None):
+        """Initializer.
 
-        selector = Selector(
-            config.one_or_another,
-            one=providers.Factory(SomeClass),
-            another=providers.Factory(SomeOtherClass),
-        )
+        :param providers: Context-local singletons, that are cached in the
+                          scope. All context-local singletons are cached, if
+                          it is not defined.
+        :type providers: iterable[:py:class:`ContextLocalSingleton`]
+        """
+        if contextvars is None:
+            raise Error('Package contextvars is not available')
+
+        self.__instances = dict()
+        self.__providers = None
+        if providers is not None:
+            self.__providers = frozenset(providers)
+        self.__parent = None
+        self.__token = None
+        super(Scope, self).__init__()
+
+    def __enter__(self):
+        """Activate scope."""
+        self.activate()
+        return self
+
+    def __exit__(self, *_):
+        """Close scope and tear down its instances."""
+        self.deactivate()
+        self.close()
+
+    async def __aenter__(self):
+        """Activate scope."""
+        self.activate()
+        return self
+
+    async def __aexit__(self, *_):
+        """Close scope and tear down its instances asynchronously."""
+        self.deactivate()
+        await self.aclose()
+
+    @property
+    def instances(self):
+        """Return dictionary of instances cached in the scope.
+
+        :rtype: dict[:py:class:`ContextLocalSingleton`, object]
+        """
+        return dict(self.__instances)
+
+    @property
+    def providers(self):
+        """Return providers, that are cached in the scope.
+
+        ``None`` means that all context-local singletons are cached.
+
+        :rtype: frozenset[:py:class:`ContextLocalSingleton`] | None
+        """
+        return self.__providers
+
+    def activate(self):
+        """Make scope current in the context.
+
+        :rtype: None
+        """
+        if self.__token is not None:
+            raise Error('Scope {0} is already active'.format(self))
+        self.__parent = _current_scope.get()
+        self.__token = _current_scope.set(self)
+
+    def deactivate(self):
+        """Restore scope, that was current before activation.
+
+        :rtype: None
+        """
+        if self.__token is None:
+            raise Error('Scope {0} is not active'.format(self))
+        token, self.__token = self.__token, None
+        _current_scope.reset(token)
+
+    def close(self):
+        """Tear down instances of the scope.
+
+        All instances are torn down, even if some of teardown callables
+        fail. First exception is raised after that.
+
+        :raise: :py:exc:`dependency_injector.errors.Error` if teardown
+                callable returns awaitable.
+
+        :rtype: None
+        """
+        error = None
+        for teardown, instance in _pop_scope_teardowns(self):
+            try:
+                result = teardown(instance)
+                if _is_awaitable(result):
+                    _close_awaitable(result)
+                    raise Error('Teardown of {0} is asynchronous, use '
+                                '"async with" or aclose()'.format(instance))
+            except Exception as exception:
+                if error is None:
+                    error = exception
+        if error is not None:
+            raise error
+
+    async def aclose(self):
+        """Tear down instances of the scope asynchronously.
+
+        Awaitable results of teardown callables are awaited. All instances
+        are torn down, even if some of teardown callables fail. First
+        exception is raised after that.
+
+        :rtype: None
+        """
+        error = None
+        for teardown, instance in _pop_scope_teardowns(self):
+            try:
+                result = teardown(instance)
+                if _is_awaitable(result):
+                    await result
+            except Exception as exception:
+                if error is None:
+                    error = exception
+        if error is not None:
+            raise error
+
+
+cdef Scope _get_scope(ContextLocalSingleton provider):
+    """Return innermost active scope, that caches instances of provider."""
+    cdef Scope scope = _current_scope.get()
+
+    while (scope is not None and scope.__providers is not None and
+            provider not in scope.__providers):
+        scope = scope.__parent
+    return scope
+
+
+cdef list _pop_scope_teardowns(Scope scope):
+    """Forget instances of scope and return their teardowns in reverse order."""
+    cdef list teardowns = list()
+
+    instances, scope.__instances = scope.__instances, dict()
+    for provider, instance in reversed(list(instances.items())):
+        teardown = (<ContextLocalSingleton>provider).__teardown
+        if teardown is not None:
+            teardowns.append((teardown, instance))
+    return teardowns
+
+
+cdef void _close_awaitable(object awaitable) except *:
+    """Close coroutine, that is not going to be awaited."""
+    close = getattr(awaitable, 'close', None)
+    if close is not None:
+        close()
+
+
+cdef class AsyncSingleton(BaseSingleton):
+    """Asynchronous singleton provider awaits single instance once.
+
+    :py:class:`AsyncSingleton` provider returns awaitable on every call.
+    Instance is created by awaiting the result of the provided callable
+    (usually, coroutine function) and all asynchronous injections. Creation
+    runs only once: concurrent callers await the same in-flight future.
+    If creation fails, exception is propagated to all waiting callers and
+    instance is created again on the next call.
+
+    .. code-block:: python
+
+        async def create_session():
+            ...
+
+        session = AsyncSingleton(create_session)
+
+        async def main():
+            session1, session2 = await asyncio.gather(session(), session())
+            assert session1 is session2
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    _is_coroutine = _is_coroutine_marker
+
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
+
+        :param provides: Provided callable.
+        :type provides: callable
+        """
+        if not asyncio:
+            raise Error('Package asyncio is not available')
+
+        self.__future = None
+        super(AsyncSingleton, self).__init__(provides, *args, **kwargs)
+
+    @property
+    def initialized(self):
+        """Return ``True`` if instance is created.
+
+        :rtype: bool
+        """
+        future = self.__future
+        return (future is not None and
+                future.done() and
+                not future.cancelled() and
+                future.exception() is None)
+
+    def reset(self):
+        """Reset cached instance, if any.
+
+        Instance creation that is in progress is cancelled.
+
+        :rtype: None
+        """
+        future = self.__future
+        self.__future = None
+        if future is not None and not future.done():
+            future.cancel()
+
+    async def async_reset(self):
+        """Reset cached instance and wait for cancelled creation to finish.
+
+        :rtype: None
+        """
+        future = self.__future
+        self.reset()
+        if future is not None and not future.done():
+            await asyncio.wait((future,))
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return awaitable of single instance."""
+        return _async_singleton_provide(self, args, kwargs)
+
+
+cdef class DelegatedAsyncSingleton(AsyncSingleton):
+    """Delegated asynchronous singleton is injected "as is".
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    __IS_DELEGATED__ = True
+
+
+cdef class AbstractSingleton(BaseSingleton):
+    """Abstract singleton provider.
+
+    :py:class:`AbstractSingleton` is a :py:class:`Singleton` provider that must
+    be explicitly overridden before calling.
+
+    Overriding of :py:class:`AbstractSingleton` is possible only by another
+    :py:class:`BaseSingleton` provider.
+    """
+
+    def __call__(self, *args, **kwargs):
+        """Return provided object.
+
+        Callable interface implementation.
+        """
+        cdef object overriding = __get_overriding(self)
+        if overriding is None:
+            raise Error('{0} must be overridden before calling'.format(self))
+        if CALL_HOOKS_ENABLED:
+            return _call_with_hooks(self, overriding, args, kwargs)
+        return overriding(*args, **kwargs)
+
+    def override(self, provider):
+        """Override provider with another provider.
+
+        :param provider: Overriding provider.
+        :type provider: :py:class:`Provider`
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+
+        :return: Overriding context.
+        :rtype: :py:class:`OverridingContext`
+        """
+        if not isinstance(provider, BaseSingleton):
+            raise Error('{0} must be overridden only by '
+                        '{1} providers'.format(self, BaseSingleton))
+        return super(AbstractSingleton, self).override(provider)
+
+    def override_in_context(self, provider):
+        """Override provider with another provider in current context only.
+
+        :param provider: Overriding provider.
+        :type provider: :py:class:`Provider`
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+
+        :return: Context overriding context.
+        :rtype: :py:class:`ContextOverridingContext`
+        """
+        if not isinstance(provider, BaseSingleton):
+            raise Error('{0} must be overridden only by '
+                        '{1} providers'.format(self, BaseSingleton))
+        return super(AbstractSingleton, self).override_in_context(provider)
+
+    def reset(self):
+        """Reset cached instance, if any.
+
+        :rtype: None
+        """
+        cdef object overriding = __get_overriding(self)
+        if overriding is None:
+            raise Error('{0} must be overridden before calling'.format(self))
+        return overriding.reset()
+
+
+cdef class SingletonDelegate(Delegate):
+    """Singleton delegate injects delegating singleton "as is".
+
+    .. py:attribute:: provides
+
+        Value that have to be provided.
+
+        :type: object
+    """
+
+    def __init__(self, singleton):
+        """Initializer.
+
+        :param singleton: Value that have to be provided.
+        :type singleton: py:class:`BaseSingleton`
+        """
+        if isinstance(singleton, BaseSingleton) is False:
+            raise Error('{0} can wrap only {1} providers'.format(
+                self.__class__, BaseSingleton))
+        super(SingletonDelegate, self).__init__(singleton)
+
+
+cdef class Pool(Provider):
+    """Pool provider keeps a bounded number of instances for reuse.
+
+    :py:class:`Pool` creates instances the same way as :py:class:`Factory`
+    does, so, please follow :py:class:`Factory` documentation for getting
+    familiar with injections syntax.
+
+    Every call acquires an instance from the pool. Idle instance is reused,
+    if any. New instance is created while pool size is less than its maximum
+    size, otherwise call waits until another instance is released. Acquired
+    instance should be returned back with :py:meth:`Pool.release`:
+
+    .. code-block:: python
+
+        parsers = Pool(Parser).set_max_size(4)
+
+        with parsers.acquire() as parser:
+            parser.parse(data)
+
+        # or
+
+        parser = parsers()
+        try:
+            parser.parse(data)
+        finally:
+            parsers.release(parser)
+
+    :py:meth:`Pool.acquire` returns context manager that also supports
+    ``async with``. Waiting for released instance in ``async with`` and
+    :py:meth:`Pool.async_acquire` does not block event loop.
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+    """
+
+    provided_type = None
+
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
+
+        :param provides: Provided type.
+        :type provides: type
+        """
+        if (self.__class__.provided_type and
+                not issubclass(provides, self.__class__.provided_type)):
+            raise Error('{0} can provide only {1} instances'.format(
+                self.__class__, self.__class__.provided_type))
+
+        self.__instantiator = Factory(provides, *args, **kwargs)
+
+        self.__max_size = 10
+        self.__idle_timeout = None
+        self.__acquire_timeout = None
+        self.__health_check = None
+        self.__reset_hook = None
+
+        self.__lock = threading.Lock()
+        self.__condition = threading.Condition(self.__lock)
+        self.__sync_waiters = 0
+        self.__idle = collections.deque()
+        self.__leased = dict()
+        self.__async_waiters = collections.deque()
+        self.__size = 0
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__waits = 0
+        self.__evictions = 0
+
+        super(Pool, self).__init__()
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+
+        cls = self.cls
+        if isinstance(cls, Provider):
+            cls = _deepcopy(cls, memo)
+
+        copied = self.__class__(cls)
+        _copy_factory_injections(self.__instantiator,
+                                 (<Pool?>copied).__instantiator,
+                                 memo)
+
+        (<Pool?>copied).__max_size = self.__max_size
+        (<Pool?>copied).__idle_timeout = self.__idle_timeout
+        (<Pool?>copied).__acquire_timeout = self.__acquire_timeout
+        (<Pool?>copied).__health_check = self.__health_check
+        (<Pool?>copied).__reset_hook = self.__reset_hook
+
+        self._copy_overridings(copied, memo)
+
+        return copied
+
+    def __str__(self):
+        """Return string representation of provider.
+
+        :rtype: str
+        """
+        return represent_provider(provider=self,
+                                  provides=self.__instantiator.cls)
+
+    @property
+    def cls(self):
+        """Return provided type."""
+        return self.__instantiator.cls
+
+    @property
+    def args(self):
+        """Return positional argument injections."""
+        return self.__instantiator.args
+
+    def add_args(self, *args):
+        """Add __init__ positional argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.add_args(*args)
+        return self
+
+    def set_args(self, *args):
+        """Set __init__ positional argument injections.
+
+        Existing __init__ positional argument injections are dropped.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.set_args(*args)
+        return self
+
+    def clear_args(self):
+        """Drop __init__ positional argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.clear_args()
+        return self
+
+    @property
+    def kwargs(self):
+        """Return keyword argument injections."""
+        return self.__instantiator.kwargs
+
+    def add_kwargs(self, **kwargs):
+        """Add __init__ keyword argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.add_kwargs(**kwargs)
+        return self
+
+    def set_kwargs(self, **kwargs):
+        """Set __init__ keyword argument injections.
+
+        Existing __init__ keyword argument injections are dropped.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.set_kwargs(**kwargs)
+        return self
+
+    def clear_kwargs(self):
+        """Drop __init__ keyword argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.clear_kwargs()
+        return self
+
+    @property
+    def attributes(self):
+        """Return attribute injections."""
+        return self.__instantiator.attributes
+
+    def add_attributes(self, **kwargs):
+        """Add attribute injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.add_attributes(**kwargs)
+        return self
+
+    def set_attributes(self, **kwargs):
+        """Set attribute injections.
+
+        Existing attribute injections are dropped.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.set_attributes(**kwargs)
+        return self
+
+    def clear_attributes(self):
+        """Drop attribute injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.clear_attributes()
+        return self
+
+    @property
+    def max_size(self):
+        """Return maximum number of instances, both idle and acquired."""
+        return self.__max_size
+
+    def set_max_size(self, int max_size):
+        """Set maximum number of instances, both idle and acquired.
+
+        If pool already has more instances, extra ones are dropped when they
+        are released.
+
+        :return: Reference ``self``
+        """
+        if max_size < 1:
+            raise Error('Pool size should be positive, got {0}'.format(
+                max_size))
+        with self.__lock:
+            self.__max_size = max_size
+            self._notify_all()
+        return self
+
+    @property
+    def idle_timeout(self):
+        """Return number of seconds after which idle instance is dropped."""
+        return self.__idle_timeout
+
+    def set_idle_timeout(self, idle_timeout):
+        """Set number of seconds after which idle instance is dropped.
+
+        ``None`` means that idle instances are kept until pool is reset.
+
+        :return: Reference ``self``
+        """
+        self.__idle_timeout = idle_timeout
+        return self
+
+    @property
+    def acquire_timeout(self):
+        """Return number of seconds to wait for released instance."""
+        return self.__acquire_timeout
+
+    def set_acquire_timeout(self, acquire_timeout):
+        """Set number of seconds to wait for released instance.
+
+        If no instance is released in time, call raises
+        :py:exc:`dependency_injector.errors.Error`. ``None`` means that call
+        waits until instance is released.
+
+        :return: Reference ``self``
+        """
+        self.__acquire_timeout = acquire_timeout
+        return self
+
+    @property
+    def health_check(self):
+        """Return health check hook."""
+        return self.__health_check
+
+    def set_health_check(self, health_check):
+        """Set health check hook.
+
+        Health check is called with idle instance before returning it from
+        the pool. Instance is dropped if health check returns false value.
+
+        :return: Reference ``self``
+        """
+        self.__health_check = health_check
+        return self
+
+    @property
+    def reset_hook(self):
+        """Return reset hook."""
+        return self.__reset_hook
+
+    def set_reset_hook(self, reset_hook):
+        """Set reset hook.
+
+        Reset hook is called with released instance before returning it to
+        the pool. Instance is dropped if reset hook raises an exception.
+
+        :return: Reference ``self``
+        """
+        self.__reset_hook = reset_hook
+        return self
+
+    def acquire(self, *args, **kwargs):
+        """Return context manager that acquires instance and releases it on exit.
+
+        Context manager supports both ``with`` and ``async with`` statements.
+
+        :rtype: :py:class:`PoolContext`
+        """
+        return PoolContext(self, args, kwargs)
+
+    def async_acquire(self, *args, **kwargs):
+        """Return future of instance acquired from the pool.
+
+        Waiting for released instance does not block event loop.
+
+        :rtype: :py:class:`asyncio.Future`
+        """
+        if asyncio is None:
+            raise Error('Package asyncio is not available')
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        overriding = __get_overriding(self)
+        if overriding is not None:
+            future.set_result(overriding(*args, **kwargs))
+            return future
+
+        if self.__acquire_timeout is not None:
+            timer = loop.call_later(self.__acquire_timeout,
+                                    _set_future_exception,
+                                    future,
+                                    self._get_timeout_error())
+            future.add_done_callback(functools.partial(_cancel_timer, timer))
+        self._async_acquire_step(loop, future, args, kwargs, False)
+        return future
+
+    def release(self, instance):
+        """Return acquired instance back to the pool.
+
+        :rtype: None
+        """
+        cdef object instance_id = id(instance)
+        cdef double now
+
+        with self.__lock:
+            if self.__leased.get(instance_id) is not instance:
+                if __get_overriding(self) is not None:
+                    return
+                raise Error('Instance {0} was not acquired from {1}'.format(
+                    instance, self))
+            del self.__leased[instance_id]
+
+        if self.__reset_hook is not None:
+            try:
+                self.__reset_hook(instance)
+            except:
+                self._discard()
+                raise
+
+        with self.__lock:
+            if self.__size > self.__max_size:
+                self.__size -= 1
+                self.__evictions += 1
+                return
+            now = _monotonic()
+            self._evict_expired(now)
+            self.__idle.append((instance, now))
+            self._notify()
+
+    def reset(self):
+        """Drop idle instances.
+
+        Acquired instances are returned back to the pool as usual.
+
+        :rtype: None
+        """
+        cdef int idle_len
+
+        with self.__lock:
+            idle_len = len(self.__idle)
+            self.__idle.clear()
+            self.__size -= idle_len
+            self._notify_all()
+
+    def stats(self):
+        """Return pool statistics.
+
+        Statistics contains ``max_size``, ``size`` (number of instances),
+        ``idle`` and ``in_use`` numbers of instances, ``hits`` (idle instance
+        is reused), ``misses`` (new instance is created), ``waits`` (caller
+        waited for released instance) and ``evictions`` (instance is dropped)
+        counters.
+
+        :rtype: dict
+        """
+        with self.__lock:
+            return dict(
+                max_size=self.__max_size,
+                size=self.__size,
+                idle=len(self.__idle),
+                in_use=len(self.__leased),
+                hits=self.__hits,
+                misses=self.__misses,
+                waits=self.__waits,
+                evictions=self.__evictions,
+            )
+
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return self.__instantiator.related + super(Pool, self).related
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Acquire instance, waiting for released one if pool is exhausted."""
+        cdef object instance
+        cdef object timeout = None
+        cdef bint waited = False
+        cdef double deadline = 0.0
+
+        while True:
+            with self.__lock:
+                instance = self._acquire_nowait()
+                if instance is _POOL_EXHAUSTED:
+                    if not waited:
+                        self.__waits += 1
+                        waited = True
+                        if self.__acquire_timeout is not None:
+                            deadline = _monotonic() + self.__acquire_timeout
+                    if self.__acquire_timeout is not None:
+                        timeout = deadline - _monotonic()
+                        if timeout <= 0:
+                            raise self._get_timeout_error()
+                    self.__sync_waiters += 1
+                    try:
+                        self.__condition.wait(timeout)
+                    finally:
+                        self.__sync_waiters -= 1
+                    continue
+
+            if instance is _POOL_SLOT:
+                return self._create(args, kwargs)
+
+            if self._check_health(instance):
+                return instance
+
+    def _async_acquire_step(self, loop, future, args, kwargs, waited,
+                            waiter=None):
+        """Acquire instance for the future or wait for released one."""
+        if future.done():
+            with self.__lock:
+                self._notify()
+            return
+
+        with self.__lock:
+            instance = self._acquire_nowait()
+            if instance is _POOL_EXHAUSTED:
+                if not waited:
+                    self.__waits += 1
+                waiter = loop.create_future()
+                waiter.add_done_callback(
+                    functools.partial(self._async_acquire_step,
+                                      loop, future, args, kwargs, True))
+                self.__async_waiters.append((loop, waiter))
+                return
+
+        try:
+            if instance is _POOL_SLOT:
+                instance = self._create(args, kwargs)
+            elif not self._check_health(instance):
+                self._async_acquire_step(loop, future, args, kwargs, waited)
+                return
+        except Exception as exception:
+            future.set_exception(exception)
+            return
+
+        if future.done():
+            self.release(instance)
+        else:
+            future.set_result(instance)
+
+    cdef object _acquire_nowait(self):
+        """Take idle instance or reserve slot for new one.
+
+        Has to be called under pool lock.
+        """
+        cdef object instance
+
+        self._evict_expired(_monotonic())
+
+        if len(self.__idle) > 0:
+            instance = self.__idle.pop()[0]
+            self.__leased[id(instance)] = instance
+            self.__hits += 1
+            return instance
+
+        if self.__size < self.__max_size:
+            self.__size += 1
+            self.__misses += 1
+            return _POOL_SLOT
+
+        return _POOL_EXHAUSTED
+
+    cdef object _create(self, tuple args, dict kwargs):
+        """Create instance in reserved slot."""
+        cdef object instance
+
+        try:
+            instance = __factory_call(self.__instantiator, args, kwargs)
+        except:
+            with self.__lock:
+                self.__size -= 1
+                self.__misses -= 1
+                self._notify()
+            raise
+
+        with self.__lock:
+            if id(instance) in self.__leased:
+                self.__size -= 1
+                self.__misses -= 1
+                self._notify()
+                raise Error('Instance {0} is already acquired from {1}, pool '
+                            'instances have to be unique'.format(instance,
+                                                                 self))
+            self.__leased[id(instance)] = instance
+        return instance
+
+    cdef bint _check_health(self, object instance) except -1:
+        """Check idle instance health, dropping it if check fails."""
+        if self.__health_check is None:
+            return True
+
+        try:
+            if self.__health_check(instance):
+                return True
+        except:
+            self._discard_leased(instance)
+            raise
+
+        self._discard_leased(instance)
+        return False
+
+    cdef void _discard_leased(self, object instance) except *:
+        """Drop acquired instance."""
+        with self.__lock:
+            self.__leased.pop(id(instance), None)
+        self._discard()
+
+    cdef void _discard(self) except *:
+        """Free slot of dropped instance."""
+        with self.__lock:
+            self.__size -= 1
+            self.__evictions += 1
+            self._notify()
+
+    cdef void _evict_expired(self, double now) except *:
+        """Drop instances that are idle longer than idle timeout.
+
+        Has to be called under pool lock.
+        """
+        if self.__idle_timeout is None:
+            return
+
+        while (len(self.__idle) > 0 and
+                now - self.__idle[0][1] > self.__idle_timeout):
+            self.__idle.popleft()
+            self.__size -= 1
+            self.__evictions += 1
+
+    cdef object _get_timeout_error(self):
+        return Error('Timed out waiting for released instance of {0}'.format(
+            self))
+
+    cdef void _notify(self) except *:
+        """Wake up one waiting thread and one waiting task.
+
+        Has to be called under pool lock.
+        """
+        if self.__sync_waiters > 0:
+            self.__condition.notify()
+        self._wake_async_waiters(1)
+
+    cdef void _notify_all(self) except *:
+        """Wake up all waiting threads and tasks.
+
+        Has to be called under pool lock.
+        """
+        if self.__sync_waiters > 0:
+            self.__condition.notify_all()
+        self._wake_async_waiters(len(self.__async_waiters))
+
+    cdef void _wake_async_waiters(self, int number) except *:
+        """Wake up number of waiting tasks.
+
+        Has to be called under pool lock.
+        """
+        while number > 0 and len(self.__async_waiters) > 0:
+            loop, waiter = self.__async_waiters.popleft()
+            if waiter.done() or loop.is_closed():
+                continue
+            loop.call_soon_threadsafe(_set_future_result, waiter, None)
+            number -= 1
+
+
+cdef class PoolContext(object):
+    """Pool context acquires instance on enter and releases it on exit.
+
+    .. code-block:: python
+
+        with pool.acquire() as instance:
+            ...
+
+        async with pool.acquire() as instance:
+            ...
+    """
+
+    def __init__(self, Pool pool, tuple args, dict kwargs):
+        """Initializer.
+
+        :param pool: Pool provider.
+        :type pool: :py:class:`Pool`
+        """
+        self.__pool = pool
+        self.__args = args
+        self.__kwargs = kwargs
+        self.__instance = None
+        super(PoolContext, self).__init__()
+
+    def __enter__(self):
+        """Acquire instance."""
+        self.__instance = self.__pool(*self.__args, **self.__kwargs)
+        return self.__instance
+
+    def __exit__(self, *_):
+        """Release instance."""
+        instance, self.__instance = self.__instance, None
+        self.__pool.release(instance)
+
+    def __aenter__(self):
+        """Return future of acquired instance."""
+        future = self.__pool.async_acquire(*self.__args, **self.__kwargs)
+        if future.done():
+            self._set_instance(future)
+        else:
+            future.add_done_callback(self._set_instance)
+        return future
+
+    def __aexit__(self, *_):
+        """Release instance."""
+        self.__exit__()
+
+        future = asyncio.get_event_loop().create_future()
+        future.set_result(None)
+        return future
+
+    def _set_instance(self, future):
+        """Store acquired instance."""
+        if not future.cancelled() and future.exception() is None:
+            self.__instance = future.result()
+
+
+cdef class List(Provider):
+    """List provider provides a list of values.
+
+    :py:class:`List` provider is needed for injecting a list of dependencies. It handles
+    positional argument injections the same way as :py:class:`Factory` provider.
+
+    Keyword argument injections are not supported.
+
+    .. code-block:: python
+
+        dispatcher_factory = Factory(
+            Dispatcher,
+            modules=List(
+                Factory(ModuleA, dependency_a),
+                Factory(ModuleB, dependency_b),
+            ),
+        )
+
+        dispatcher = dispatcher_factory()
+
+        # is equivalent to:
+
+        dispatcher = Dispatcher(
+            modules=[
+                ModuleA(dependency_a),
+                ModuleB(dependency_b),
+            ],
+        )
+    """
+
+    def __init__(self, *args):
+        """Initializer."""
+        self.__args = tuple()
+        self.__args_len = 0
+        self.set_args(*args)
+        super(List, self).__init__()
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+
+        copied = self.__class__()
+        (<List?>copied).__args = _copy_positional_injections(self.__args, memo)
+        (<List?>copied).__args_len = self.__args_len
+
+        self._copy_overridings(copied, memo)
+
+        return copied
+
+    def __str__(self):
+        """Return string representation of provider.
+
+        :rtype: str
+        """
+        return represent_provider(provider=self, provides=list(self.args))
+
+    @property
+    def args(self):
+        """Return positional argument injections."""
+        cdef int index
+        cdef PositionalInjection arg
+        cdef list args
+
+        args = list()
+        for index in range(self.__args_len):
+            arg = self.__args[index]
+            args.append(arg.__value)
+        return tuple(args)
+
+    def add_args(self, *args):
+        """Add positional argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__args += parse_positional_injections(args)
+        self.__args_len = len(self.__args)
+        return self
+
+    def set_args(self, *args):
+        """Set positional argument injections.
+
+        Existing positional argument injections are dropped.
+
+        :return: Reference ``self``
+        """
+        self.__args = parse_positional_injections(args)
+        self.__args_len = len(self.__args)
+        return self
+
+    def clear_args(self):
+        """Drop positional argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__args = tuple()
+        self.__args_len = len(self.__args)
+        return self
+
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return _filter_providers(self.args) + super(List, self).related
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return result of provided callable's call."""
+        return list(__provide_positional_args(args, self.__args, self.__args_len))
+
+
+cdef class Container(Provider):
+    """Container provider provides an instance of declarative container.
+
+    .. warning::
+        Provider is experimental. Its interface may change.
+    """
+
+    def __init__(self, container_cls, container=None, **overriding_providers):
+        """Initialize provider."""
+        self.container_cls = container_cls
+        self.overriding_providers = overriding_providers
+
+        if container is None:
+            container = container_cls()
+            container.override_providers(**overriding_providers)
+        self.container = container
+
+        super(Container, self).__init__()
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+
+        copied = self.__class__(
+            self.container_cls,
+            deepcopy(self.container, memo),
+            **deepcopy(self.overriding_providers, memo),
+        )
+
+        return copied
+
+    def __getattr__(self, name):
+        """Return dependency provider."""
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(
+                '\'{cls}\' object has no attribute '
+                '\'{attribute_name}\''.format(cls=self.__class__.__name__,
+                                              attribute_name=name))
+        return getattr(self.container, name)
+
+    def override(self, provider):
+        """Override provider with another provider."""
+        raise Error('Provider {0} can not be overridden'.format(self))
+
+    def override_in_context(self, provider):
+        """Override provider with another provider in current context only."""
+        raise Error('Provider {0} can not be overridden'.format(self))
+
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return tuple(self.container.providers.values()) + super(Container, self).related
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return single instance."""
+        return self.container
+
+
+cdef class Selector(Provider):
+    """Selector provider selects provider based on the configuration value or other callable.
+
+    :py:class:`Selector` provider has a callable called ``selector`` and a dictionary of providers.
+
+    The ``selector`` callable is provided as a first positional argument. It can be
+    :py:class:`Configuration` provider or any other callable. It has to return a string value.
+    That value is used as a key for selecting the provider from the dictionary of providers.
+
+    The providers are provided as keyword arguments. Argument name is used as a key for
+    selecting the provider.
+
+    .. code-block:: python
+
+        config = Configuration()
+
+        selector = Selector(
+            config.one_or_another,
+            one=providers.Factory(SomeClass),
+            another=providers.Factory(SomeOtherClass),
+        )
 
         config.override({'one_or_another': 'one'})
         instance_1 = selector()
         assert isinstance(instance_1, SomeClass)
 
-        config.override({'one_or_another': 'another'})
-        instance_2 = selector()
-        assert isinstance(instance_2, SomeOtherClass)
+        config.override({'one_or_another': 'another'})
+        instance_2 = selector()
+        assert isinstance(instance_2, SomeOtherClass)
+    """
+
+    def __init__(self, selector, **providers):
+        """Initialize provider."""
+        self.__selector = selector
+        self.__providers = providers
+        super(Selector, self).__init__()
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+
+        copied = self.__class__(
+            deepcopy(self.__selector, memo),
+            **deepcopy(self.__providers, memo),
+        )
+        self._copy_overridings(copied, memo)
+
+        return copied
+
+    def __getattr__(self, name):
+        """Return provider."""
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(
+                '\'{cls}\' object has no attribute '
+                '\'{attribute_name}\''.format(cls=self.__class__.__name__,
+                                              attribute_name=name))
+        if name not in self.__providers:
+            raise AttributeError('Selector has no "{0}" provider'.format(name))
+
+        return self.__providers[name]
+
+    def __str__(self):
+        """Return string representation of provider.
+
+        :rtype: str
+        """
+
+        return '<{provider}({selector}, {providers}) at {address}>'.format(
+            provider='.'.join(( self.__class__.__module__, self.__class__.__name__)),
+            selector=self.__selector,
+            providers=', '.join((
+                '{0}={1}'.format(name, provider)
+                for name, provider in self.__providers.items()
+            )),
+            address=hex(id(self)),
+        )
+
+    @property
+    def providers(self):
+        """Return providers."""
+        return dict(self.__providers)
+
+    @property
+    def related(self):
+        """Return tuple of related providers."""
+        return (_filter_providers((self.__selector,)) +
+                tuple(self.__providers.values()) +
+                super(Selector, self).related)
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return single instance."""
+        selector_value = self.__selector()
+
+        if selector_value is None:
+            raise Error('Selector value is undefined')
+
+        if selector_value not in self.__providers:
+            raise Error('Selector has no "{0}" provider'.format(selector_value))
+
+        return self.__providers[selector_value](*args, **kwargs)
+
+
+cdef class Injection(object):
+    """Abstract injection class."""
+
+
+cdef class PositionalInjection(Injection):
+    """Positional injection class."""
+
+    def __init__(self, value):
+        """Initializer."""
+        self.__value = value
+        self.__is_provider = <int>is_provider(value)
+        self.__is_delegated = <int>is_delegated(value)
+        self.__call = _get_injection_call_mode(value,
+                                               self.__is_provider,
+                                               self.__is_delegated)
+        super(PositionalInjection, self).__init__()
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+        return _copy_positional_injection(self, memo)
+
+    def get_value(self):
+        """Return injection value."""
+        return __get_value(self)
+
+    def get_original_value(self):
+        """Return original value."""
+        return self.__value
+
+
+cdef class NamedInjection(Injection):
+    """Keyword injection class."""
+
+    def __init__(self, name, value):
+        """Initializer."""
+        self.__name = name
+        self.__value = value
+        self.__is_provider = <int>is_provider(value)
+        self.__is_delegated = <int>is_delegated(value)
+        self.__call = _get_injection_call_mode(value,
+                                               self.__is_provider,
+                                               self.__is_delegated)
+        super(NamedInjection, self).__init__()
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+        return _copy_named_injection(self, memo)
+
+    def get_name(self):
+        """Return injection value."""
+        return __get_name(self)
+
+    def get_value(self):
+        """Return injection value."""
+        return __get_value(self)
+
+    def get_original_value(self):
+        """Return original value."""
+        return self.__value
+
+
+cdef class LatencyHistogram(object):
+    """Histogram of latencies in nanoseconds.
+
+    Histogram uses log-linear buckets, like HDR histogram: every power of two
+    range is split into 16 buckets, so relative error of recorded value does
+    not exceed 1/16. Values greater than 2^44 nanoseconds (~4.9 hours) are
+    recorded as 2^44 nanoseconds.
+    """
+
+    def __init__(self):
+        """Initializer."""
+        self.__count = 0
+        self.__total = 0
+        self.__min = 0
+        self.__max = 0
+        for index in range(704):
+            self.__counts[index] = 0
+
+    @property
+    def count(self):
+        """Return number of recorded values.
+
+        :rtype: int
+        """
+        return self.__count
+
+    @property
+    def min(self):
+        """Return minimal recorded value.
+
+        :rtype: int
+        """
+        return self.__min
+
+    @property
+    def max(self):
+        """Return maximal recorded value.
+
+        :rtype: int
+        """
+        return self.__max
+
+    @property
+    def mean(self):
+        """Return mean of recorded values.
+
+        :rtype: float
+        """
+        if self.__count == 0:
+            return 0.0
+        return <double>self.__total / <double>self.__count
+
+    def add(self, value):
+        """Record value.
+
+        :param value: Value in nanoseconds.
+        :type value: int
+
+        :rtype: None
+        """
+        self.record(value)
+
+    def percentile(self, double percentile):
+        """Return value at percentile.
+
+        Returned value is the highest value that is equivalent to the
+        value at the percentile within histogram precision.
+
+        :param percentile: Percentile from 0 to 100.
+        :type percentile: float
+
+        :rtype: int
+        """
+        cdef unsigned long long rank
+        cdef unsigned long long seen = 0
+        cdef int index
+
+        if self.__count == 0:
+            return 0
+
+        rank = <unsigned long long>(percentile / 100.0 * self.__count + 0.5)
+        if rank < 1:
+            rank = 1
+        if rank > self.__count:
+            rank = self.__count
+
+        for index in range(704):
+            seen += self.__counts[index]
+            if seen >= rank:
+                return max(self.__min,
+                           min(self.__max, _get_bucket_bounds(index)[1]))
+        return self.__max
+
+    def buckets(self):
+        """Return list of not empty buckets.
+
+        :return: List of tuples of bucket lower value, upper value and number
+                 of recorded values.
+        :rtype: list[tuple[int, int, int]]
+        """
+        cdef int index
+        cdef list buckets = list()
+
+        for index in range(704):
+            if self.__counts[index] > 0:
+                lower, upper = _get_bucket_bounds(index)
+                buckets.append((lower, upper, self.__counts[index]))
+        return buckets
+
+    cdef void record(self, unsigned long long value):
+        cdef int shift
+        cdef int index
+
+        if value > _HISTOGRAM_MAX_VALUE:
+            value = _HISTOGRAM_MAX_VALUE
+
+        if value < 32:
+            index = <int>value
+        else:
+            shift = _bit_length(value) - 5
+            index = shift * 16 + <int>(value >> shift)
+
+        self.__counts[index] += 1
+        self.__total += value
+        if self.__count == 0 or value < self.__min:
+            self.__min = value
+        if value > self.__max:
+            self.__max = value
+        self.__count += 1
+
+
+cdef class ProviderStats(object):
+    """Statistics of provider calls.
+
+    Total time includes time of resolving injected providers, self time
+    excludes it. Time is measured in nanoseconds.
+    """
+
+    def __init__(self):
+        """Initializer."""
+        self.__calls = 0
+        self.__total_time = 0
+        self.__self_time = 0
+        self.__histogram = LatencyHistogram()
+
+    @property
+    def calls(self):
+        """Return number of calls.
+
+        :rtype: int
+        """
+        return self.__calls
+
+    @property
+    def total_time(self):
+        """Return cumulative time of calls in nanoseconds.
+
+        :rtype: int
+        """
+        return self.__total_time
+
+    @property
+    def self_time(self):
+        """Return time of calls excluding nested calls in nanoseconds.
+
+        :rtype: int
+        """
+        return self.__self_time
+
+    @property
+    def histogram(self):
+        """Return histogram of calls latency.
+
+        :rtype: :py:class:`LatencyHistogram`
+        """
+        return self.__histogram
+
+    def to_dict(self):
+        """Return dictionary representation of statistics.
+
+        :rtype: dict
+        """
+        return {
+            'calls': self.__calls,
+            'total_time': self.__total_time,
+            'self_time': self.__self_time,
+            'min': self.__histogram.min,
+            'mean': self.__histogram.mean,
+            'p50': self.__histogram.percentile(50),
+            'p90': self.__histogram.percentile(90),
+            'p99': self.__histogram.percentile(99),
+            'max': self.__histogram.max,
+        }
+
+    cdef void record(self, unsigned long long total_time,
+                     unsigned long long self_time):
+        self.__calls += 1
+        self.__total_time += total_time
+        self.__self_time += self_time
+        self.__histogram.record(total_time)
+
+
+cdef class Span(object):
+    """Span of provider call.
+
+    Spans of nested provider calls, for example, calls of injected providers,
+    are children of the span of provider, that made the call. Time is
+    measured in nanoseconds.
+    """
+
+    def __init__(self):
+        """Initializer."""
+        raise Error('Spans are created by tracing only')
+
+    @property
+    def provider(self):
+        """Return called provider.
+
+        :rtype: :py:class:`Provider`
+        """
+        return self.__provider
+
+    @property
+    def parent(self):
+        """Return span of provider, that made the call.
+
+        :rtype: :py:class:`Span` | None
+        """
+        return self.__parent
+
+    @property
+    def children(self):
+        """Return spans of nested calls.
+
+        :rtype: list[:py:class:`Span`]
+        """
+        return list(self.__children)
+
+    @property
+    def injection(self):
+        """Return injection, that triggered the call.
+
+        Name of keyword argument or attribute injection, index of positional
+        argument injection or ``None`` if provider was not called as
+        injection.
+
+        :rtype: str | int | None
+        """
+        cdef Injection injection = self.__injection
+
+        if injection is None:
+            return None
+        if isinstance(injection, NamedInjection):
+            return (<NamedInjection>injection).__name
+        if self.__parent is not None:
+            args = _get_provider_args(self.__parent.__provider)
+            for index, value in enumerate(args):
+                if value is injection.__value:
+                    return index
+        return None
+
+    @property
+    def name(self):
+        """Return name of called provider.
+
+        :rtype: str
+        """
+        return _get_provider_name(self.__provider)
+
+    @property
+    def frame(self):
+        """Return name of stack frame of the call.
+
+        :rtype: str
+        """
+        injection = self.injection
+        if injection is None:
+            return self.name
+        return '{0}={1}'.format(injection, self.name)
+
+    @property
+    def start(self):
+        """Return start time of the call.
+
+        :rtype: int
+        """
+        return self.__start
+
+    @property
+    def end(self):
+        """Return end time of the call or ``None`` if call is in progress.
+
+        :rtype: int | None
+        """
+        if self.__end == 0:
+            return None
+        return self.__end
+
+    @property
+    def duration(self):
+        """Return duration of the call.
+
+        :rtype: int
+        """
+        if self.__end == 0:
+            return 0
+        return self.__end - self.__start
+
+    @property
+    def self_duration(self):
+        """Return duration of the call excluding nested calls.
+
+        :rtype: int
+        """
+        cdef Span child
+        duration = self.duration
+        for child in self.__children:
+            duration -= child.duration
+        return max(duration, 0)
+
+    @property
+    def error(self):
+        """Return exception raised by the call, if any.
+
+        :rtype: BaseException | None
+        """
+        return self.__error
+
+
+cdef class Tracer(object):
+    """Base tracer of providers calls.
+
+    Tracers are added with :py:func:`add_tracer`. Tracer is notified about
+    every provider call while it is added:
+
+    .. code-block:: python
+
+        class PrintTracer(Tracer):
+
+            def on_provide_end(self, span):
+                print(span.name, span.duration)
+
+        add_tracer(PrintTracer())
+    """
+
+    def on_provide_start(self, span):
+        """Handle start of provider call.
+
+        :param span: Span of the call.
+        :type span: :py:class:`Span`
+
+        :rtype: None
+        """
+
+    def on_provide_end(self, span):
+        """Handle end of provider call.
+
+        :param span: Span of the call.
+        :type span: :py:class:`Span`
+
+        :rtype: None
+        """
+
+
+cdef class InMemoryExporter(Tracer):
+    """Tracer that keeps finished root spans in memory.
+
+    .. code-block:: python
+
+        exporter = InMemoryExporter()
+        add_tracer(exporter)
+
+        container.service()
+
+        remove_tracer(exporter)
+        print(render_collapsed_stacks(exporter.spans))
+    """
+
+    def __init__(self):
+        """Initializer."""
+        self.__spans = list()
+        self.__lock = threading.Lock()
+
+    @property
+    def spans(self):
+        """Return finished root spans.
+
+        :rtype: list[:py:class:`Span`]
+        """
+        with self.__lock:
+            return list(self.__spans)
+
+    def clear(self):
+        """Drop finished spans.
+
+        :rtype: None
+        """
+        with self.__lock:
+            self.__spans = list()
+
+    def on_provide_end(self, span):
+        """Keep finished root span.
+
+        :param span: Span of the call.
+        :type span: :py:class:`Span`
+
+        :rtype: None
+        """
+        if span.parent is None:
+            with self.__lock:
+                self.__spans.append(span)
+
+
+cdef int _get_injection_call_mode(object value,
+                                  int is_provider,
+                                  int is_delegated):
+    """Return how injection value is resolved on every call.
+
+    ``0`` - value is injected as is, ``1`` - value is called, ``2`` - value is
+    provider that does not override :py:meth:`Provider.__call__`, so it is
+    called directly, bypassing Python call protocol.
+    """
+    if is_provider == 0 or is_delegated == 1:
+        return 0
+    if (isinstance(value, Provider) and
+            type(value).__call__ is Provider.__call__):
+        return 2
+    return 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple parse_positional_injections(tuple args):
+    """Parse positional injections."""
+    cdef list injections = list()
+    cdef int args_len = len(args)
+
+    cdef int index
+    cdef object arg
+    cdef PositionalInjection injection
+
+    for index in range(args_len):
+        arg = args[index]
+        injection = PositionalInjection(arg)
+        injections.append(injection)
+
+    return tuple(injections)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple parse_named_injections(dict kwargs):
+    """Parse named injections."""
+    cdef list injections = list()
+
+    cdef object name
+    cdef object arg
+    cdef NamedInjection injection
+
+    for name, arg in kwargs.items():
+        injection = NamedInjection(name, arg)
+        injections.append(injection)
+
+    return tuple(injections)
+
+
+cpdef bint is_provider(object instance):
+    """Check if instance is provider instance.
+
+    :param instance: Instance to be checked.
+    :type instance: object
+
+    :rtype: bool
+    """
+    return (not isinstance(instance, CLASS_TYPES) and
+            getattr(instance, '__IS_PROVIDER__', False) is True)
+
+
+cpdef object ensure_is_provider(object instance):
+    """Check if instance is provider instance and return it.
+
+    :param instance: Instance to be checked.
+    :type instance: object
+
+    :raise: :py:exc:`dependency_injector.errors.Error` if provided instance is
+            not provider.
+
+    :rtype: :py:class:`dependency_injector.providers.Provider`
+    """
+    if not is_provider(instance):
+        raise Error('Expected provider instance, '
+                    'got {0}'.format(str(instance)))
+    return instance
+
+
+cpdef bint is_delegated(object instance):
+    """Check if instance is delegated provider.
+
+    :param instance: Instance to be checked.
+    :type instance: object
+
+    :rtype: bool
+    """
+    return (not isinstance(instance, CLASS_TYPES) and
+            getattr(instance, '__IS_DELEGATED__', False) is True)
+
+
+cdef dict _load_env_prefix(str prefix, str separator, object types,
+                           bint lowercase):
+    """Return configuration loaded from the environment variables."""
+    cdef dict config = dict()
+    cdef dict converters = dict()
+    cdef list errors = list()
+    cdef list keys
+
+    if not separator:
+        raise Error('Separator of environment variable names is empty')
+
+    for selector, converter in (types or dict()).items():
+        converters[selector] = _get_converter(converter)
+
+    for name, value in sorted(os.environ.items()):
+        if not name.startswith(prefix) or len(name) == len(prefix):
+            continue
+
+        keys = name[len(prefix):].split(separator)
+        if not all(keys):
+            continue
+        if lowercase:
+            keys = [key.lower() for key in keys]
+
+        converter = converters.get('.'.join(keys))
+        if converter is not None:
+            try:
+                value = converter(value)
+            except Exception as exception:
+                errors.append('{0}={1!r}: {2}'.format(name, value, exception))
+                continue
+
+        section = config
+        for key in keys[:-1]:
+            subsection = section.get(key)
+            if not isinstance(subsection, dict):
+                subsection = section[key] = dict()
+            section = subsection
+        if not isinstance(section.get(keys[-1]), dict):
+            section[keys[-1]] = value
+
+    if errors:
+        raise Error('Unable to convert environment variables: {0}'.format(
+            '; '.join(errors)))
+
+    return config
+
+
+cdef object _get_converter(object converter):
+    """Return converter of string values."""
+    if isinstance(converter, str):
+        try:
+            return _CONVERTERS[converter]
+        except KeyError:
+            raise Error('Unknown type {0!r}, use one of: {1}'.format(
+                converter, ', '.join(sorted(_CONVERTERS))))
+    if converter is bool:
+        return _to_bool
+    if not callable(converter):
+        raise Error('Type {0!r} is not callable'.format(converter))
+    return converter
+
+
+def _to_bool(value):
+    """Convert string to boolean."""
+    if isinstance(value, bool):
+        return value
+    normalized = str(value).strip().lower()
+    if normalized in ('1', 'true', 'yes', 'on', 'y', 't'):
+        return True
+    if normalized in ('0', 'false', 'no', 'off', 'n', 'f', ''):
+        return False
+    raise ValueError('invalid boolean value {0!r}'.format(value))
+
+
+cdef dict _CONVERTERS = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': _to_bool,
+    'json': json.loads,
+}
+
+
+cdef tuple _get_option_keys(tuple segments, bint resolve):
+    """Return keys of configuration option path.
+
+    String segments are split by dots. If segments contain providers,
+    ``None`` is returned, unless ``resolve`` is set: then providers are called.
+    """
+    cdef list keys = list()
+
+    for segment in segments:
+        if is_provider(segment):
+            if not resolve:
+                return None
+            segment = segment()
+        if isinstance(segment, str):
+            keys.extend(segment.split('.'))
+        else:
+            keys.append(segment)
+
+    return tuple(keys)
+
+
+cdef void _init_option(ConfigurationOption option, tuple name, object root,
+                       tuple keys, object selector) except *:
+    """Initialize state of configuration option."""
+    option.__name = name
+    option.__root_ref = weakref.ref(root)
+    option.__version = (<Configuration?>root).__version
+    option.__children = {}
+    option.__parent = None
+    option.__keys = keys
+    option.__selector = selector
+    option.__cacheable = keys is not None
+    option.__cache = ConfigurationOption.UNDEFINED
+    option.__cache_version = 0
+    option.__typed = {}
+
+
+cdef tuple _copy_option_name(tuple segments, dict memo):
+    """Return copy of configuration option path.
+
+    Path is shared, if it contains only atomic values.
+    """
+    for segment in segments:
+        if type(segment) not in ATOMIC_TYPES:
+            return deepcopy(segments, memo)
+    return segments
+
+
+cdef dict _copy_option_children(dict children, dict memo):
+    """Return copies of configuration option children."""
+    cdef dict copied = dict()
+
+    for item, child in children.items():
+        copied[_deepcopy(item, memo)] = _deepcopy(child, memo)
+
+    return copied
+
+
+cdef object _get_option_selector(tuple segments):
+    """Return selector string of option path, if it has only strings."""
+    for segment in segments:
+        if not isinstance(segment, str):
+            return None
+    return '.'.join(segments)
+
+
+cdef object _get_option_value(object value, tuple keys):
+    """Return value of configuration by path keys."""
+    cdef PyObject* item
+
+    for key in keys:
+        if value is None:
+            break
+        if type(value) is dict:
+            item = PyDict_GetItem(value, key)
+            value = <object>item if item != NULL else None
+        else:
+            value = value.get(key)
+
+    return value
+
+
+cdef void _set_option_parent(ConfigurationOption option,
+                             ConfigurationOption parent) except *:
+    """Make option resolved from the value of parent option."""
+    option.__parent = parent
+    option.__keys = _get_option_keys(option.__name[-1:], False)
+    option.__cacheable = parent.__cacheable and option.__keys is not None
+
+
+cdef tuple _filter_providers(tuple values):
+    """Return tuple of values that are providers."""
+    return tuple(value for value in values if is_provider(value))
+
+
+cdef object _deepcopy(object instance, dict memo):
+    """Return full copy of instance, reusing already copied objects.
+
+    Providers are copied by calling their ``__deepcopy__()`` directly, other
+    objects are copied with :py:func:`copy.deepcopy`.
+    """
+    cdef object copied
+
+    if type(instance) in ATOMIC_TYPES:
+        return instance
+
+    copied = memo.get(id(instance), _NOT_COPIED)
+    if copied is not _NOT_COPIED:
+        return copied
+
+    if not isinstance(instance, Provider):
+        return copy.deepcopy(instance, memo)
+
+    copied = instance.__deepcopy__(memo)
+    memo[id(instance)] = copied
+    return copied
+
+
+cdef PositionalInjection _copy_positional_injection(
+        PositionalInjection injection,
+        dict memo):
+    """Return copy of positional injection without re-parsing its value."""
+    return _clone_positional_injection(injection,
+                                       _deepcopy(injection.__value, memo))
+
+
+cdef PositionalInjection _clone_positional_injection(
+        PositionalInjection injection,
+        object value):
+    """Return copy of positional injection with another value."""
+    cdef PositionalInjection copied
+
+    copied = PositionalInjection.__new__(PositionalInjection)
+    copied.__value = value
+    copied.__is_provider = injection.__is_provider
+    copied.__is_delegated = injection.__is_delegated
+    copied.__call = injection.__call
+    return copied
+
+
+cdef NamedInjection _copy_named_injection(NamedInjection injection,
+                                          dict memo):
+    """Return copy of keyword injection without re-parsing its value."""
+    return _clone_named_injection(injection,
+                                  _deepcopy(injection.__value, memo))
+
+
+cdef NamedInjection _clone_named_injection(NamedInjection injection,
+                                           object value):
+    """Return copy of keyword injection with another value."""
+    cdef NamedInjection copied
+
+    copied = NamedInjection.__new__(NamedInjection)
+    copied.__name = injection.__name
+    copied.__value = value
+    copied.__is_provider = injection.__is_provider
+    copied.__is_delegated = injection.__is_delegated
+    copied.__call = injection.__call
+    return copied
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _copy_positional_injections(tuple injections, dict memo):
+    """Return copies of positional injections."""
+    cdef int index
+    cdef int injections_len = len(injections)
+    cdef list copied = list()
+
+    for index in range(injections_len):
+        copied.append(_copy_positional_injection(injections[index], memo))
+
+    return tuple(copied)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _copy_named_injections(tuple injections, dict memo):
+    """Return copies of keyword injections."""
+    cdef int index
+    cdef int injections_len = len(injections)
+    cdef list copied = list()
+
+    for index in range(injections_len):
+        copied.append(_copy_named_injection(injections[index], memo))
+
+    return tuple(copied)
+
+
+cdef void _copy_callable_injections(Callable provider,
+                                    Callable copied,
+                                    dict memo) except *:
+    """Copy argument injections of callable provider."""
+    copied.__args = _copy_positional_injections(provider.__args, memo)
+    copied.__args_len = provider.__args_len
+    copied.__kwargs = _copy_named_injections(provider.__kwargs, memo)
+    copied.__kwargs_len = provider.__kwargs_len
+    copied._compile_injections()
+
+
+cdef void _copy_factory_injections(Factory provider,
+                                   Factory copied,
+                                   dict memo) except *:
+    """Copy argument and attribute injections of factory provider."""
+    _copy_callable_injections(provider.__instantiator,
+                              copied.__instantiator,
+                              memo)
+    copied.__attributes = _copy_named_injections(provider.__attributes, memo)
+    copied.__attributes_len = provider.__attributes_len
+
+
+cdef int _COPY_CALLABLE = 1
+cdef int _COPY_FACTORY = 2
+cdef int _COPY_SINGLETON = 3
+cdef int _COPY_LIST = 4
+
+
+cdef class _ProviderCopier(object):
+    """Copier of provider, that is compiled for providers table.
+
+    Copier refers to providers, that provider depends on, by their indexes in
+    the table. Table is ordered by dependencies, so these providers are
+    already copied when provider is copied, and their copies are taken from
+    the list of copies instead of copying them through memo.
+
+    Copies of providers, that use initializers of :py:class:`Callable`,
+    :py:class:`Factory`, :py:class:`Singleton` and :py:class:`List`, are
+    created without calling initializers, so injections are not parsed and
+    compiled for empty copies.
+
+    Copier keeps injections and overridings of provider, that it was compiled
+    for. If provider is changed later, it is copied with
+    :py:func:`deepcopy`.
+    """
+
+    cdef Provider __provider
+    cdef int __kind
+    cdef bint __has_own_init
+    cdef Callable __callable
+    cdef Factory __factory
+
+    cdef object __provides
+    cdef int __provides_index
+    cdef tuple __args
+    cdef tuple __args_indexes
+    cdef tuple __kwargs
+    cdef tuple __kwargs_indexes
+    cdef tuple __attributes
+    cdef tuple __attributes_indexes
+    cdef tuple __overridden
+    cdef tuple __overridden_indexes
+
+    cdef bint _compile(self, Provider provider, dict indexes, int index):
+        """Compile copier, return ``False`` if provider can not be compiled."""
+        cdef object deepcopy_method = type(provider).__deepcopy__
+        cdef object init_method = type(provider).__init__
+
+        if deepcopy_method is Callable.__deepcopy__:
+            self.__kind = _COPY_CALLABLE
+            self.__has_own_init = init_method is not Callable.__init__
+            self.__callable = <Callable>provider
+        elif deepcopy_method is Factory.__deepcopy__:
+            self.__kind = _COPY_FACTORY
+            self.__has_own_init = init_method is not Factory.__init__
+            self.__factory = <Factory>provider
+            self.__callable = self.__factory.__instantiator
+        elif deepcopy_method is BaseSingleton.__deepcopy__:
+            self.__kind = _COPY_SINGLETON
+            self.__has_own_init = init_method is not Singleton.__init__
+            self.__factory = (<BaseSingleton>provider).__instantiator
+            self.__callable = self.__factory.__instantiator
+        elif deepcopy_method is List.__deepcopy__:
+            self.__kind = _COPY_LIST
+            self.__has_own_init = init_method is not List.__init__
+        else:
+            return False
+
+        self.__provider = provider
+        self.__overridden = provider.__overridden
+        self.__overridden_indexes = _get_copied_indexes(
+            self.__overridden, indexes, index)
+        if self.__overridden_indexes is None:
+            return False
+
+        if self.__kind == _COPY_LIST:
+            self.__args = (<List>provider).__args
+            self.__args_indexes = _get_injections_indexes(
+                self.__args, indexes, index)
+            return self.__args_indexes is not None
+
+        self.__provides = self.__callable.__provides
+        self.__provides_index = -1
+        if isinstance(self.__provides, Provider):
+            self.__provides_index = indexes.get(id(self.__provides), index)
+            if self.__provides_index >= index:
+                return False
+
+        self.__args = self.__callable.__args
+        self.__args_indexes = _get_injections_indexes(
+            self.__args, indexes, index)
+        self.__kwargs = self.__callable.__kwargs
+        self.__kwargs_indexes = _get_injections_indexes(
+            self.__kwargs, indexes, index)
+        if self.__args_indexes is None or self.__kwargs_indexes is None:
+            return False
+
+        if self.__factory is not None:
+            self.__attributes = self.__factory.__attributes
+            self.__attributes_indexes = _get_injections_indexes(
+                self.__attributes, indexes, index)
+            if self.__attributes_indexes is None:
+                return False
+
+        return True
+
+    cdef bint _is_changed(self):
+        """Check if provider has been changed after compiling."""
+        if self.__provider.__overridden is not self.__overridden:
+            return True
+
+        if self.__kind == _COPY_LIST:
+            return (<List>self.__provider).__args is not self.__args
+
+        if (self.__callable.__provides is not self.__provides
+                or self.__callable.__args is not self.__args
+                or self.__callable.__kwargs is not self.__kwargs):
+            return True
+
+        return (self.__factory is not None
+                and self.__factory.__attributes is not self.__attributes)
+
+    cdef object _copy(self, list copies, dict memo):
+        """Return copy of provider."""
+        cdef Provider copied
+        cdef Callable copied_callable
+        cdef Factory copied_factory = None
+        cdef object provides
+
+        if self._is_changed():
+            return _deepcopy(self.__provider, memo)
+
+        if self.__kind == _COPY_LIST:
+            if self.__has_own_init:
+                copied = type(self.__provider)()
+            else:
+                copied = self._create_copy(None)
+            (<List>copied).__args = _clone_positional_injections(
+                self.__args, self.__args_indexes, copies, memo)
+            (<List>copied).__args_len = len(self.__args)
+        else:
+            provides = self.__provides
+            if self.__provides_index >= 0:
+                provides = copies[self.__provides_index]
+
+            if self.__has_own_init:
+                copied = type(self.__provider)(provides)
+            else:
+                copied = self._create_copy(provides)
+
+            if self.__kind == _COPY_CALLABLE:
+                copied_callable = <Callable>copied
+            elif self.__kind == _COPY_FACTORY:
+                copied_factory = <Factory>copied
+                copied_callable = copied_factory.__instantiator
+            else:
+                copied_factory = (<BaseSingleton>copied).__instantiator
+                copied_callable = copied_factory.__instantiator
+
+            copied_callable.__args = _clone_positional_injections(
+                self.__args, self.__args_indexes, copies, memo)
+            copied_callable.__args_len = len(self.__args)
+            copied_callable.__kwargs = _clone_named_injections(
+                self.__kwargs, self.__kwargs_indexes, copies, memo)
+            copied_callable.__kwargs_len = len(self.__kwargs)
+            copied_callable._compile_injections()
+
+            if copied_factory is not None:
+                copied_factory.__attributes = _clone_named_injections(
+                    self.__attributes, self.__attributes_indexes, copies, memo)
+                copied_factory.__attributes_len = len(self.__attributes)
+
+        if len(self.__overridden_indexes) > 0:
+            copied._set_overridden(tuple(
+                copies[index] for index in self.__overridden_indexes))
+
+        memo[id(self.__provider)] = copied
+        return copied
+
+    cdef Provider _create_copy(self, object provides):
+        """Create empty copy of provider without calling initializers."""
+        cdef Provider copied = _create_provider(type(self.__provider))
+        cdef Callable instantiator
+        cdef Factory factory
+
+        if self.__kind == _COPY_LIST:
+            return copied
+
+        if self.__kind == _COPY_CALLABLE:
+            (<Callable>copied).__provides = provides
+            return copied
+
+        instantiator = <Callable>_create_provider(Callable)
+        instantiator.__provides = provides
+
+        if self.__kind == _COPY_FACTORY:
+            (<Factory>copied).__instantiator = instantiator
+        else:
+            factory = <Factory>_create_provider(Factory)
+            factory.__instantiator = instantiator
+            (<BaseSingleton>copied).__instantiator = factory
+
+        return copied
+
+
+cdef Provider _create_provider(object cls):
+    """Create provider without calling initializers.
+
+    Only the state of :py:meth:`Provider.__init__` is initialized.
+    """
+    cdef Provider provider = cls.__new__(cls)
+
+    provider.__overridden = tuple()
+    provider.__overriding_lock = threading.RLock()
+    return provider
+
+
+cdef tuple _get_copied_indexes(tuple providers, dict indexes, int index):
+    """Return indexes of providers in the table.
+
+    ``None`` is returned if any of providers is not copied before provider
+    with given index.
+    """
+    cdef list copied_indexes = list()
+    cdef int provider_index
+
+    for provider in providers:
+        provider_index = indexes.get(id(provider), index)
+        if provider_index >= index:
+            return None
+        copied_indexes.append(provider_index)
+
+    return tuple(copied_indexes)
+
+
+cdef tuple _get_injections_indexes(tuple injections, dict indexes,
+                                   int index):
+    """Return indexes of injected providers in the table.
+
+    Index is ``-1`` for injected values that are not providers. ``None`` is
+    returned if any of injected providers is not copied before provider with
+    given index.
+    """
+    cdef list injections_indexes = list()
+    cdef Injection injection
+    cdef int injection_index
+
+    for injection in injections:
+        injection_index = -1
+        if isinstance(injection.__value, Provider):
+            injection_index = indexes.get(id(injection.__value), index)
+            if injection_index >= index:
+                return None
+        injections_indexes.append(injection_index)
+
+    return tuple(injections_indexes)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _clone_positional_injections(tuple injections, tuple indexes,
+                                        list copies, dict memo):
+    """Return copies of positional injections taking providers by index."""
+    cdef int index
+    cdef int value_index
+    cdef int injections_len = len(injections)
+    cdef list copied = list()
+
+    for index in range(injections_len):
+        value_index = indexes[index]
+        if value_index >= 0:
+            copied.append(_clone_positional_injection(injections[index],
+                                                      copies[value_index]))
+        else:
+            copied.append(_copy_positional_injection(injections[index],
+                                                     memo))
+
+    return tuple(copied)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef tuple _clone_named_injections(tuple injections, tuple indexes,
+                                   list copies, dict memo):
+    """Return copies of keyword injections taking providers by index."""
+    cdef int index
+    cdef int value_index
+    cdef int injections_len = len(injections)
+    cdef list copied = list()
+
+    for index in range(injections_len):
+        value_index = indexes[index]
+        if value_index >= 0:
+            copied.append(_clone_named_injection(injections[index],
+                                                 copies[value_index]))
+        else:
+            copied.append(_copy_named_injection(injections[index], memo))
+
+    return tuple(copied)
+
+
+cpdef tuple _compile_providers_copiers(tuple table):
+    """Compile copiers of providers table.
+
+    Every provider of the table goes after the providers it depends on.
+    Copier is ``None`` for providers, that are copied with
+    :py:func:`deepcopy`.
+
+    :param table: Tuple of providers ordered by dependencies.
+    :type table: tuple[:py:class:`Provider`]
+
+    :rtype: tuple[object]
+    """
+    cdef dict indexes = dict()
+    cdef list copiers = list()
+    cdef _ProviderCopier copier
+    cdef int index
+
+    for index, provider in enumerate(table):
+        indexes[id(provider)] = index
+
+    for index, provider in enumerate(table):
+        copier = _ProviderCopier.__new__(_ProviderCopier)
+        if isinstance(provider, Provider) \
+                and copier._compile(provider, indexes, index):
+            copiers.append(copier)
+        else:
+            copiers.append(None)
+
+    return tuple(copiers)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef list _copy_providers_table(tuple table, tuple copiers):
+    """Return copies of providers table.
+
+    :param table: Tuple of providers ordered by dependencies.
+    :type table: tuple[:py:class:`Provider`]
+
+    :param copiers: Copiers of providers compiled with
+                    :py:func:`_compile_providers_copiers`.
+    :type copiers: tuple[object]
+
+    :rtype: list[:py:class:`Provider`]
+    """
+    cdef dict memo = dict()
+    cdef list copies = list()
+    cdef object provider
+    cdef object copier
+    cdef object copied
+    cdef int index
+    cdef int table_len = len(table)
+
+    __add_sys_streams(memo)
+
+    for index in range(table_len):
+        provider = table[index]
+        copied = memo.get(id(provider), _NOT_COPIED)
+        if copied is _NOT_COPIED:
+            copier = copiers[index]
+            if copier is None:
+                copied = _deepcopy(provider, memo)
+            else:
+                copied = (<_ProviderCopier>copier)._copy(copies, memo)
+        copies.append(copied)
+
+    return copies
+
+
+cpdef str represent_provider(object provider, object provides):
+    """Return string representation of provider.
+
+    :param provider: Provider object
+    :type provider: :py:class:`dependency_injector.providers.Provider`
+
+    :param provides: Object that provider provides
+    :type provider: object
+
+    :return: String representation of provider
+    :rtype: str
+    """
+    return '<{provider}({provides}) at {address}>'.format(
+        provider='.'.join((provider.__class__.__module__,
+                           provider.__class__.__name__)),
+        provides=repr(provides) if provides is not None else '',
+        address=hex(id(provider)))
+
+
+cpdef object deepcopy(object instance, dict memo=None):
+    """Return full copy of provider or container with providers."""
+    if memo is None:
+        memo = dict()
+
+    __add_sys_streams(memo)
+
+    return _deepcopy(instance, memo)
+
+def enable_async_mode():
+    """Enable asynchronous resolution of injections.
+
+    When asynchronous mode is enabled, :py:class:`Callable`,
+    :py:class:`Coroutine` and :py:class:`Factory` providers check injected
+    values. If any of them is awaitable, provider returns awaitable, that
+    awaits all awaitable injections concurrently with
+    :py:func:`asyncio.gather` before calling the target.
+
+    :raise: :py:exc:`dependency_injector.errors.Error` if package asyncio is
+            not available.
+
+    :rtype: None
     """
+    global ASYNC_MODE_ENABLED
 
-    def __init__(self, selector, **providers):
-        """Initialize provider."""
-        self.__selector = selector
-        self.__providers = providers
-        super(Selector, self).__init__()
+    if asyncio is None:
+        raise Error('Package asyncio is not available')
 
-    def __deepcopy__(self, memo):
-        """Create and return full copy of provider."""
-        copied = memo.get(id(self))
-        if copied is not None:
-            return copied
+    ASYNC_MODE_ENABLED = True
 
-        copied = self.__class__(
-            deepcopy(self.__selector, memo),
-            **deepcopy(self.__providers, memo),
-        )
-        self._copy_overridings(copied, memo)
 
-        return copied
+def disable_async_mode():
+    """Disable asynchronous resolution of injections.
 
-    def __getattr__(self, name):
-        """Return provider."""
-        if name.startswith('__') and name.endswith('__'):
-            raise AttributeError(
-                '\'{cls}\' object has no attribute '
-                '\'{attribute_name}\''.format(cls=self.__class__.__name__,
-                                              attribute_name=name))
-        if name not in self.__providers:
-            raise AttributeError('Selector has no "{0}" provider'.format(name))
+    :rtype: None
+    """
+    global ASYNC_MODE_ENABLED
+    ASYNC_MODE_ENABLED = False
 
-        return self.__providers[name]
 
-    def __str__(self):
-        """Return string representation of provider.
+def is_async_mode_enabled():
+    """Check if asynchronous resolution of injections is enabled.
 
-        :rtype: str
-        """
+    :rtype: bool
+    """
+    return ASYNC_MODE_ENABLED
 
-        return '<{provider}({selector}, {providers}) at {address}>'.format(
-            provider='.'.join(( self.__class__.__module__, self.__class__.__name__)),
-            selector=self.__selector,
-            providers=', '.join((
-                '{0}={1}'.format(name, provider)
-                for name, provider in self.__providers.items()
-            )),
-            address=hex(id(self)),
-        )
 
-    @property
-    def providers(self):
-        """Return providers."""
-        return dict(self.__providers)
+def enable_instrumentation():
+    """Enable collecting of providers calls statistics.
 
-    cpdef object _provide(self, tuple args, dict kwargs):
-        """Return single instance."""
-        selector_value = self.__selector()
+    When instrumentation is enabled, every provider call is counted and
+    timed. Statistics are available with :py:attr:`Provider.call_stats`.
 
-        if selector_value is None:
-            raise Error('Selector value is undefined')
+    :rtype: None
+    """
+    global INSTRUMENTATION_ENABLED
+    INSTRUMENTATION_ENABLED = True
+    _update_call_hooks()
 
-        if selector_value not in self.__providers:
-            raise Error('Selector has no "{0}" provider'.format(selector_value))
 
-        return self.__providers[selector_value](*args, **kwargs)
+def disable_instrumentation():
+    """Disable collecting of providers calls statistics.
 
+    :rtype: None
+    """
+    global INSTRUMENTATION_ENABLED
+    INSTRUMENTATION_ENABLED = False
+    _update_call_hooks()
 
-cdef class Injection(object):
-    """Abstract injection class."""
 
+def is_instrumentation_enabled():
+    """Check if collecting of providers calls statistics is enabled.
 
-cdef class PositionalInjection(Injection):
-    """Positional injection class."""
+    :rtype: bool
+    """
+    return INSTRUMENTATION_ENABLED
 
-    def __init__(self, value):
-        """Initializer."""
-        self.__value = value
-        self.__is_provider = <int>is_provider(value)
-        self.__is_delegated = <int>is_delegated(value)
-        self.__call = <int>(self.__is_provider == 1 and
-                            self.__is_delegated == 0)
-        super(PositionalInjection, self).__init__()
 
-    def __deepcopy__(self, memo):
-        """Create and return full copy of provider."""
-        copied = memo.get(id(self))
-        if copied is not None:
-            return copied
-        return self.__class__(deepcopy(self.__value, memo))
+def add_tracer(tracer):
+    """Add tracer of providers calls.
 
-    def get_value(self):
-        """Return injection value."""
-        return __get_value(self)
+    :param tracer: Tracer.
+    :type tracer: :py:class:`Tracer`
 
-    def get_original_value(self):
-        """Return original value."""
-        return self.__value
+    :rtype: None
+    """
+    global _tracers
 
+    with _tracers_lock:
+        _tracers += (tracer,)
+        _update_call_hooks()
 
-cdef class NamedInjection(Injection):
-    """Keyword injection class."""
 
-    def __init__(self, name, value):
-        """Initializer."""
-        self.__name = name
-        self.__value = value
-        self.__is_provider = <int>is_provider(value)
-        self.__is_delegated = <int>is_delegated(value)
-        self.__call = <int>(self.__is_provider == 1 and
-                            self.__is_delegated == 0)
-        super(NamedInjection, self).__init__()
+def remove_tracer(tracer):
+    """Remove tracer of providers calls.
 
-    def __deepcopy__(self, memo):
-        """Create and return full copy of provider."""
-        copied = memo.get(id(self))
-        if copied is not None:
-            return copied
-        return self.__class__(deepcopy(self.__name, memo),
-                              deepcopy(self.__value, memo))
+    :param tracer: Tracer.
+    :type tracer: :py:class:`Tracer`
 
-    def get_name(self):
-        """Return injection value."""
-        return __get_name(self)
+    :rtype: None
+    """
+    global _tracers
 
-    def get_value(self):
-        """Return injection value."""
-        return __get_value(self)
+    with _tracers_lock:
+        _tracers = tuple(added_tracer for added_tracer in _tracers
+                         if added_tracer is not tracer)
+        _update_call_hooks()
 
-    def get_original_value(self):
-        """Return original value."""
-        return self.__value
 
+def get_tracers():
+    """Return tuple of added tracers.
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cpdef tuple parse_positional_injections(tuple args):
-    """Parse positional injections."""
-    cdef list injections = list()
-    cdef int args_len = len(args)
+    :rtype: tuple[:py:class:`Tracer`]
+    """
+    return _tracers
 
-    cdef int index
-    cdef object arg
-    cdef PositionalInjection injection
 
-    for index in range(args_len):
-        arg = args[index]
-        injection = PositionalInjection(arg)
-        injections.append(injection)
+def render_collapsed_stacks(spans):
+    """Render spans in collapsed stacks format.
 
-    return tuple(injections)
+    Every line contains semicolon separated stack of providers and self time
+    of the last provider in nanoseconds. Same stacks are merged. Result could
+    be used for building flame graphs, for example, with ``flamegraph.pl``.
 
+    :param spans: Root spans.
+    :type spans: list[:py:class:`Span`]
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cpdef tuple parse_named_injections(dict kwargs):
-    """Parse named injections."""
-    cdef list injections = list()
+    :rtype: str
+    """
+    stacks = collections.OrderedDict()
 
-    cdef object name
-    cdef object arg
-    cdef NamedInjection injection
+    for root in spans:
+        pending = [(root, tuple())]
+        while pending:
+            span, path = pending.pop()
+            path += (span.frame.replace(';', ':'),)
+            stack = ';'.join(path)
+            stacks[stack] = stacks.get(stack, 0) + span.self_duration
+            for child in reversed(span.children):
+                pending.append((child, path))
 
-    for name, arg in kwargs.items():
-        injection = NamedInjection(name, arg)
-        injections.append(injection)
+    return ''.join('{0} {1}\n'.format(stack, value)
+                   for stack, value in stacks.items())
 
-    return tuple(injections)
 
+def enable_yaml_cache(cache_dir=None):
+    """Enable cache of parsed yaml configuration files.
 
-cpdef bint is_provider(object instance):
-    """Check if instance is provider instance.
+    Parsed configuration is stored in a binary file and reused, while
+    modification time and size of the yaml file are the same. Environment
+    variable markers are expanded on every load.
+
+    :param cache_dir: Directory of cache files. By default, cache file is
+                      stored in ``__pycache__`` directory next to the yaml
+                      file.
+    :type cache_dir: str
+
+    :rtype: None
+    """
+    global _yaml_cache_enabled, _yaml_cache_dir
+    _yaml_cache_dir = cache_dir
+    _yaml_cache_enabled = True
 
-    :param instance: Instance to be checked.
-    :type instance: object
+
+def disable_yaml_cache():
+    """Disable cache of parsed yaml configuration files.
+
+    :rtype: None
+    """
+    global _yaml_cache_enabled, _yaml_cache_dir
+    _yaml_cache_enabled = False
+    _yaml_cache_dir = None
+
+
+def is_yaml_cache_enabled():
+    """Check if cache of parsed yaml configuration files is enabled.
 
     :rtype: bool
     """
-    return (not isinstance(instance, CLASS_TYPES) and
-            getattr(instance, '__IS_PROVIDER__', False) is True)
+    return _yaml_cache_enabled
 
 
-cpdef object ensure_is_provider(object instance):
-    """Check if instance is provider instance and return it.
+cdef void _update_call_hooks():
+    global CALL_HOOKS_ENABLED, TRACING_ENABLED
+    TRACING_ENABLED = len(_tracers) > 0
+    CALL_HOOKS_ENABLED = INSTRUMENTATION_ENABLED or TRACING_ENABLED
 
-    :param instance: Instance to be checked.
-    :type instance: object
 
-    :raise: :py:exc:`dependency_injector.errors.Error` if provided instance is
-            not provider.
+cdef object _hooked_call(Provider provider, tuple args, dict kwargs):
+    """Call provider, recording statistics and tracing the call."""
+    return _call_with_hooks(provider, None, args, kwargs)
 
-    :rtype: :py:class:`dependency_injector.providers.Provider`
+
+cdef object _call_with_hooks(Provider provider, object call, tuple args,
+                             dict kwargs):
+    """Call provider or callable on its behalf with statistics and tracing.
+
+    If result is awaitable, call is finished, when it is awaited.
     """
-    if not is_provider(instance):
-        raise Error('Expected provider instance, '
-                    'got {0}'.format(str(instance)))
-    return instance
+    cdef list stack = None
+    cdef Span span = None
+    cdef long long start
+    cdef long long elapsed
+    cdef long long nested
+    cdef object overriding
 
+    if TRACING_ENABLED:
+        span = _start_span(provider)
 
-cpdef bint is_delegated(object instance):
-    """Check if instance is delegated provider.
+    if INSTRUMENTATION_ENABLED:
+        try:
+            stack = _hooks_local.stack
+        except AttributeError:
+            stack = _hooks_local.stack = list()
+        stack.append(0)
+
+    start = _monotonic_ns()
+    try:
+        if call is None:
+            call = __get_overriding(provider)
+        if call is not None:
+            result = PyObject_Call(call, args, kwargs)
+        else:
+            result = provider._provide(args, kwargs)
+    except BaseException as exception:
+        elapsed = _monotonic_ns() - start
+        nested = _pop_hooks_stack(stack, elapsed)
+        if stack is not None:
+            _record_call(provider, elapsed, nested)
+        if span is not None:
+            span.__error = exception
+            _end_span(span)
+        raise
+
+    elapsed = _monotonic_ns() - start
+    nested = _pop_hooks_stack(stack, elapsed)
+
+    if asyncio is not None and _is_awaitable(result):
+        if span is not None:
+            _hooks_local.span = span.__parent
+        return _hook_awaitable(result, provider, span, stack is not None,
+                               start, nested)
+
+    if stack is not None:
+        _record_call(provider, elapsed, nested)
+    if span is not None:
+        _end_span(span)
+    return result
 
-    :param instance: Instance to be checked.
-    :type instance: object
 
-    :rtype: bool
+cdef long long _pop_hooks_stack(list stack, long long elapsed) except? -1:
+    """Return time of nested calls and add elapsed time to the outer call."""
+    cdef long long nested
+
+    if stack is None:
+        return 0
+    nested = stack.pop()
+    if stack:
+        stack[-1] += elapsed
+    return nested
+
+
+cdef void _record_call(Provider provider, long long elapsed,
+                       long long nested) except *:
+    cdef ProviderStats stats = provider.__call_stats
+
+    if stats is None:
+        stats = ProviderStats()
+        provider.__call_stats = stats
+    stats.record(elapsed, max(elapsed - nested, 0))
+
+
+cdef object _hook_awaitable(object awaitable, Provider provider, Span span,
+                            bint record, long long start, long long nested):
+    """Finish hooked call, when awaitable result is done.
+
+    Futures are returned as is with done callback, other awaitables are
+    wrapped with coroutine.
     """
-    return (not isinstance(instance, CLASS_TYPES) and
-            getattr(instance, '__IS_DELEGATED__', False) is True)
+    if asyncio is not None and asyncio.isfuture(awaitable):
+        awaitable.add_done_callback(
+            functools.partial(_finish_awaited_future, provider, span, record,
+                              start, nested),
+        )
+        return awaitable
+    return _await_hooked(awaitable, provider, span, record, start, nested)
+
+
+async def _await_hooked(awaitable, Provider provider, Span span, bint record,
+                        long long start, long long nested):
+    """Await result of hooked call and finish the call."""
+    try:
+        return await awaitable
+    except BaseException as exception:
+        if span is not None:
+            span.__error = exception
+        raise
+    finally:
+        _finish_awaited_call(provider, span, record, start, nested)
+
+
+def _finish_awaited_future(Provider provider, Span span, bint record,
+                           long long start, long long nested, future):
+    """Finish hooked call, when future result is done."""
+    if span is not None and not future.cancelled():
+        span.__error = future.exception()
+    _finish_awaited_call(provider, span, record, start, nested)
+
+
+cdef void _finish_awaited_call(Provider provider, Span span, bint record,
+                               long long start, long long nested) except *:
+    cdef long long elapsed = _monotonic_ns() - start
+
+    if record:
+        _record_call(provider, elapsed, nested)
+    if span is not None:
+        _close_span(span)
+
+
+cdef object _traced_injection_call(Injection injection):
+    """Call injected provider, remembering injection for tracing."""
+    _hooks_local.injection = injection
+    try:
+        if injection.__call == 2:
+            return __call_provider(<Provider>injection.__value)
+        return injection.__value()
+    finally:
+        _hooks_local.injection = None
+
+
+cdef Span _start_span(Provider provider):
+    cdef Span parent = getattr(_hooks_local, 'span', None)
+    cdef Span span = Span.__new__(Span)
+
+    span.__provider = provider
+    span.__parent = parent
+    span.__children = list()
+    span.__injection = getattr(_hooks_local, 'injection', None)
+    span.__end = 0
+    if span.__injection is not None:
+        _hooks_local.injection = None
+    if parent is not None:
+        parent.__children.append(span)
+
+    _hooks_local.span = span
+    for tracer in _tracers:
+        tracer.on_provide_start(span)
+    span.__start = _monotonic_ns()
+    return span
+
+
+cdef void _end_span(Span span) except *:
+    _hooks_local.span = span.__parent
+    _close_span(span)
+
+
+cdef void _close_span(Span span) except *:
+    span.__end = _monotonic_ns()
+    for tracer in _tracers:
+        tracer.on_provide_end(span)
+
+
+cdef tuple _get_provider_args(object provider):
+    """Return positional argument injections of provider."""
+    if isinstance(provider, (Callable, Factory, BaseSingleton, Pool, List)):
+        return provider.args
+    return tuple()
+
+
+cdef str _get_provider_name(object provider):
+    """Return short name of provider for tracing."""
+    provides = None
+    if isinstance(provider, (Callable, Delegate)):
+        provides = provider.provides
+    elif isinstance(provider, (Factory, BaseSingleton, Pool)):
+        provides = provider.cls
+
+    name = provider.__class__.__name__
+    if provides is None:
+        return name
+
+    if isinstance(provides, Provider):
+        provides_name = _get_provider_name(provides)
+    else:
+        provides_name = getattr(provides, '__qualname__',
+                                getattr(provides, '__name__',
+                                        provides.__class__.__name__))
+    return '{0}({1})'.format(name, provides_name)
 
 
-cpdef str represent_provider(object provider, object provides):
-    """Return string representation of provider.
+cdef unsigned long long _HISTOGRAM_MAX_VALUE = 1ULL << 44
 
-    :param provider: Provider object
-    :type provider: :py:class:`dependency_injector.providers.Provider`
 
-    :param provides: Object that provider provides
-    :type provider: object
+cdef inline int _bit_length(unsigned long long value):
+    cdef int length = 0
+    while value:
+        value >>= 1
+        length += 1
+    return length
 
-    :return: String representation of provider
-    :rtype: str
+
+cdef tuple _get_bucket_bounds(int index):
+    """Return lower and upper values of histogram bucket."""
+    cdef int shift
+    cdef unsigned long long sub_bucket
+
+    if index < 32:
+        return index, index
+    shift = index // 16 - 1
+    sub_bucket = index - shift * 16
+    return sub_bucket << shift, ((sub_bucket + 1) << shift) - 1
+
+
+cdef inline bint _is_awaitable(object value):
+    """Check if value is awaitable."""
+    if type(value) in ATOMIC_TYPES:
+        return False
+    if hasattr(type(value), '__await__'):
+        return True
+    return isinstance(value, types.GeneratorType) and asyncio.iscoroutine(value)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef bint _has_awaitables(tuple args, dict kwargs, dict attributes) except -1:
+    """Check if any of the injected values is awaitable."""
+    cdef object value
+
+    for value in args:
+        if _is_awaitable(value):
+            return True
+    for value in kwargs.values():
+        if _is_awaitable(value):
+            return True
+    if attributes is not None:
+        for value in attributes.values():
+            if _is_awaitable(value):
+                return True
+    return False
+
+
+cdef object _resolve_async_call(object provides,
+                                tuple args,
+                                dict kwargs,
+                                dict attributes,
+                                bint await_result):
+    """Return awaitable, that resolves awaitable injections and calls target."""
+    return _async_call(provides, args, kwargs, attributes, await_result)
+
+
+async def _async_call(provides, args, kwargs, attributes, await_result):
+    """Await injections concurrently and call target with their results."""
+    positional_args = list(args)
+    keys = []
+    awaitables = []
+
+    for index, value in enumerate(positional_args):
+        if _is_awaitable(value):
+            keys.append((positional_args, index))
+            awaitables.append(value)
+    for name, value in kwargs.items():
+        if _is_awaitable(value):
+            keys.append((kwargs, name))
+            awaitables.append(value)
+    if attributes is not None:
+        for name, value in attributes.items():
+            if _is_awaitable(value):
+                keys.append((attributes, name))
+                awaitables.append(value)
+
+    results = await asyncio.gather(*awaitables)
+
+    for (container, key), result in zip(keys, results):
+        container[key] = result
+
+    instance = provides(*positional_args, **kwargs)
+
+    if await_result and _is_awaitable(instance):
+        instance = await instance
+
+    if attributes is not None:
+        for name, value in attributes.items():
+            setattr(instance, name, value)
+
+    return instance
+
+
+cdef object _get_singleton_instance(BaseSingleton provider, object instance):
+    """Return instance, that is cached by singleton provider.
+
+    In asynchronous mode factory returns coroutine, if there are awaitable
+    injections. Coroutine could be awaited only once, so it is wrapped into
+    future, that is cached and shared by all callers. Failed or cancelled
+    future is forgotten, so next call creates instance again.
     """
-    return '<{provider}({provides}) at {address}>'.format(
-        provider='.'.join((provider.__class__.__module__,
-                           provider.__class__.__name__)),
-        provides=repr(provides) if provides is not None else '',
-        address=hex(id(provider)))
+    cdef object future
 
+    if not ASYNC_MODE_ENABLED or not asyncio.iscoroutine(instance):
+        return instance
 
-cpdef object deepcopy(object instance, dict memo=None):
-    """Return full copy of provider or container with providers."""
-    if memo is None:
-        memo = dict()
+    future = asyncio.ensure_future(instance)
+    future.add_done_callback(
+        functools.partial(_singleton_future_done, provider),
+    )
+    return future
 
-    __add_sys_streams(memo)
 
-    return copy.deepcopy(instance, memo)
+def _singleton_future_done(BaseSingleton provider, future):
+    """Forget failed or cancelled creation of singleton instance."""
+    if future.cancelled() or future.exception() is not None:
+        provider._forget_instance(future)
+
+
+async def _async_singleton_provide(AsyncSingleton provider, args, kwargs):
+    """Return single instance, creating it once for all concurrent callers."""
+    future = provider.__future
+
+    if future is not None and future.done():
+        if not future.cancelled() and future.exception() is None:
+            return future.result()
+        future = None
+
+    if future is None:
+        future = asyncio.ensure_future(
+            _async_singleton_create(provider, args, kwargs),
+        )
+        future.add_done_callback(
+            functools.partial(_async_singleton_created, provider),
+        )
+        provider.__future = future
+
+    return await asyncio.shield(future)
+
+
+async def _async_singleton_create(AsyncSingleton provider, args, kwargs):
+    """Create instance of asynchronous singleton."""
+    return await _async_mode_factory_call(provider.__instantiator,
+                                          args,
+                                          kwargs,
+                                          True)
+
+
+def _async_singleton_created(AsyncSingleton provider, future):
+    """Forget failed or cancelled creation of asynchronous singleton."""
+    if provider.__future is not future:
+        return
+    if future.cancelled() or future.exception() is not None:
+        provider.__future = None
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _async_mode_factory_call(Factory self,
+                                     tuple args,
+                                     dict kwargs,
+                                     bint await_result):
+    """Create instance, awaiting awaitable injections if there are any."""
+    cdef Callable instantiator = self.__instantiator
+    cdef tuple positional_args
+    cdef dict keyword_args
+    cdef dict attributes = None
+    cdef NamedInjection attr_injection
+    cdef object instance
+    cdef int index
+
+    positional_args = __provide_positional_args(args,
+                                                instantiator.__args,
+                                                instantiator.__args_len)
+    keyword_args = __provide_keyword_args(kwargs,
+                                          instantiator.__kwargs,
+                                          instantiator.__kwargs_len)
+
+    if self.__attributes_len > 0:
+        attributes = dict()
+        for index in range(self.__attributes_len):
+            attr_injection = <NamedInjection>self.__attributes[index]
+            attributes[__get_name(attr_injection)] = \
+                __get_value(attr_injection)
+
+    if (await_result or
+            _has_awaitables(positional_args, keyword_args, attributes)):
+        return _resolve_async_call(instantiator.__provides,
+                                   positional_args,
+                                   keyword_args,
+                                   attributes,
+                                   await_result)
+
+    instance = PyObject_Call(instantiator.__provides,
+                             positional_args,
+                             keyword_args)
+
+    if attributes is not None:
+        for name, value in attributes.items():
+            setattr(instance, name, value)
+
+    return instance
+
 
 def __add_sys_streams(memo):
     """Add system streams to memo dictionary.
@@ -2736,9 +7203,29 @@ def __add_sys_streams(memo):
     memo[id(sys.stderr)] = sys.stderr
 
 
+def _set_future_result(future, result):
+    """Set result of the future, if it is not done yet."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future, exception):
+    """Set exception of the future, if it is not done yet."""
+    if not future.done():
+        future.set_exception(exception)
+
+
+def _cancel_timer(timer, future):
+    """Cancel timer, when the future is done."""
+    timer.cancel()
+
+
 def merge_dicts(dict1, dict2):
     """Merge dictionaries recursively.
 
+    Dictionaries are not modified. Only dictionaries, that are merged, are
+    copied; other values are shared with the resulting dictionary.
+
     :param dict1: Dictionary 1
     :type dict1: dict
 
@@ -2748,10 +7235,15 @@ def merge_dicts(dict1, dict2):
     :return: New resulting dictionary
     :rtype: dict
     """
-    for key, value in dict1.items():
-        if key in dict2:
-            if isinstance(value, dict) and isinstance(dict2[key], dict):
-                dict2[key] = merge_dicts(value, dict2[key])
-    result = dict1.copy()
-    result.update(dict2)
+    cdef dict result = dict(dict1)
+    cdef PyObject* current
+
+    for key, value in dict2.items():
+        current = PyDict_GetItem(result, key)
+        if (current != NULL and
+                isinstance(<object>current, dict) and
+                isinstance(value, dict)):
+            value = merge_dicts(<object>current, value)
+        result[key] = value
+
     return result
@@ -0,0 +1,794 @@
+"""Dependency Injector benchmark suite.
+
+Run benchmarks and save results:
+
+.. code-block:: bash
+
+    python tests/performance/benchmark.py run --output results.json
+
+Compare results of two builds:
+
+.. code-block:: bash
+
+    python tests/performance/benchmark.py compare base.json results.json
+
+Comparison exits with status 1, if any benchmark is slower than base
+by more than threshold (5% by default).
+"""
+
+from __future__ import print_function
+
+import argparse
+import collections
+import gc
+import json
+import math
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import timeit
+import zlib
+
+import dependency_injector
+from dependency_injector import containers, providers
+
+
+BENCHMARKS = collections.OrderedDict()
+
+
+def benchmark(name):
+    """Register benchmark.
+
+    Decorated function prepares benchmark and returns callable, that is
+    timed. Function could return ``None`` if benchmark is not available.
+    """
+    def _decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return _decorator
+
+
+_cleanups = []
+
+
+def add_cleanup(function):
+    """Register function, that is called after current benchmark."""
+    _cleanups.append(function)
+
+
+class A(object):
+    pass
+
+
+class B(object):
+    pass
+
+
+class C(object):
+    pass
+
+
+class Test(object):
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+def _test_function(*args, **kwargs):
+    return args, kwargs
+
+
+# Baseline
+
+
+@benchmark('raw_3_kw_injections')
+def _():
+    return lambda: Test(a=A(), b=B(), c=C())
+
+
+# Factory
+
+
+@benchmark('factory_0_injections')
+def _():
+    return providers.Factory(Test)
+
+
+@benchmark('factory_3_kw_injections')
+def _():
+    return providers.Factory(
+        Test,
+        a=providers.Factory(A),
+        b=providers.Factory(B),
+        c=providers.Factory(C),
+    )
+
+
+@benchmark('factory_3_positional_injections')
+def _():
+    return providers.Factory(
+        Test,
+        providers.Factory(A),
+        providers.Factory(B),
+        providers.Factory(C),
+    )
+
+
+@benchmark('factory_10_injections')
+def _():
+    return providers.Factory(
+        Test,
+        providers.Factory(A),
+        providers.Factory(B),
+        1, 2,
+        c=providers.Factory(C),
+        d=providers.Object(None),
+        e=3, f=4, g=5, h=6,
+    )
+
+
+@benchmark('factory_2_kw_injections_1_context_kwarg')
+def _():
+    factory = providers.Factory(
+        Test,
+        a=providers.Factory(A),
+        b=providers.Factory(B),
+    )
+    return lambda: factory(c=None)
+
+
+@benchmark('factory_6_constant_kw_injections_3_context_kwargs')
+def _():
+    factory = providers.Factory(Test, a=1, b=2, c=3)
+    return lambda: factory(d=4, e=5, f=6)
+
+
+@benchmark('factory_12_constant_kw_injections_1_provider_injection')
+def _():
+    constants = dict(('option{0}'.format(index), index)
+                     for index in range(12))
+    return providers.Factory(Test, client=providers.Factory(A), **constants)
+
+
+@benchmark('factory_13_constant_positional_injections')
+def _():
+    return providers.Factory(Test, A(), *range(12))
+
+
+@benchmark('factory_3_attribute_injections')
+def _():
+    return providers.Factory(A).add_attributes(
+        a=providers.Factory(A),
+        b=providers.Factory(B),
+        c=3,
+    )
+
+
+def _batch_factory():
+    return providers.Factory(Test, a=providers.Factory(A))
+
+
+_BATCH_KWARGS = [dict(index=index) for index in range(1000)]
+
+
+@benchmark('factory_loop_of_1000_calls')
+def _():
+    factory = _batch_factory()
+    return lambda: [factory(index=0) for _ in range(1000)]
+
+
+@benchmark('factory_many_1000')
+def _():
+    factory = _batch_factory()
+    return lambda: factory.many(1000, index=0)
+
+
+@benchmark('factory_loop_of_1000_calls_with_kwargs')
+def _():
+    factory = _batch_factory()
+    return lambda: [factory(**kwargs) for kwargs in _BATCH_KWARGS]
+
+
+@benchmark('factory_map_1000')
+def _():
+    factory = _batch_factory()
+    return lambda: factory.map(_BATCH_KWARGS)
+
+
+@benchmark('abstract_factory_3_kw_injections')
+def _():
+    factory = providers.AbstractFactory(object)
+    factory.override(providers.Factory(
+        Test,
+        a=providers.Factory(A),
+        b=providers.Factory(B),
+        c=providers.Factory(C),
+    ))
+    return factory
+
+
+# Callable
+
+
+@benchmark('callable_0_injections')
+def _():
+    return providers.Callable(_test_function)
+
+
+@benchmark('callable_3_injections')
+def _():
+    return providers.Callable(
+        _test_function,
+        providers.Factory(A),
+        b=providers.Factory(B),
+        c=3,
+    )
+
+
+# Singletons
+
+
+@benchmark('singleton')
+def _():
+    singleton = providers.Singleton(Test, a=providers.Factory(A))
+    singleton()
+    return singleton
+
+
+@benchmark('thread_safe_singleton')
+def _():
+    singleton = providers.ThreadSafeSingleton(Test, a=providers.Factory(A))
+    singleton()
+    return singleton
+
+
+@benchmark('thread_local_singleton')
+def _():
+    singleton = providers.ThreadLocalSingleton(Test, a=providers.Factory(A))
+    singleton()
+    return singleton
+
+
+class SharedLockSingleton(providers.ThreadSafeSingleton):
+    storage_lock = threading.RLock()
+
+
+def _singletons_contention(singleton_cls, threads=8, calls=1000):
+    a = singleton_cls(A)
+    b = singleton_cls(B)
+    c = singleton_cls(C)
+    test = singleton_cls(Test, a=a, b=b, c=c)
+    singletons = (a, b, c, test)
+
+    def _worker():
+        for _ in range(calls):
+            for singleton in singletons:
+                singleton()
+
+    def _run():
+        workers = [threading.Thread(target=_worker) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    return _run
+
+
+@benchmark('thread_safe_singleton_8_threads')
+def _():
+    return _singletons_contention(providers.ThreadSafeSingleton)
+
+
+@benchmark('thread_safe_singleton_shared_lock_8_threads')
+def _():
+    return _singletons_contention(SharedLockSingleton)
+
+
+@benchmark('singleton_injection')
+def _():
+    return providers.Factory(Test, a=providers.Singleton(A))
+
+
+# Configuration
+
+
+_configs = []
+
+
+def _config():
+    # Options refer to configuration weakly, so it is kept alive here
+    config = providers.Configuration()
+    _configs.append(config)
+    config.from_dict({
+        'database': {
+            'host': 'localhost',
+            'port': 5432,
+            'options': {'timeout': 10},
+        },
+    })
+    return config
+
+
+@benchmark('configuration_option_call')
+def _():
+    option = _config().database.options.timeout
+    option()
+    return option
+
+
+@benchmark('configuration_option_lookup')
+def _():
+    config = _config()
+    return lambda: config.database.options.timeout()
+
+
+@benchmark('configuration_option_injection')
+def _():
+    config = _config()
+    return providers.Factory(
+        Test,
+        host=config.database.host,
+        port=config.database.port,
+    )
+
+
+# Selector and FactoryAggregate
+
+
+@benchmark('selector')
+def _():
+    return providers.Selector(
+        providers.Object('b'),
+        a=providers.Factory(A),
+        b=providers.Factory(B),
+    )
+
+
+@benchmark('factory_aggregate')
+def _():
+    aggregate = providers.FactoryAggregate(
+        a=providers.Factory(A),
+        b=providers.Factory(B),
+    )
+    return lambda: aggregate('b')
+
+
+# Pool
+
+
+class Compressor(object):
+    def __init__(self, level):
+        self.context = zlib.compressobj(level)
+        self.buffer = bytearray(256 * 1024)
+
+
+@benchmark('factory_of_expensive_instance')
+def _():
+    return providers.Factory(Compressor, level=6)
+
+
+@benchmark('pool_acquire_and_release')
+def _():
+    pool = providers.Pool(Compressor, level=6)
+
+    def _acquire_and_release():
+        with pool.acquire():
+            pass
+
+    return _acquire_and_release
+
+
+# Instrumentation
+
+
+@benchmark('factory_2_kw_injections')
+def _():
+    return providers.Factory(
+        Test,
+        a=providers.Factory(A),
+        b=providers.Factory(B),
+    )
+
+
+@benchmark('factory_2_kw_injections_instrumented')
+def _():
+    providers.enable_instrumentation()
+    add_cleanup(providers.disable_instrumentation)
+    return providers.Factory(
+        Test,
+        a=providers.Factory(A),
+        b=providers.Factory(B),
+    )
+
+
+# Overriding
+
+
+@benchmark('override_and_reset')
+def _():
+    factory = providers.Factory(A)
+    overriding = providers.Factory(B)
+
+    def _override_and_reset():
+        factory.override(overriding)
+        factory.reset_override()
+
+    return _override_and_reset
+
+
+@benchmark('overridden_factory')
+def _():
+    factory = providers.Factory(A)
+    factory.override(providers.Factory(B))
+    return factory
+
+
+# Containers
+
+
+class Container(containers.DeclarativeContainer):
+
+    config = providers.Configuration()
+    database = providers.Singleton(Test, dsn=config.database.dsn)
+    cache = providers.Singleton(Test, host=config.cache.host)
+    users_repository = providers.Factory(Test, database=database)
+    photos_repository = providers.Factory(Test, database=database)
+    users_service = providers.Factory(
+        Test,
+        repository=users_repository,
+        cache=cache,
+    )
+    photos_service = providers.Factory(
+        Test,
+        repository=photos_repository,
+        users=users_service,
+    )
+    auth_service = providers.Factory(
+        Test,
+        users=users_service,
+        token_ttl=config.auth.token_ttl,
+    )
+    handlers = providers.List(users_service, photos_service, auth_service)
+
+
+@benchmark('container_instantiation')
+def _():
+    return Container
+
+
+@benchmark('container_deepcopy')
+def _():
+    container = Container()
+    return lambda: providers.deepcopy(container)
+
+
+def _create_large_container_cls(providers_number=800, **attributes):
+    config = providers.Configuration()
+    attributes['config'] = config
+    previous = None
+    for index in range(providers_number):
+        if index % 2:
+            provider = providers.Singleton(Test, config.option, index=index)
+            provider.add_attributes(previous=previous)
+        else:
+            provider = providers.Factory(Test, dependency=previous, name='test')
+        attributes['provider{0}'.format(index)] = provider
+        previous = provider
+    return containers.DeclarativeContainerMetaClass(
+        'LargeContainer',
+        (containers.DeclarativeContainer,),
+        attributes,
+    )
+
+
+@benchmark('container_instantiation_800_providers')
+def _():
+    container_cls = _create_large_container_cls()
+    container_cls()
+    return container_cls
+
+
+@benchmark('deepcopy_800_providers')
+def _():
+    graph = dict(_create_large_container_cls().providers)
+    return lambda: providers.deepcopy(graph)
+
+
+@benchmark('container_lazy_instantiation_800_providers')
+def _():
+    return _create_large_container_cls(lazy_instantiation=True)
+
+
+@benchmark('container_lazy_instantiation_800_providers_10_accessed')
+def _():
+    container_cls = _create_large_container_cls(lazy_instantiation=True)
+    names = ['provider{0}'.format(index) for index in range(10)]
+
+    def _instantiate_and_access():
+        container = container_cls()
+        for name in names:
+            getattr(container, name)
+
+    return _instantiate_and_access
+
+
+# Configuration loading
+
+
+_YAML = """
+database:
+  dsn: ${DATABASE_DSN}
+  pool:
+    size: 10
+    timeout: 30
+cache:
+  host: localhost
+  port: 6379
+auth:
+  token_ttl: 3600
+"""
+
+_INI = """
+[database]
+dsn = ${DATABASE_DSN}
+pool_size = 10
+
+[cache]
+host = localhost
+port = 6379
+
+[auth]
+token_ttl = 3600
+"""
+
+
+def _write_file(name, content):
+    path = os.path.join(_get_temp_dir(), name)
+    with open(path, 'w') as file:
+        file.write(content)
+    return path
+
+
+_temp_dir = []
+
+
+def _get_temp_dir():
+    if not _temp_dir:
+        _temp_dir.append(tempfile.mkdtemp())
+    return _temp_dir[0]
+
+
+@benchmark('configuration_from_yaml')
+def _():
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        return None
+
+    path = _write_file('config.yml', _YAML)
+    os.environ.setdefault('DATABASE_DSN', 'sqlite://')
+    return lambda: providers.Configuration().from_yaml(path)
+
+
+@benchmark('configuration_from_yaml_pure_python_loader')
+def _():
+    try:
+        import yaml
+    except ImportError:
+        return None
+
+    path = _write_file('config.yml', _YAML)
+    os.environ.setdefault('DATABASE_DSN', 'sqlite://')
+    return lambda: providers.Configuration().from_yaml(path, loader=yaml.Loader)
+
+
+@benchmark('configuration_from_yaml_cached')
+def _():
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        return None
+
+    path = _write_file('config.yml', _YAML)
+    cache_dir = os.path.join(_get_temp_dir(), 'cache')
+    os.environ.setdefault('DATABASE_DSN', 'sqlite://')
+
+    def _load():
+        providers.enable_yaml_cache(cache_dir)
+        try:
+            providers.Configuration().from_yaml(path)
+        finally:
+            providers.disable_yaml_cache()
+
+    return _load
+
+
+@benchmark('configuration_from_ini')
+def _():
+    path = _write_file('config.ini', _INI)
+    os.environ.setdefault('DATABASE_DSN', 'sqlite://')
+    return lambda: providers.Configuration().from_ini(path)
+
+
+# Runner
+
+
+def measure(function, min_time, repeat, warmup):
+    """Measure function and return statistics in nanoseconds per call."""
+    timer = timeit.Timer(function)
+
+    loops = 1
+    while True:
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    warmup_end = timeit.default_timer() + warmup
+    while timeit.default_timer() < warmup_end:
+        timer.timeit(loops)
+
+    samples = sorted(timer.timeit(loops) / loops * 1e9
+                     for _ in range(repeat))
+    mean = sum(samples) / len(samples)
+    stdev = math.sqrt(sum((sample - mean) ** 2 for sample in samples) /
+                      max(len(samples) - 1, 1))
+
+    return {
+        'min': samples[0],
+        'median': _median(samples),
+        'mean': mean,
+        'stdev': stdev,
+        'loops': loops,
+        'repeat': repeat,
+    }
+
+
+def _median(samples):
+    middle = len(samples) // 2
+    if len(samples) % 2:
+        return samples[middle]
+    return (samples[middle - 1] + samples[middle]) / 2.0
+
+
+def run(args):
+    """Run benchmarks."""
+    pattern = re.compile(args.filter) if args.filter else None
+    results = collections.OrderedDict()
+
+    try:
+        for name, setup in BENCHMARKS.items():
+            if pattern and not pattern.search(name):
+                continue
+
+            try:
+                function = setup()
+                if function is None:
+                    print('{0:<55} skipped'.format(name), file=sys.stderr)
+                    continue
+
+                gc.collect()
+                results[name] = measure(function,
+                                        min_time=args.min_time,
+                                        repeat=args.repeat,
+                                        warmup=args.warmup)
+            finally:
+                while _cleanups:
+                    _cleanups.pop()()
+
+            print('{0:<55} {1:>12.1f} ns  (+- {2:.1f}%)'.format(
+                name,
+                results[name][args.stat],
+                results[name]['stdev'] / results[name]['mean'] * 100,
+            ), file=sys.stderr)
+    finally:
+        if _temp_dir:
+            shutil.rmtree(_temp_dir.pop(), ignore_errors=True)
+
+    report = collections.OrderedDict((
+        ('dependency_injector', dependency_injector.__version__),
+        ('python', platform.python_version()),
+        ('implementation', platform.python_implementation()),
+        ('platform', platform.platform()),
+        ('benchmarks', results),
+    ))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+def compare(args):
+    """Compare results of two benchmark runs."""
+    with open(args.base) as file:
+        base = json.load(file)['benchmarks']
+    with open(args.new) as file:
+        new = json.load(file)['benchmarks']
+
+    regressions = 0
+    print('{0:<55} {1:>12} {2:>12} {3:>8}'.format(
+        'benchmark', 'base, ns', 'new, ns', 'change'))
+
+    for name in base:
+        if name not in new:
+            continue
+
+        base_value = base[name][args.stat]
+        new_value = new[name][args.stat]
+        change = new_value / base_value - 1
+
+        mark = ''
+        if change > args.threshold:
+            mark = '  REGRESSION'
+            regressions += 1
+        elif change < -args.threshold:
+            mark = '  improvement'
+
+        print('{0:<55} {1:>12.1f} {2:>12.1f} {3:>+7.1%}{4}'.format(
+            name, base_value, new_value, change, mark))
+
+    missing = [name for name in base if name not in new]
+    added = [name for name in new if name not in base]
+    if missing:
+        print('\nMissing benchmarks: {0}'.format(', '.join(missing)))
+    if added:
+        print('\nNew benchmarks: {0}'.format(', '.join(added)))
+
+    if regressions:
+        print('\n{0} regression(s) over {1:.0%} threshold'.format(
+            regressions, args.threshold))
+        return 1
+    return 0
+
+
+def main(argv=None):
+    """Run command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command')
+
+    run_parser = subparsers.add_parser('run', help='run benchmarks')
+    run_parser.add_argument('-o', '--output',
+                            help='file for JSON results, stdout by default')
+    run_parser.add_argument('-k', '--filter',
+                            help='regular expression of benchmark names')
+    run_parser.add_argument('--min-time', type=float, default=0.1,
+                            help='minimal time of one sample, seconds')
+    run_parser.add_argument('--repeat', type=int, default=7,
+                            help='number of samples')
+    run_parser.add_argument('--warmup', type=float, default=0.1,
+                            help='warmup time, seconds')
+    run_parser.add_argument('--stat', default='min',
+                            choices=('min', 'median', 'mean'),
+                            help='statistic to print')
+    run_parser.set_defaults(function=run)
+
+    compare_parser = subparsers.add_parser(
+        'compare',
+        help='compare results and flag regressions',
+    )
+    compare_parser.add_argument('base', help='base results file')
+    compare_parser.add_argument('new', help='new results file')
+    compare_parser.add_argument('--threshold', type=float, default=0.05,
+                                help='relative slowdown that is regression')
+    compare_parser.add_argument('--stat', default='min',
+                                choices=('min', 'median', 'mean'),
+                                help='statistic to compare')
+    compare_parser.set_defaults(function=compare)
+
+    args = parser.parse_args(argv)
+    if not getattr(args, 'function', None):
+        parser.print_help()
+        return 2
+    return args.function(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
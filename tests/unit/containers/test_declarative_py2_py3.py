@@ -330,3 +330,143 @@ class DeclarativeContainerTests(unittest.TestCase):
         a = providers.Factory(A)
         assert isinstance(Services(a=a).c().a, A)  # ok
         Services(a=a).b().fa()
+
+    def test_providers_template(self):
+        p1 = providers.Object(1)
+
+        class _Container(containers.DeclarativeContainer):
+            p2 = providers.Factory(dict, p1=p1)
+
+        _Container.p1 = p1
+        _Container()
+
+        template = _Container.providers_template
+
+        self.assertIsInstance(template, containers.ProvidersTemplate)
+        self.assertEqual(len(template.table), 2)
+        self.assertLess(
+            template.table.index(_Container.p1),
+            template.table.index(_Container.p2),
+        )
+        self.assertIs(template.table[template.indexes['p1']], _Container.p1)
+        self.assertIs(template.table[template.indexes['p2']], _Container.p2)
+
+    def test_providers_template_invalidation(self):
+        class _Container(containers.DeclarativeContainer):
+            p1 = providers.Object(1)
+
+        _Container.p2 = providers.Object(2)
+        self.assertIsNone(_Container.providers_template)
+
+        container = _Container()
+
+        self.assertEqual(container.p2(), 2)
+        self.assertIn('p2', _Container.providers_template.indexes)
+
+        del _Container.p2
+        self.assertIsNone(_Container.providers_template)
+
+        self.assertNotIn('p2', _Container().providers)
+
+    def test_providers_template_copiers(self):
+        class _Container(containers.DeclarativeContainer):
+            config = providers.Configuration()
+            p1 = providers.Callable(dict, value=config.value)
+            p2 = providers.Factory(dict, p1=p1, values=[1, 2])
+            p3 = providers.Singleton(dict, p2=p2)
+            p4 = providers.ThreadSafeSingleton(dict, p3=p3)
+            p5 = providers.List(p3, p4, 5)
+
+        container = _Container(config=providers.Object({'value': 1}))
+        template = _Container.providers_template
+
+        self.assertIsNone(template.copiers[template.indexes['config']])
+        for name in ('p1', 'p2', 'p3', 'p4', 'p5'):
+            self.assertIsNotNone(template.copiers[template.indexes[name]])
+
+        self.assertIs(container.p2.kwargs['p1'], container.p1)
+        self.assertIs(container.p3.kwargs['p2'], container.p2)
+        self.assertIs(container.p4.kwargs['p3'], container.p3)
+        self.assertEqual(container.p5.args, (container.p3, container.p4, 5))
+        self.assertIsNot(container.p2.kwargs['values'],
+                         _Container.p2.kwargs['values'])
+        self.assertEqual(container.p2.kwargs['values'], [1, 2])
+
+        p3, p4, value = container.p5()
+        self.assertEqual(p3, {'p2': {'p1': {'value': 1}, 'values': [1, 2]}})
+        self.assertIs(p4['p3'], p3)
+        self.assertIs(container.p3(), p3)
+
+        other = _Container(config=providers.Object({'value': 1}))
+        self.assertIsNot(other.p3(), p3)
+
+    def test_providers_template_copiers_of_changed_providers(self):
+        class _Container(containers.DeclarativeContainer):
+            p1 = providers.Factory(dict, value=1)
+            p2 = providers.Singleton(dict, p1=p1)
+
+        _Container()
+        _Container.p1.add_kwargs(other=2)
+        _Container.p2.override(providers.Factory(dict, overridden=True))
+
+        container = _Container()
+
+        self.assertEqual(container.p1(), {'value': 1, 'other': 2})
+        self.assertEqual(container.p2(), {'overridden': True})
+        self.assertIsNot(container.p2.last_overriding,
+                         _Container.p2.last_overriding)
+
+        _Container.p2.reset_override()
+
+        self.assertEqual(_Container().p2(), {'p1': {'value': 1, 'other': 2}})
+
+    def test_providers_template_copiers_of_overridden_providers(self):
+        class _Container(containers.DeclarativeContainer):
+            p1 = providers.Factory(dict, value=1)
+            p2 = providers.Factory(dict, value=2)
+
+        _Container.p1.override(_Container.p2)
+        try:
+            container = _Container()
+        finally:
+            _Container.p1.reset_override()
+
+        self.assertEqual(container.p1.overridden, (container.p2,))
+        self.assertEqual(container.p1(), {'value': 2})
+
+    def test_providers_template_with_custom_instance_type(self):
+        names = []
+
+        class _DynamicContainer(containers.DynamicContainer):
+            def __setattr__(self, name, value):
+                names.append(name)
+                super(_DynamicContainer, self).__setattr__(name, value)
+
+        class _Container(containers.DeclarativeContainer):
+            instance_type = _DynamicContainer
+            p1 = providers.Object(1)
+
+        container = _Container()
+
+        self.assertIn('p1', names)
+        self.assertEqual(container.providers, {'p1': container.p1})
+        self.assertEqual(container.p1(), 1)
+
+    def test_init_with_deep_dependencies_chain(self):
+        chain = [providers.Object(0)]
+        for _ in range(3000):
+            chain.append(providers.Callable(lambda value: value + 1, chain[-1]))
+
+        _Container = containers.DeclarativeContainerMetaClass(
+            '_Container',
+            (containers.DeclarativeContainer,),
+            {'last': chain[-1]},
+        )
+
+        container = _Container()
+
+        provider, original = container.last, _Container.last
+        while isinstance(provider, providers.Callable):
+            self.assertIsNot(provider, original)
+            provider, original = provider.args[0], original.args[0]
+        self.assertIsNot(provider, chain[0])
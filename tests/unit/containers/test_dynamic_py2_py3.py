@@ -1,5 +1,17 @@
 """Dependency injector dynamic container unit tests."""
 
+import threading
+
+try:
+    import concurrent.futures as futures
+except ImportError:
+    futures = None
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
 import unittest2 as unittest
 
 from dependency_injector import (
@@ -187,5 +199,319 @@ class DeclarativeContainerInstanceTests(unittest.TestCase):
         self.assertEqual(container.p11.overridden, tuple())
 
 
+class LazyContainer(containers.DeclarativeContainer):
+    lazy_instantiation = True
+
+    p11 = providers.Factory(list)
+    p12 = providers.Factory(dict, p11=p11)
+    p13 = providers.Factory(dict, p11=p11)
+
+
+class LazyDeclarativeContainerInstanceTests(unittest.TestCase):
+
+    def test_providers_are_not_copied_on_instantiation(self):
+        container = LazyContainer()
+
+        self.assertNotIn('p11', container.__dict__)
+        self.assertNotIn('p12', container.__dict__)
+        self.assertNotIn('p13', container.__dict__)
+
+    def test_provider_is_copied_on_access(self):
+        container = LazyContainer()
+
+        p11 = container.p11
+
+        self.assertIsInstance(p11, providers.Factory)
+        self.assertIsNot(p11, LazyContainer.p11)
+        self.assertIs(container.p11, p11)
+        self.assertNotIn('p12', container.__dict__)
+
+    def test_dependencies_are_shared(self):
+        container = LazyContainer()
+
+        p12 = container.p12
+        p13 = container.p13
+        p11 = container.p11
+
+        self.assertIs(p12.kwargs['p11'], p11)
+        self.assertIs(p13.kwargs['p11'], p11)
+
+    def test_providers_attribute(self):
+        container = LazyContainer()
+
+        self.assertEqual(container.providers, dict(p11=container.p11,
+                                                   p12=container.p12,
+                                                   p13=container.p13))
+        self.assertIs(container.p12.kwargs['p11'], container.p11)
+
+    def test_containers_do_not_share_copies(self):
+        container1 = LazyContainer()
+        container2 = LazyContainer()
+
+        self.assertIsNot(container1.p11, container2.p11)
+
+    def test_set_provider_before_access(self):
+        container = LazyContainer()
+        p11 = providers.Factory(list)
+
+        container.p11 = p11
+
+        self.assertIs(container.p11, p11)
+        self.assertIs(container.providers['p11'], p11)
+
+    def test_del_provider_before_access(self):
+        container = LazyContainer()
+
+        del container.p11
+
+        self.assertNotIn('p11', container.providers)
+        with self.assertRaises(AttributeError):
+            container.p11
+
+    def test_unknown_attribute(self):
+        container = LazyContainer()
+
+        with self.assertRaises(AttributeError):
+            container.unknown
+
+    def test_override_providers(self):
+        p11 = providers.Object([1])
+
+        container = LazyContainer(p11=p11)
+
+        self.assertIs(container.p11.last_overriding, p11)
+        self.assertEqual(container.p12(), {'p11': [1]})
+
+    def test_deepcopy(self):
+        container = LazyContainer()
+
+        container_copy = providers.deepcopy(container)
+
+        self.assertIsNot(container_copy.p11, container.p11)
+        self.assertIs(container_copy.p12.kwargs['p11'], container_copy.p11)
+
+
+@unittest.skipIf(contextvars is None, 'contextvars is not available')
+class ScopeTests(unittest.TestCase):
+
+    def test_scope(self):
+        torn_down = []
+        container = containers.DynamicContainer()
+        container.session = providers.ContextLocalSingleton(
+            object,
+        ).set_teardown(torn_down.append)
+
+        with container.scope() as scope:
+            self.assertIsInstance(scope, providers.Scope)
+            session = container.session()
+            self.assertIs(container.session(), session)
+
+        self.assertEqual(torn_down, [session])
+
+    def test_scope_of_other_container(self):
+        container = containers.DynamicContainer()
+        container.session = providers.ContextLocalSingleton(object)
+        container.service = providers.Factory(
+            dict,
+            session=providers.ContextLocalSingleton(object),
+        )
+        other_container = containers.DynamicContainer()
+        other_container.session = providers.ContextLocalSingleton(object)
+        other_session = other_container.session()
+
+        with container.scope() as scope:
+            session = container.service()['session']
+            self.assertIs(other_container.session(), other_session)
+
+        self.assertEqual(
+            scope.providers,
+            frozenset([container.session, container.service.kwargs['session']]),
+        )
+        self.assertIsNot(container.service()['session'], session)
+
+
+class InitSingletonsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.created = []
+        self.lock = threading.Lock()
+
+    def _create(self, name, *dependencies):
+        with self.lock:
+            self.created.append(name)
+        return name
+
+    def _container(self):
+        container = containers.DynamicContainer()
+        container.db = providers.ThreadSafeSingleton(self._create, 'db')
+        container.cache = providers.Singleton(self._create, 'cache')
+        container.repository = providers.Factory(self._create, 'repository',
+                                                 container.db)
+        container.service = providers.Singleton(self._create, 'service',
+                                                container.repository,
+                                                container.cache)
+        container.api = providers.Singleton(self._create, 'api',
+                                            container.service)
+        container.local = providers.ThreadLocalSingleton(self._create,
+                                                         'local')
+        container.factory = providers.Factory(self._create, 'factory')
+        return container
+
+    def test_singletons_levels(self):
+        container = self._container()
+
+        levels = containers._get_singletons_levels(container.providers, False)
+
+        self.assertEqual(len(levels), 3)
+        self.assertEqual(set(levels[0]), {container.db, container.cache})
+        self.assertEqual(levels[1], [container.service])
+        self.assertEqual(levels[2], [container.api])
+
+    def test_init_singletons(self):
+        container = self._container()
+
+        container.init_singletons()
+
+        self.assertEqual(set(self.created[:2]), {'db', 'cache'})
+        self.assertEqual(self.created[2:], ['repository', 'service', 'api'])
+
+        self.assertEqual(container.api(), 'api')
+        self.assertEqual(len(self.created), 5)
+
+    def test_init_singletons_with_executor(self):
+        container = self._container()
+        executor = futures.ThreadPoolExecutor(max_workers=2)
+
+        container.init_singletons(executor=executor)
+        executor.shutdown()
+
+        self.assertEqual(len(self.created), 5)
+
+    def test_init_singletons_default_max_workers(self):
+        container = containers.DynamicContainer()
+        for index in range(100):
+            setattr(container, 'singleton{0}'.format(index),
+                    providers.Singleton(object))
+        executors = []
+
+        class Executor(futures.ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                executors.append(max_workers)
+                super(Executor, self).__init__(max_workers)
+
+        thread_pool_executor = futures.ThreadPoolExecutor
+        futures.ThreadPoolExecutor = Executor
+        try:
+            container.init_singletons()
+        finally:
+            futures.ThreadPoolExecutor = thread_pool_executor
+
+        self.assertLessEqual(executors[0], 32)
+
+    def test_init_singletons_error(self):
+        container = self._container()
+        container.cache.override(providers.Callable(_fail))
+
+        with self.assertRaises(RuntimeError):
+            container.init_singletons(max_workers=1)
+
+        self.assertNotIn('service', self.created)
+
+    def test_init_singletons_without_singletons(self):
+        container = containers.DynamicContainer()
+        container.factory = providers.Factory(object)
+
+        container.init_singletons()
+
+    def test_init_abstract_singletons(self):
+        container = containers.DynamicContainer()
+        container.abstract = providers.AbstractSingleton(object)
+
+        container.init_singletons()
+
+        container.abstract.override(
+            providers.Singleton(self._create, 'abstract'),
+        )
+        container.init_singletons()
+
+        self.assertEqual(self.created, ['abstract'])
+
+    def test_init_singletons_skips_selector_branches(self):
+        container = containers.DynamicContainer()
+        container.config = providers.Configuration()
+        container.config.from_dict({'cache': 'memory'})
+        container.cache = providers.Selector(
+            container.config.cache,
+            memory=providers.Singleton(self._create, 'memory'),
+            redis=providers.Singleton(_fail),
+        )
+        container.service = providers.Singleton(self._create, 'service',
+                                                container.cache)
+
+        container.init_singletons()
+
+        self.assertEqual(self.created, ['memory', 'service'])
+        self.assertEqual(
+            containers._get_singletons_levels(container.providers, False),
+            [[container.service]],
+        )
+
+    def test_init_singletons_selector_branch_container_member(self):
+        container = containers.DynamicContainer()
+        container.config = providers.Configuration()
+        container.config.from_dict({'cache': 'memory'})
+        container.memory = providers.Singleton(self._create, 'memory')
+        container.cache = providers.Selector(
+            container.config.cache,
+            memory=container.memory,
+            redis=providers.Singleton(_fail),
+        )
+
+        container.init_singletons()
+
+        self.assertEqual(self.created, ['memory'])
+        self.assertEqual(
+            containers._get_singletons_levels(container.providers, False),
+            [[container.memory]],
+        )
+
+
+class StatsTests(unittest.TestCase):
+
+    def tearDown(self):
+        providers.disable_instrumentation()
+
+    def test_stats(self):
+        container = containers.DynamicContainer()
+        container.dependency = providers.Factory(object)
+        container.service = providers.Factory(dict,
+                                              dependency=container.dependency)
+        container.unused = providers.Factory(object)
+
+        providers.enable_instrumentation()
+        container.service()
+        container.service()
+
+        stats = container.stats()
+
+        self.assertEqual(set(stats), {'dependency', 'service'})
+        self.assertEqual(stats['service']['calls'], 2)
+        self.assertEqual(stats['dependency']['calls'], 2)
+        self.assertGreaterEqual(stats['service']['total_time'],
+                                stats['dependency']['total_time'])
+
+    def test_stats_without_instrumentation(self):
+        container = containers.DynamicContainer()
+        container.service = providers.Factory(object)
+
+        container.service()
+
+        self.assertEqual(container.stats(), {})
+
+
+def _fail():
+    raise RuntimeError()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,100 @@
+"""Dependency injector dynamic container asyncio unit tests."""
+
+import asyncio
+import sys
+
+import unittest2 as unittest
+
+from dependency_injector import (
+    containers,
+    providers,
+)
+
+
+class AsyncInitSingletonsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.created = []
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def _run(self, f):
+        return self.loop.run_until_complete(f)
+
+    def _create(self, name, *dependencies):
+        self.created.append(name)
+        return name
+
+    async def _async_create(self, name, *dependencies):
+        await asyncio.sleep(0)
+        self.created.append(name)
+        return name
+
+    def test_async_init_singletons(self):
+        container = containers.DynamicContainer()
+        container.db = providers.AsyncSingleton(self._async_create, 'db')
+        container.cache = providers.Singleton(self._create, 'cache')
+        container.service = providers.AsyncSingleton(self._async_create,
+                                                     'service',
+                                                     container.db,
+                                                     container.cache)
+
+        self._run(container.async_init_singletons())
+
+        self.assertEqual(set(self.created[:2]), {'db', 'cache'})
+        self.assertEqual(self.created[2:], ['service'])
+        self.assertTrue(container.db.initialized)
+        self.assertTrue(container.service.initialized)
+        self.assertEqual(self._run(container.service()), 'service')
+        self.assertEqual(len(self.created), 3)
+
+    def test_singletons_levels_with_async_singletons(self):
+        container = containers.DynamicContainer()
+        container.db = providers.AsyncSingleton(self._async_create, 'db')
+        container.service = providers.Singleton(self._create, 'service',
+                                                container.db)
+
+        self.assertEqual(
+            containers._get_singletons_levels(container.providers, True),
+            [[container.db], [container.service]],
+        )
+        self.assertEqual(
+            containers._get_singletons_levels(container.providers, False),
+            [[container.service]],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+class ScopeTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'contextvars is not available')
+    def test_async_scope(self):
+        torn_down = []
+        container = containers.DynamicContainer()
+        container.session = providers.ContextLocalSingleton(
+            object,
+        ).set_teardown(torn_down.append)
+
+        async def _request():
+            async with container.scope():
+                return container.session(), container.session()
+
+        instance1, instance2 = self.loop.run_until_complete(_request())
+
+        self.assertIs(instance1, instance2)
+        self.assertEqual(torn_down, [instance1])
@@ -1,5 +1,13 @@
 """Dependency injector base providers unit tests."""
 
+import threading
+import time
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
 import unittest2 as unittest
 
 from dependency_injector import (
@@ -107,6 +115,42 @@ class ProviderTests(unittest.TestCase):
 
         self.assertEqual(self.provider.overridden, tuple())
 
+    def test_overridden_is_snapshot(self):
+        overriding_provider1 = providers.Provider()
+        overriding_provider2 = providers.Provider()
+
+        self.provider.override(overriding_provider1)
+        overridden = self.provider.overridden
+
+        self.provider.override(overriding_provider2)
+        self.provider.reset_override()
+
+        self.assertEqual(overridden, (overriding_provider1,))
+
+    def test_overriding_lock_is_not_shared(self):
+        provider = providers.Provider()
+
+        self.assertIsNotNone(self.provider.overriding_lock)
+        self.assertIsNot(self.provider.overriding_lock, provider.overriding_lock)
+
+    def test_override_from_multiple_threads(self):
+        overriding_providers = [providers.Object(index) for index in range(10)]
+
+        def _worker(overriding_provider):
+            for _ in range(100):
+                self.provider.override(overriding_provider)
+                self.provider.reset_last_overriding()
+
+        workers = [threading.Thread(target=_worker, args=(overriding_provider,))
+                   for overriding_provider in overriding_providers]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(self.provider.overridden, tuple())
+        self.assertIsNone(self.provider.last_overriding)
+
     def test_deepcopy(self):
         provider = providers.Provider()
 
@@ -145,6 +189,263 @@ class ProviderTests(unittest.TestCase):
                          'Provider() at {0}>'.format(hex(id(self.provider))))
 
 
+@unittest.skipIf(contextvars is None, 'contextvars is not available')
+class ContextOverridingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = providers.Factory(object)
+
+    def test_override_in_context(self):
+        overriding_provider = providers.Object(1)
+
+        with self.provider.override_in_context(overriding_provider) as overriding:
+            self.assertIs(overriding, overriding_provider)
+            self.assertEqual(self.provider(), 1)
+            self.assertFalse(self.provider.overridden)
+
+        self.assertNotEqual(self.provider(), 1)
+
+    def test_override_in_context_with_not_provider(self):
+        obj = object()
+
+        with self.provider.override_in_context(obj):
+            self.assertIs(self.provider(), obj)
+
+    def test_override_in_context_with_itself(self):
+        self.assertRaises(errors.Error, self.provider.override_in_context, self.provider)
+
+    def test_nested_override_in_context(self):
+        with self.provider.override_in_context(providers.Object(1)):
+            with self.provider.override_in_context(providers.Object(2)):
+                self.assertEqual(self.provider(), 2)
+            self.assertEqual(self.provider(), 1)
+
+    def test_reset(self):
+        context = self.provider.override_in_context(providers.Object(1))
+        self.assertEqual(self.provider(), 1)
+
+        context.reset()
+
+        self.assertNotEqual(self.provider(), 1)
+
+    def test_precedence_over_override(self):
+        self.provider.override(providers.Object(1))
+
+        with self.provider.override_in_context(providers.Object(2)):
+            self.assertEqual(self.provider(), 2)
+
+        self.assertEqual(self.provider(), 1)
+
+    def test_isolation_between_contexts(self):
+        context = contextvars.copy_context()
+
+        def _override():
+            self.provider.override_in_context(providers.Object(1))
+            return self.provider()
+
+        self.assertEqual(context.run(_override), 1)
+        self.assertEqual(context.run(self.provider), 1)
+        self.assertNotEqual(self.provider(), 1)
+
+    def test_isolation_between_threads(self):
+        results = []
+
+        def _worker():
+            results.append(self.provider())
+
+        with self.provider.override_in_context(providers.Object(1)):
+            worker = threading.Thread(target=_worker)
+            worker.start()
+            worker.join()
+
+        self.assertNotEqual(results[0], 1)
+
+    def test_abstract_provider(self):
+        provider = providers.AbstractFactory(object)
+
+        with provider.override_in_context(providers.Factory(list)):
+            self.assertEqual(provider(), [])
+
+        self.assertRaises(errors.Error, provider)
+
+    def test_abstract_provider_with_invalid_provider(self):
+        provider = providers.AbstractFactory(object)
+        self.assertRaises(errors.Error, provider.override_in_context, providers.Object(1))
+
+    def test_dependency(self):
+        provider = providers.Dependency(instance_of=int)
+
+        with provider.override_in_context(providers.Object(1)):
+            self.assertEqual(provider(), 1)
+
+        self.assertRaises(errors.Error, provider)
+
+    def test_configuration(self):
+        provider = providers.Configuration()
+        self.assertRaises(errors.Error, provider.override_in_context, {})
+
+
+class InstrumentationTests(unittest.TestCase):
+
+    def setUp(self):
+        providers.enable_instrumentation()
+
+    def tearDown(self):
+        providers.disable_instrumentation()
+
+    def test_is_instrumentation_enabled(self):
+        self.assertTrue(providers.is_instrumentation_enabled())
+
+        providers.disable_instrumentation()
+
+        self.assertFalse(providers.is_instrumentation_enabled())
+
+    def test_call_stats(self):
+        provider = providers.Factory(object)
+
+        provider()
+        provider()
+
+        stats = provider.call_stats
+        self.assertIsInstance(stats, providers.ProviderStats)
+        self.assertEqual(stats.calls, 2)
+        self.assertGreater(stats.total_time, 0)
+        self.assertEqual(stats.histogram.count, 2)
+
+    def test_injected_providers_stats(self):
+        dependency = providers.Callable(_sleep, 0.01)
+        provider = providers.Factory(list, providers.List(dependency))
+
+        provider()
+
+        self.assertEqual(dependency.call_stats.calls, 1)
+        self.assertGreaterEqual(provider.call_stats.total_time, 10000000)
+        self.assertLess(provider.call_stats.self_time, 10000000)
+        self.assertGreaterEqual(provider.call_stats.total_time,
+                                dependency.call_stats.total_time)
+
+    def test_factory_batch_stats(self):
+        dependency = providers.Factory(object)
+        provider = providers.Factory(list, providers.List(dependency))
+
+        provider.many(5)
+        provider.map([{}] * 3)
+        list(provider.imap([{}] * 2))
+        provider()
+
+        self.assertEqual(provider.call_stats.calls, 11)
+        self.assertEqual(dependency.call_stats.calls, 11)
+
+    def test_overridden_provider_stats(self):
+        provider = providers.Factory(object)
+        overriding = providers.Object(1)
+        provider.override(overriding)
+
+        self.assertEqual(provider(), 1)
+        self.assertEqual(provider.call_stats.calls, 1)
+        self.assertEqual(overriding.call_stats.calls, 1)
+
+    def test_stats_on_error(self):
+        provider = providers.Callable(_fail)
+
+        with self.assertRaises(RuntimeError):
+            provider()
+
+        self.assertEqual(provider.call_stats.calls, 1)
+
+    def test_disabled_instrumentation(self):
+        providers.disable_instrumentation()
+        provider = providers.Factory(object)
+
+        provider()
+
+        self.assertIsNone(provider.call_stats)
+
+    def test_reset_call_stats(self):
+        provider = providers.Factory(object)
+        provider()
+
+        provider.reset_call_stats()
+
+        self.assertIsNone(provider.call_stats)
+
+    def test_deepcopy(self):
+        provider = providers.Factory(object)
+        provider()
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertIsNone(provider_copy.call_stats)
+
+    def test_to_dict(self):
+        provider = providers.Factory(object)
+        provider()
+
+        stats = provider.call_stats.to_dict()
+
+        self.assertEqual(stats['calls'], 1)
+        self.assertEqual(
+            set(stats),
+            {'calls', 'total_time', 'self_time',
+             'min', 'mean', 'p50', 'p90', 'p99', 'max'},
+        )
+
+
+class LatencyHistogramTests(unittest.TestCase):
+
+    def test_empty(self):
+        histogram = providers.LatencyHistogram()
+
+        self.assertEqual(histogram.count, 0)
+        self.assertEqual(histogram.mean, 0.0)
+        self.assertEqual(histogram.percentile(99), 0)
+        self.assertEqual(histogram.buckets(), [])
+
+    def test_exact_small_values(self):
+        histogram = providers.LatencyHistogram()
+        for value in range(1, 11):
+            histogram.add(value)
+
+        self.assertEqual(histogram.count, 10)
+        self.assertEqual(histogram.min, 1)
+        self.assertEqual(histogram.max, 10)
+        self.assertEqual(histogram.mean, 5.5)
+        self.assertEqual(histogram.percentile(50), 5)
+        self.assertEqual(histogram.percentile(90), 9)
+        self.assertEqual(histogram.percentile(100), 10)
+
+    def test_precision(self):
+        histogram = providers.LatencyHistogram()
+        for value in (1000, 50000, 3000000, 7 * 10 ** 9):
+            histogram.add(value)
+
+        for percentile, value in ((25, 1000), (50, 50000),
+                                  (75, 3000000), (100, 7 * 10 ** 9)):
+            result = histogram.percentile(percentile)
+            self.assertGreaterEqual(result, value)
+            self.assertLessEqual(result, value * 17 // 16)
+
+    def test_buckets(self):
+        histogram = providers.LatencyHistogram()
+        histogram.add(1000)
+        histogram.add(1001)
+        histogram.add(5)
+
+        buckets = histogram.buckets()
+
+        self.assertEqual(buckets[0], (5, 5, 1))
+        lower, upper, count = buckets[1]
+        self.assertLessEqual(lower, 1000)
+        self.assertGreaterEqual(upper, 1001)
+        self.assertEqual(count, 2)
+
+    def test_max_value(self):
+        histogram = providers.LatencyHistogram()
+        histogram.add(2 ** 60)
+
+        self.assertEqual(histogram.max, 2 ** 44)
+
+
 class ObjectProviderTests(unittest.TestCase):
 
     def test_is_provider(self):
@@ -161,6 +462,13 @@ class ObjectProviderTests(unittest.TestCase):
         provider.override(providers.Object(obj2))
         self.assertIs(provider(), obj2)
 
+    def test_related(self):
+        provider = providers.Object(1)
+        overriding_provider = providers.Object(2)
+        provider.override(overriding_provider)
+
+        self.assertEqual(provider.related, (overriding_provider,))
+
     def test_deepcopy(self):
         provider = providers.Object(1)
 
@@ -379,3 +687,11 @@ class DependenciesContainerTests(unittest.TestCase):
 
         self.assertFalse(dependency.overridden)
         self.assertFalse(dependency.overridden)
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+
+
+def _fail():
+    raise RuntimeError()
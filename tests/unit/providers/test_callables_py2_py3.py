@@ -54,6 +54,39 @@ class CallableTests(unittest.TestCase):
         provider = providers.Callable(_example, 1)
         self.assertTupleEqual(provider(2, arg3=3, arg4=4), (1, 2, 3, 4))
 
+    def test_call_with_constant_and_provider_kwargs(self):
+        provider = providers.Callable(
+            dict,
+            arg1=1,
+            arg2=providers.Object(2),
+            arg3=3,
+        )
+
+        result1 = provider()
+        result1['arg1'] = 0
+        result2 = provider()
+
+        self.assertEqual(result2, dict(arg1=1, arg2=2, arg3=3))
+        self.assertEqual(list(result2), ['arg1', 'arg2', 'arg3'])
+        self.assertEqual(provider(arg3=4), dict(arg1=1, arg2=2, arg3=4))
+
+    def test_call_after_changing_injections(self):
+        provider = providers.Callable(_example, 1, 2, arg3=3, arg4=4)
+        self.assertTupleEqual(provider(), (1, 2, 3, 4))
+
+        provider.add_kwargs(arg4=providers.Object(5))
+        self.assertTupleEqual(provider(), (1, 2, 3, 5))
+
+        provider.set_args(providers.Object(0), 2)
+        self.assertTupleEqual(provider(), (0, 2, 3, 5))
+
+        provider.add_kwargs(arg4=6)
+        self.assertTupleEqual(provider(), (0, 2, 3, 6))
+
+        provider.clear_args()
+        provider.clear_kwargs()
+        self.assertTupleEqual(provider(1, 2, 3, 4), (1, 2, 3, 4))
+
     def test_fluent_interface(self):
         provider = providers.Singleton(_example) \
             .add_args(1, 2) \
@@ -93,6 +126,15 @@ class CallableTests(unittest.TestCase):
 
         self.assertTupleEqual(provider(), (1, 2, 3, 4))
 
+    def test_related(self):
+        provider1 = providers.Object(1)
+        provider2 = providers.Object(2)
+        provider3 = providers.Object(3)
+        provider = providers.Callable(_example, provider1, 2, arg3=provider2)
+        provider.override(provider3)
+
+        self.assertEqual(provider.related, (provider1, provider2, provider3))
+
     def test_deepcopy(self):
         provider = providers.Callable(_example)
 
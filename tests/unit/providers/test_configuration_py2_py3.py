@@ -1,9 +1,12 @@
 """Dependency injector config providers unit tests."""
 
 import contextlib
+import decimal
 import os
+import shutil
 import sys
 import tempfile
+import threading
 
 import unittest2 as unittest
 
@@ -173,6 +176,111 @@ class ConfigTests(unittest.TestCase):
         self.assertIsNot(object_provider, object_provider_copy)
         self.assertIsInstance(object_provider_copy, providers.Object)
 
+    def test_get(self):
+        self.config.from_dict({'a': {'b': {'c': 1}}})
+
+        self.assertEqual(self.config.get('a.b.c'), 1)
+        self.assertEqual(self.config.get('a.b'), {'c': 1})
+        self.assertIsNone(self.config.get('a.x.c'))
+
+    def test_set(self):
+        self.config.set('a.b.c', 1)
+        self.config.set('a.b.d', 2)
+
+        self.assertEqual(self.config(), {'a': {'b': {'c': 1, 'd': 2}}})
+
+    def test_set_does_not_modify_previous_value(self):
+        self.config.from_dict({'a': {'b': {'c': 1}}, 'x': {'y': 1}})
+        value = self.config()
+
+        self.config.set('a.b.c', 2)
+
+        self.assertEqual(value, {'a': {'b': {'c': 1}}, 'x': {'y': 1}})
+        self.assertEqual(self.config.a.b.c(), 2)
+        self.assertIs(self.config.x(), value['x'])
+
+    def test_set_does_not_modify_default(self):
+        config = providers.Configuration(default={'a': {'b': 1}})
+
+        config.set('a.b', 2)
+        config.reset_override()
+
+        self.assertEqual(config.a.b(), 1)
+
+    def test_option_override_context(self):
+        self.config.from_dict({'a': {'b': 1}})
+
+        with self.config.a.b.override(2):
+            self.assertEqual(self.config.a.b(), 2)
+
+        self.assertEqual(self.config.a.b(), 1)
+
+    def test_from_dict_does_not_modify_previous_value(self):
+        self.config.from_dict({'a': {'b': 1}, 'x': {'y': 1}})
+        value = self.config()
+
+        self.config.from_dict({'a': {'c': 2}})
+
+        self.assertEqual(value, {'a': {'b': 1}, 'x': {'y': 1}})
+        self.assertEqual(self.config(), {'a': {'b': 1, 'c': 2}, 'x': {'y': 1}})
+        self.assertIs(self.config.x(), value['x'])
+
+    def test_item_with_dots(self):
+        self.config.from_dict({'a': {'b': {'c': 1}}})
+
+        self.assertEqual(self.config['a'].b.c(), 1)
+        self.assertEqual(self.config.a['b.c'](), 1)
+
+    def test_cache_is_invalidated_on_change(self):
+        option = self.config.a.b.c
+        parent = self.config.a.b
+
+        self.config.from_dict({'a': {'b': {'c': 1}}})
+        self.assertEqual(option(), 1)
+        self.assertEqual(parent(), {'c': 1})
+
+        self.config.set('a.b.c', 2)
+        self.assertEqual(option(), 2)
+
+        self.config.a.override({'b': {'c': 3}})
+        self.assertEqual(option(), 3)
+        self.assertEqual(parent(), {'c': 3})
+
+        self.config.reset_override()
+        self.assertIsNone(option())
+
+    def test_option_reset_cache(self):
+        value = {'a': {'b': 1}}
+        self.config.override(value)
+        self.assertEqual(self.config.a.b(), 1)
+
+        value['a']['b'] = 2
+        self.config.a.reset_cache()
+
+        self.assertEqual(self.config.a.b(), 2)
+
+    def test_option_with_provider_segment_is_not_cached(self):
+        self.config.from_dict({'a': {'x': 1, 'y': 2}})
+        selector = providers.Object('x')
+        option = self.config.a[selector]
+
+        self.assertEqual(option(), 1)
+
+        selector.override('y')
+
+        self.assertEqual(option(), 2)
+
+    def test_deepcopy_option(self):
+        self.config.from_dict({'a': {'b': 1}})
+        option = self.config.a.b
+        option()
+
+        config_copy = providers.deepcopy(self.config)
+        config_copy.a.override({'b': 2})
+
+        self.assertEqual(config_copy.a.b(), 2)
+        self.assertEqual(option(), 1)
+
     def test_repr(self):
         self.assertEqual(repr(self.config),
                          '<dependency_injector.providers.'
@@ -188,6 +296,38 @@ class ConfigTests(unittest.TestCase):
                              hex(id(self.config.a.b.c))))
 
 
+class MergeDictsTests(unittest.TestCase):
+
+    def test_merge(self):
+        dict1 = {'a': {'b': 1, 'c': {'d': 1}}, 'x': {'y': 1}}
+        dict2 = {'a': {'b': 2, 'e': 3}, 'z': 1}
+
+        result = providers.merge_dicts(dict1, dict2)
+
+        self.assertEqual(result, {'a': {'b': 2, 'c': {'d': 1}, 'e': 3},
+                                  'x': {'y': 1},
+                                  'z': 1})
+
+    def test_dicts_are_not_modified(self):
+        dict1 = {'a': {'b': 1, 'c': {'d': 1}}}
+        dict2 = {'a': {'b': 2, 'c': {'e': 1}}}
+
+        providers.merge_dicts(dict1, dict2)
+
+        self.assertEqual(dict1, {'a': {'b': 1, 'c': {'d': 1}}})
+        self.assertEqual(dict2, {'a': {'b': 2, 'c': {'e': 1}}})
+
+    def test_not_merged_values_are_shared(self):
+        dict1 = {'a': {'b': 1}, 'x': {'y': 1}}
+        dict2 = {'a': {'c': 1}, 'z': {'w': 1}}
+
+        result = providers.merge_dicts(dict1, dict2)
+
+        self.assertIs(result['x'], dict1['x'])
+        self.assertIs(result['z'], dict2['z'])
+        self.assertIsNot(result['a'], dict1['a'])
+
+
 class ConfigLinkingTests(unittest.TestCase):
 
     class TestCore(containers.DeclarativeContainer):
@@ -483,6 +623,387 @@ class ConfigFromYamlWithEnvInterpolationTests(unittest.TestCase):
         self.assertEqual(self.config.section1(), {'value1': 'test-value'})
         self.assertEqual(self.config.section1.value1(), 'test-value')
 
+    @unittest.skipIf(sys.version_info[:2] == (3, 4), 'PyYAML does not support Python 3.4')
+    def test_env_variable_interpolation_with_loaders(self):
+        import yaml
+
+        loaders = [yaml.Loader]
+        if hasattr(yaml, 'CLoader'):
+            loaders.append(yaml.CLoader)
+
+        for loader in loaders:
+            config = providers.Configuration()
+            config.from_yaml(self.config_file, loader=loader)
+            self.assertEqual(config.section1.value1(), 'test-value')
+
+
+class ConfigYamlCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        providers.enable_yaml_cache(self.cache_dir)
+        os.environ['CONFIG_TEST_ENV'] = 'test-value'
+
+        _, self.config_file = tempfile.mkstemp()
+        self._write('section1:\n'
+                    '  value1: ${CONFIG_TEST_ENV}\n'
+                    '  value2:\n'
+                    '    - 1\n'
+                    '    - ${CONFIG_TEST_ENV}\n'
+                    '  value3: 1\n')
+
+    def tearDown(self):
+        providers.disable_yaml_cache()
+        del os.environ['CONFIG_TEST_ENV']
+        os.unlink(self.config_file)
+        shutil.rmtree(self.cache_dir)
+
+    def _write(self, content, mtime=1000000000):
+        with open(self.config_file, 'w') as config_file:
+            config_file.write(content)
+        os.utime(self.config_file, (mtime, mtime))
+
+    def _load(self):
+        config = providers.Configuration()
+        config.from_yaml(self.config_file)
+        return config()
+
+    def test_enable(self):
+        self.assertTrue(providers.is_yaml_cache_enabled())
+        providers.disable_yaml_cache()
+        self.assertFalse(providers.is_yaml_cache_enabled())
+
+    def test_load(self):
+        expected = {
+            'section1': {
+                'value1': 'test-value',
+                'value2': [1, 'test-value'],
+                'value3': 1,
+            },
+        }
+
+        self.assertEqual(self._load(), expected)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(self._load(), expected)
+
+    def test_cache_is_used(self):
+        self._load()
+
+        self._write(self._read().replace('value3: 1', 'value3: 2'))
+
+        self.assertEqual(self._load()['section1']['value3'], 1)
+
+    def test_cache_is_invalidated(self):
+        self._load()
+
+        self._write(self._read().replace('value3: 1', 'value3: 2'),
+                    mtime=1000000001)
+
+        self.assertEqual(self._load()['section1']['value3'], 2)
+
+    def test_env_markers_are_expanded_on_load(self):
+        self._load()
+
+        os.environ['CONFIG_TEST_ENV'] = 'other-value'
+
+        self.assertEqual(self._load()['section1']['value1'], 'other-value')
+        self.assertEqual(self._load()['section1']['value2'], [1, 'other-value'])
+
+    def test_env_markers_in_keys(self):
+        self._write('${CONFIG_TEST_ENV}:\n'
+                    '  value: ${CONFIG_TEST_ENV}\n')
+        providers.disable_yaml_cache()
+        expected = self._load()
+        providers.enable_yaml_cache(self.cache_dir)
+
+        self.assertEqual(self._load(), expected)
+        self.assertEqual(self._load(), expected)
+        self.assertEqual(expected, {'test-value': {'value': 'test-value'}})
+
+    def test_broken_cache_file(self):
+        self._load()
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name), 'w') as cache_file:
+                cache_file.write('broken')
+
+        self.assertEqual(self._load()['section1']['value3'], 1)
+
+    def test_cache_next_to_file(self):
+        providers.enable_yaml_cache()
+        cache_dir = os.path.join(os.path.dirname(self.config_file),
+                                 '__pycache__')
+        self._load()
+
+        cache_files = [name for name in os.listdir(cache_dir)
+                       if name.startswith(os.path.basename(self.config_file))]
+        for name in cache_files:
+            os.unlink(os.path.join(cache_dir, name))
+
+        self.assertEqual(len(cache_files), 1)
+
+    def _read(self):
+        with open(self.config_file) as config_file:
+            return config_file.read()
+
+
+class ConfigReloadTests(unittest.TestCase):
+
+    def setUp(self):
+        self.config = providers.Configuration(name='config')
+        self.files = []
+        self.mtime = 1000000000
+
+    def tearDown(self):
+        del self.config
+        for config_file in self.files:
+            if os.path.exists(config_file):
+                os.unlink(config_file)
+
+    def _write(self, content, config_file=None):
+        if config_file is None:
+            _, config_file = tempfile.mkstemp()
+            self.files.append(config_file)
+        with open(config_file, 'w') as opened_file:
+            opened_file.write(content)
+        self.mtime += 1
+        os.utime(config_file, (self.mtime, self.mtime))
+        return config_file
+
+    def test_reload(self):
+        config_file = self._write('section:\n  value: 1\n  other: 2\n')
+        self.config.from_yaml(config_file)
+        option = self.config.section.value
+
+        self.assertEqual(option(), 1)
+
+        self._write('section:\n  value: 10\n  other: 2\n', config_file)
+
+        self.assertTrue(self.config.reload())
+        self.assertEqual(option(), 10)
+        self.assertEqual(self.config.section.other(), 2)
+
+    def test_reload_not_changed(self):
+        config_file = self._write('section:\n  value: 1\n')
+        self.config.from_yaml(config_file)
+
+        self.assertFalse(self.config.reload())
+        self.assertTrue(self.config.reload(force=True))
+        self.assertEqual(self.config.section.value(), 1)
+
+    def test_reload_keeps_order_of_files(self):
+        config_file1 = self._write('section:\n  value: 1\n  value1: 1\n')
+        config_file2 = self._write('section:\n  value: 2\n')
+        self.config.from_yaml(config_file1)
+        self.config.from_yaml(config_file2)
+
+        self._write('section:\n  value: 1\n  value1: 11\n', config_file1)
+        self.config.reload()
+
+        self.assertEqual(self.config.section(), {'value': 2, 'value1': 11})
+
+    def test_reload_ini(self):
+        config_file = self._write('[section]\nvalue = 1\n')
+        self.config.from_ini(config_file)
+
+        self._write('[section]\nvalue = 22\n', config_file)
+        self.config.reload()
+
+        self.assertEqual(self.config.section.value(), '22')
+
+    def test_reload_option_file(self):
+        config_file = self._write('value: 1\n')
+        self.config.from_dict({'section': {'other': 2}})
+        self.config.section.from_yaml(config_file)
+
+        self._write('value: 10\n', config_file)
+        self.config.reload()
+
+        self.assertEqual(self.config(), {'section': {'value': 10, 'other': 2}})
+
+    def test_reload_created_file(self):
+        _, config_file = tempfile.mkstemp()
+        os.unlink(config_file)
+        self.files.append(config_file)
+        self.config.from_yaml(config_file)
+
+        self._write('section:\n  value: 1\n', config_file)
+
+        self.assertTrue(self.config.reload())
+        self.assertEqual(self.config.section.value(), 1)
+
+    def test_reload_does_not_stack_overridings(self):
+        config_file = self._write('section:\n  value: 1\n')
+        self.config.from_yaml(config_file)
+        overridden = len(self.config.overridden)
+
+        self.config.reload(force=True)
+        self._write('section:\n  value: 2\n', config_file)
+        self.config.reload()
+
+        self.assertEqual(len(self.config.overridden), overridden)
+        self.assertEqual(self.config.section.value(), 2)
+
+    def test_reload_in_overriding_context(self):
+        config_file = self._write('a: 1\nb: 1\n')
+        self.config.from_yaml(config_file)
+
+        with self.config.override({'a': 5, 'b': 1}):
+            self._write('a: 2\nb: 2\n', config_file)
+            self.config.reload()
+
+            self.assertEqual(self.config(), {'a': 5, 'b': 2})
+            self.assertEqual(len(self.config.overridden), 2)
+
+        self.assertEqual(self.config(), {'a': 2, 'b': 2})
+        self.assertEqual(len(self.config.overridden), 1)
+
+    def test_reload_keeps_set_values(self):
+        config_file = self._write('section:\n  value: 1\n  other: 1\n')
+        self.config.from_yaml(config_file)
+        self.config.set('section.value', 10)
+
+        self._write('section:\n  value: 2\n  other: 2\n', config_file)
+        self.config.reload()
+
+        self.assertEqual(self.config.section(), {'value': 10, 'other': 2})
+
+    def test_reload_of_dropped_layer(self):
+        config_file = self._write('value: 1\n')
+
+        with self.config.override({}):
+            self.config.from_yaml(config_file)
+            self.config.reset_last_overriding()
+
+        self._write('value: 2\n', config_file)
+        self.config.reload()
+
+        self.assertIsNone(self.config.value())
+
+    def test_reload_does_not_change_previous_value(self):
+        config_file = self._write('section:\n  value: 1\n')
+        self.config.from_yaml(config_file)
+        value = self.config()
+
+        self._write('section:\n  value: 2\n', config_file)
+        self.config.reload()
+
+        self.assertEqual(value, {'section': {'value': 1}})
+
+    def test_not_changed_cache_is_kept(self):
+        config_file = self._write('section1:\n  value: [1]\n'
+                                  'section2:\n  value: [2]\n')
+        self.config.from_yaml(config_file)
+        value1 = self.config.section1.value()
+        value2 = self.config.section2.value()
+
+        self._write('section1:\n  value: [1]\n'
+                    'section2:\n  value: [22]\n', config_file)
+        self.config.reload()
+
+        self.assertIs(self.config.section1.value(), value1)
+        self.assertEqual(self.config.section2.value(), [22])
+        self.assertIsNot(self.config.section2.value(), value2)
+
+    def test_subscribe(self):
+        calls = []
+        config_file = self._write('section1:\n  value: 1\n'
+                                  'section2:\n  value: 2\n')
+        self.config.from_yaml(config_file)
+        self.config.section1.value.subscribe(
+            lambda old, new: calls.append(('value1', old, new)),
+        )
+        self.config.section2.value.subscribe(
+            lambda old, new: calls.append(('value2', old, new)),
+        )
+
+        self._write('section1:\n  value: 1\n'
+                    'section2:\n  value: 22\n', config_file)
+        self.config.reload()
+
+        self.assertEqual(calls, [('value2', 2, 22)])
+
+    def test_subscribe_configuration(self):
+        calls = []
+        config_file = self._write('value: 1\n')
+        self.config.from_yaml(config_file)
+        self.config.subscribe(lambda old, new: calls.append((old, new)))
+
+        self._write('value: 22\n', config_file)
+        self.config.reload()
+
+        self.assertEqual(calls, [({'value': 1}, {'value': 22})])
+
+    def test_unsubscribe(self):
+        calls = []
+        callback = calls.append
+        config_file = self._write('value: 1\n')
+        self.config.from_yaml(config_file)
+        self.config.value.subscribe(callback)
+        self.config.value.unsubscribe(callback)
+
+        self._write('value: 22\n', config_file)
+        self.config.reload()
+
+        self.assertEqual(calls, [])
+        with self.assertRaises(errors.Error):
+            self.config.value.unsubscribe(callback)
+
+    def test_reload_of_copy(self):
+        config_file = self._write('value: 1\n')
+        self.config.from_yaml(config_file)
+        config_copy = providers.deepcopy(self.config)
+
+        self._write('value: 22\n', config_file)
+        config_copy.reload()
+
+        self.assertEqual(config_copy.value(), 22)
+        self.assertEqual(self.config.value(), 1)
+
+    def test_reload_invalid_typed_option(self):
+        config_file = self._write('value: 1\n')
+        self.config.from_yaml(config_file)
+        option = self.config.value.as_int()
+
+        self._write('value: one\n', config_file)
+
+        with self.assertRaises(errors.Error):
+            self.config.reload()
+
+        self.assertEqual(option(), 1)
+        self.assertEqual(self.config.value(), 1)
+
+    def test_watch(self):
+        reloaded = threading.Event()
+        config_file = self._write('value: 1\n')
+        self.config.from_yaml(config_file)
+        self.config.subscribe(lambda old, new: reloaded.set())
+
+        with self.config.watch(interval=0.01) as watcher:
+            self.assertTrue(watcher.running)
+            self._write('value: 22\n', config_file)
+            self.assertTrue(reloaded.wait(5))
+
+        self.assertFalse(watcher.running)
+        self.assertEqual(self.config.value(), 22)
+
+    def test_watch_errors(self):
+        failed = threading.Event()
+        errors_list = []
+
+        def _on_error(exception):
+            errors_list.append(exception)
+            failed.set()
+
+        config_file = self._write('value: 1\n')
+        self.config.from_yaml(config_file)
+
+        with self.config.watch(interval=0.01, on_error=_on_error):
+            self._write('value: [\n', config_file)
+            self.assertTrue(failed.wait(5))
+
+        self.assertEqual(self.config.value(), 1)
+        self.assertTrue(errors_list)
+
 
 class ConfigFromDict(unittest.TestCase):
 
@@ -568,3 +1089,285 @@ class ConfigFromEnvTests(unittest.TestCase):
         self.assertEqual(self.config(), {'section1': {'value1': 'test-value'}})
         self.assertEqual(self.config.section1(), {'value1': 'test-value'})
         self.assertEqual(self.config.section1.value1(), 'test-value')
+
+
+class ConfigFromEnvPrefixTests(unittest.TestCase):
+
+    def setUp(self):
+        self.config = providers.Configuration(name='config')
+        self.environ = {
+            'CONFIG_TEST_DATABASE__HOST': 'localhost',
+            'CONFIG_TEST_DATABASE__PORT': '5432',
+            'CONFIG_TEST_DEBUG': 'yes',
+            'CONFIG_TEST_RATIO': '0.5',
+            'CONFIG_TEST_TAGS': '["a", "b"]',
+        }
+        os.environ.update(self.environ)
+
+    def tearDown(self):
+        del self.config
+        for name in self.environ:
+            os.environ.pop(name, None)
+
+    def _set(self, name, value):
+        self.environ[name] = value
+        os.environ[name] = value
+
+    def test(self):
+        self.config.from_env_prefix('CONFIG_TEST_')
+
+        self.assertEqual(
+            self.config(),
+            {
+                'database': {
+                    'host': 'localhost',
+                    'port': '5432',
+                },
+                'debug': 'yes',
+                'ratio': '0.5',
+                'tags': '["a", "b"]',
+            },
+        )
+
+    def test_types(self):
+        self.config.from_env_prefix(
+            'CONFIG_TEST_',
+            types={
+                'database.port': int,
+                'debug': bool,
+                'ratio': 'float',
+                'tags': 'json',
+            },
+        )
+
+        self.assertEqual(self.config.database.port(), 5432)
+        self.assertIs(self.config.debug(), True)
+        self.assertEqual(self.config.ratio(), 0.5)
+        self.assertEqual(self.config.tags(), ['a', 'b'])
+
+    def test_bool_values(self):
+        for value, expected in (('1', True), ('On', True), ('true', True),
+                                ('0', False), ('off', False), ('', False)):
+            self._set('CONFIG_TEST_DEBUG', value)
+            config = providers.Configuration()
+            config.from_env_prefix('CONFIG_TEST_', types={'debug': 'bool'})
+            self.assertIs(config.debug(), expected)
+
+    def test_conversion_errors_are_reported_at_once(self):
+        self._set('CONFIG_TEST_DATABASE__PORT', 'port')
+        self._set('CONFIG_TEST_DEBUG', 'maybe')
+
+        with self.assertRaises(errors.Error) as context:
+            self.config.from_env_prefix(
+                'CONFIG_TEST_',
+                types={'database.port': int, 'debug': bool},
+            )
+
+        self.assertIn('CONFIG_TEST_DATABASE__PORT', str(context.exception))
+        self.assertIn('CONFIG_TEST_DEBUG', str(context.exception))
+        self.assertEqual(self.config(), {})
+
+    def test_unknown_type(self):
+        with self.assertRaises(errors.Error):
+            self.config.from_env_prefix('CONFIG_TEST_', types={'debug': 'date'})
+
+    def test_separator(self):
+        self._set('CONFIG_TEST_CACHE_HOST', 'cache')
+
+        self.config.from_env_prefix('CONFIG_TEST_', separator='_')
+
+        self.assertEqual(self.config.cache.host(), 'cache')
+
+    def test_not_lowercase(self):
+        self.config.from_env_prefix('CONFIG_TEST_', lowercase=False)
+
+        self.assertEqual(self.config.DATABASE.HOST(), 'localhost')
+
+    def test_section_wins(self):
+        self._set('CONFIG_TEST_DATABASE', 'value')
+
+        self.config.from_env_prefix('CONFIG_TEST_')
+
+        self.assertEqual(self.config.database.host(), 'localhost')
+
+    def test_merge(self):
+        self.config.from_dict({'database': {'user': 'user', 'port': 1}})
+
+        self.config.from_env_prefix('CONFIG_TEST_', types={'database.port': int})
+
+        self.assertEqual(self.config.database(),
+                         {'host': 'localhost', 'port': 5432, 'user': 'user'})
+        self.assertEqual(len(self.config.overridden), 2)
+
+    def test_with_children(self):
+        self.config.section.from_env_prefix('CONFIG_TEST_DATABASE__')
+
+        self.assertEqual(self.config(),
+                         {'section': {'host': 'localhost', 'port': '5432'}})
+
+
+class TypedConfigOptionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.config = providers.Configuration(name='config')
+
+    def tearDown(self):
+        del self.config
+
+    def test_as_int(self):
+        self.config.from_dict({'timeout': '10'})
+
+        provider = self.config.timeout.as_int()
+
+        self.assertIsInstance(provider, providers.TypedConfigurationOption)
+        self.assertEqual(provider(), 10)
+
+    def test_as_float(self):
+        self.config.from_dict({'ratio': '0.5'})
+        self.assertEqual(self.config.ratio.as_float()(), 0.5)
+
+    def test_as_bool(self):
+        self.config.from_dict({'debug': 'off'})
+        self.assertIs(self.config.debug.as_bool()(), False)
+
+    def test_as_(self):
+        self.config.from_dict({'price': '1.10'})
+
+        provider = self.config.price.as_(decimal.Decimal)
+
+        self.assertEqual(provider(), decimal.Decimal('1.10'))
+        self.assertIs(provider.converter, decimal.Decimal)
+
+    def test_as_not_callable(self):
+        with self.assertRaises(errors.Error):
+            self.config.price.as_(1)
+
+    def test_typed_option_is_created_once(self):
+        self.assertIs(self.config.timeout.as_int(), self.config.timeout.as_int())
+        self.assertIs(self.config.timeout.as_(int), self.config.timeout.as_int())
+        self.assertIs(self.config.timeout.required(),
+                      self.config.timeout.required())
+
+    def test_undefined(self):
+        self.assertIsNone(self.config.timeout.as_int()())
+
+    def test_required(self):
+        provider = self.config.timeout.as_int().required()
+
+        self.assertTrue(provider.is_required)
+        with self.assertRaises(errors.Error):
+            provider()
+
+        self.config.from_dict({'timeout': '5'})
+
+        self.assertEqual(provider(), 5)
+        self.assertEqual(self.config.timeout.required()(), '5')
+
+    def test_converted_once_per_version(self):
+        calls = []
+
+        def _convert(value):
+            calls.append(value)
+            return int(value)
+
+        provider = self.config.timeout.as_(_convert)
+        self.config.from_dict({'timeout': '1'})
+
+        self.assertEqual(provider(), 1)
+        self.assertEqual(provider(), 1)
+        self.assertEqual(calls, ['1'])
+
+        self.config.set('timeout', '2')
+
+        self.assertEqual(provider(), 2)
+        self.assertEqual(calls, ['1', '2'])
+
+    def test_not_changed_value_is_not_converted_again(self):
+        calls = []
+
+        def _convert(value):
+            calls.append(value)
+            return value
+
+        provider = self.config.a.as_(_convert)
+        self.config.from_dict({'a': {'b': 1}, 'x': 1})
+        provider()
+
+        self.config.set('x', 2)
+        provider()
+
+        self.assertEqual(len(calls), 1)
+
+    def test_invalid_values_are_reported_at_load(self):
+        self.config.timeout.as_int()
+        self.config.ratio.as_float()
+        self.config.from_dict({'timeout': '1', 'ratio': '0.5'})
+
+        with self.assertRaises(errors.Error) as context:
+            self.config.from_dict({'timeout': 'ten', 'ratio': 'half'})
+
+        self.assertIn('config.timeout', str(context.exception))
+        self.assertIn('config.ratio', str(context.exception))
+        self.assertEqual(self.config(), {'timeout': '1', 'ratio': '0.5'})
+
+    def test_invalid_value_on_option_override(self):
+        self.config.timeout.as_int()
+
+        with self.assertRaises(errors.Error):
+            self.config.timeout.override('ten')
+
+    def test_validate(self):
+        self.config.timeout.as_int().required()
+        self.config.host.required()
+        self.config.port.as_int()
+        self.config.from_dict({'port': '80'})
+
+        with self.assertRaises(errors.Error) as context:
+            self.config.validate()
+
+        self.assertIn('config.timeout', str(context.exception))
+        self.assertIn('config.host', str(context.exception))
+        self.assertNotIn('config.port', str(context.exception))
+
+        self.config.from_dict({'timeout': '1', 'host': 'localhost'})
+        self.config.validate()
+
+    def test_injection(self):
+        self.config.from_dict({'timeout': '10'})
+        factory = providers.Factory(dict, timeout=self.config.timeout.as_int())
+
+        self.assertEqual(factory(), {'timeout': 10})
+
+    def test_deepcopy(self):
+        provider = self.config.timeout.as_int()
+
+        config_copy = providers.deepcopy(self.config)
+        provider_copy = providers.deepcopy(provider,
+                                           memo={id(self.config): config_copy})
+        config_copy.from_dict({'timeout': '5'})
+
+        self.assertIsNot(provider_copy, provider)
+        self.assertEqual(provider_copy(), 5)
+        self.assertIsNone(provider())
+        with self.assertRaises(errors.Error):
+            config_copy.from_dict({'timeout': 'five'})
+
+    def test_container_copy(self):
+        class Container(containers.DeclarativeContainer):
+            config = providers.Configuration()
+            timeout = providers.Callable(lambda value: value,
+                                         config.timeout.as_int())
+
+        container = Container()
+        container.config.from_dict({'timeout': '3'})
+
+        self.assertEqual(container.timeout(), 3)
+
+    def test_repr(self):
+        provider = self.config.timeout.as_int()
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         'TypedConfigurationOption({0}) at {1}>'.format(
+                             repr('config.timeout'),
+                             hex(id(provider))))
@@ -328,3 +328,175 @@ class CoroutineDelegateTests(unittest.TestCase):
         self.assertRaises(errors.Error,
                           providers.CoroutineDelegate,
                           providers.Object(object()))
+
+
+class AsyncModeTests(AsyncTestCase):
+
+    def setUp(self):
+        super(AsyncModeTests, self).setUp()
+        providers.enable_async_mode()
+
+    def tearDown(self):
+        providers.disable_async_mode()
+        super(AsyncModeTests, self).tearDown()
+
+    def test_is_async_mode_enabled(self):
+        self.assertTrue(providers.is_async_mode_enabled())
+
+        providers.disable_async_mode()
+
+        self.assertFalse(providers.is_async_mode_enabled())
+
+    def test_factory_with_coroutine_injections(self):
+        provider = providers.Factory(
+            dict,
+            arg1=providers.Coroutine(_example, 1, 2, 3, 4),
+            arg2=2,
+        )
+
+        awaitable = provider()
+
+        self.assertTrue(asyncio.iscoroutine(awaitable))
+        self.assertDictEqual(
+            self._run(awaitable),
+            {'arg1': (1, 2, 3, 4), 'arg2': 2},
+        )
+
+    def test_factory_with_coroutine_attributes(self):
+        class Example(object):
+            def __init__(self, arg1):
+                self.arg1 = arg1
+
+        provider = providers.Factory(
+            Example,
+            providers.Coroutine(_example, 1, 2, 3, 4),
+        )
+        provider.add_attributes(
+            attr1=providers.Coroutine(_example, 5, 6, 7, 8),
+            attr2=9,
+        )
+
+        instance = self._run(provider())
+
+        self.assertEqual(instance.arg1, (1, 2, 3, 4))
+        self.assertEqual(instance.attr1, (5, 6, 7, 8))
+        self.assertEqual(instance.attr2, 9)
+
+    def test_factory_without_awaitable_injections(self):
+        provider = providers.Factory(dict, arg1=1)
+
+        self.assertDictEqual(provider(), {'arg1': 1})
+
+    def test_callable_with_coroutine_injections(self):
+        provider = providers.Callable(
+            _sum,
+            providers.Coroutine(_value, 1),
+            2,
+            arg3=providers.Coroutine(_value, 3),
+        )
+
+        self.assertEqual(self._run(provider()), 6)
+
+    def test_coroutine_result_is_awaited(self):
+        provider = providers.Coroutine(
+            _example,
+            providers.Coroutine(_value, 1),
+            2,
+            3,
+            arg4=providers.Coroutine(_value, 4),
+        )
+
+        self.assertTupleEqual(self._run(provider()), (1, 2, 3, 4))
+
+    def test_injections_are_awaited_concurrently(self):
+        events = []
+
+        async def _step(name):
+            events.append(('start', name))
+            await asyncio.sleep(0)
+            events.append(('end', name))
+            return name
+
+        provider = providers.Factory(
+            dict,
+            arg1=providers.Coroutine(_step, 'arg1'),
+            arg2=providers.Coroutine(_step, 'arg2'),
+        )
+
+        self.assertDictEqual(
+            self._run(provider()),
+            {'arg1': 'arg1', 'arg2': 'arg2'},
+        )
+        self.assertListEqual(
+            [event for event, _ in events],
+            ['start', 'start', 'end', 'end'],
+        )
+
+    def test_nested_async_injections(self):
+        provider = providers.Factory(
+            dict,
+            inner=providers.Factory(
+                dict,
+                value=providers.Coroutine(_value, 1),
+            ),
+        )
+
+        self.assertDictEqual(self._run(provider()), {'inner': {'value': 1}})
+
+    def test_singletons_with_coroutine_injections(self):
+        for provider_cls in (providers.Singleton,
+                             providers.ThreadSafeSingleton,
+                             providers.ThreadLocalSingleton,
+                             providers.ContextLocalSingleton):
+            provider = provider_cls(dict, value=providers.Coroutine(_value, 1))
+
+            async def _main():
+                return await provider(), await provider()
+
+            first, second = self._run(_main())
+
+            self.assertDictEqual(first, {'value': 1})
+            self.assertIs(first, second)
+
+    def test_singleton_with_failed_coroutine_injection(self):
+        calls = []
+
+        async def _fail_once():
+            calls.append(None)
+            if len(calls) == 1:
+                raise RuntimeError()
+            return 1
+
+        provider = providers.Singleton(
+            dict,
+            value=providers.Coroutine(_fail_once),
+        )
+
+        async def _main():
+            with self.assertRaises(RuntimeError):
+                await provider()
+            return await provider()
+
+        self.assertDictEqual(self._run(_main()), {'value': 1})
+        self.assertEqual(len(calls), 2)
+
+    def test_disabled_async_mode(self):
+        providers.disable_async_mode()
+        provider = providers.Factory(
+            dict,
+            arg1=providers.Coroutine(_value, 1),
+        )
+
+        instance = provider()
+
+        self.assertTrue(asyncio.iscoroutine(instance['arg1']))
+        self.assertEqual(self._run(instance['arg1']), 1)
+
+
+async def _value(value):
+    await asyncio.sleep(0)
+    return value
+
+
+def _sum(arg1, arg2, arg3):
+    return arg1 + arg2 + arg3
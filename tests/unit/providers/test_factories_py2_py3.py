@@ -217,6 +217,56 @@ class FactoryTests(unittest.TestCase):
             .clear_attributes()
         self.assertEqual(provider.attributes, dict())
 
+    def test_many(self):
+        provider = providers.Factory(Example, 1, init_arg3=providers.Factory(list))
+
+        instances = provider.many(3, 2, init_arg4=4)
+
+        self.assertEqual(len(instances), 3)
+        self.assertEqual(len(set(id(instance) for instance in instances)), 3)
+        for instance in instances:
+            self.assertEqual(instance.init_arg1, 1)
+            self.assertEqual(instance.init_arg2, 2)
+            self.assertEqual(instance.init_arg3, [])
+            self.assertEqual(instance.init_arg4, 4)
+        self.assertIsNot(instances[0].init_arg3, instances[1].init_arg3)
+
+    def test_many_overridden(self):
+        provider = providers.Factory(Example)
+        provider.override(providers.Factory(dict))
+
+        self.assertEqual(provider.many(2, a=1), [{'a': 1}, {'a': 1}])
+
+    def test_many_zero(self):
+        provider = providers.Factory(Example)
+        self.assertEqual(provider.many(0), [])
+
+    def test_map(self):
+        provider = providers.Factory(Example, init_arg1=1)
+
+        instances = provider.map([dict(init_arg2=2), dict(init_arg1=3)])
+
+        self.assertEqual(len(instances), 2)
+        self.assertEqual(instances[0].init_arg1, 1)
+        self.assertEqual(instances[0].init_arg2, 2)
+        self.assertEqual(instances[1].init_arg1, 3)
+        self.assertEqual(instances[1].init_arg2, None)
+
+    def test_map_overridden(self):
+        provider = providers.Factory(Example)
+        provider.override(providers.Factory(dict))
+
+        self.assertEqual(provider.map([dict(a=1), dict(b=2)]),
+                         [{'a': 1}, {'b': 2}])
+
+    def test_imap(self):
+        provider = providers.Factory(Example)
+
+        instances = provider.imap(dict(init_arg1=index) for index in range(3))
+
+        self.assertEqual(next(instances).init_arg1, 0)
+        self.assertEqual([instance.init_arg1 for instance in instances], [1, 2])
+
     def test_call_overridden(self):
         provider = providers.Factory(Example)
         overriding_provider1 = providers.Factory(dict)
@@ -232,6 +282,18 @@ class FactoryTests(unittest.TestCase):
         self.assertIsInstance(instance1, list)
         self.assertIsInstance(instance2, list)
 
+    def test_related(self):
+        provider1 = providers.Object(1)
+        provider2 = providers.Object(2)
+        provider3 = providers.Object(3)
+        provider4 = providers.Object(4)
+
+        provider = providers.Factory(Example, provider1, 5, init_arg2=provider2)
+        provider.add_attributes(attribute1=provider3)
+        provider.override(provider4)
+
+        self.assertEqual(provider.related, (provider1, provider2, provider3, provider4))
+
     def test_deepcopy(self):
         provider = providers.Factory(Example)
 
@@ -323,6 +385,31 @@ class FactoryTests(unittest.TestCase):
         self.assertIsNot(object_provider, object_provider_copy)
         self.assertIsInstance(object_provider_copy, providers.Object)
 
+    def test_deepcopy_shared_dependency(self):
+        dependency = providers.Factory(list)
+        delegated = providers.Factory(dict)
+        provider = providers.Factory(
+            Example,
+            dependency,
+            init_arg2=dependency,
+            init_arg3=delegated.provider,
+        )
+        provider.add_attributes(attribute1=dependency)
+
+        provider_copy = providers.deepcopy(provider)
+        instance = provider_copy()
+
+        self.assertIsNot(provider_copy.args[0], dependency)
+        self.assertIs(provider_copy.args[0], provider_copy.kwargs['init_arg2'])
+        self.assertIs(
+            provider_copy.args[0],
+            provider_copy.attributes['attribute1'],
+        )
+        self.assertEqual(instance.init_arg1, [])
+        self.assertIsInstance(instance.init_arg3, providers.Factory)
+        self.assertIsNot(instance.init_arg3, delegated)
+        self.assertIs(instance.init_arg3.cls, dict)
+
     def test_deepcopy_with_sys_streams(self):
         provider = providers.Factory(Example)
         provider.add_args(sys.stdin)
@@ -401,6 +488,21 @@ class AbstractFactoryTests(unittest.TestCase):
         with self.assertRaises(errors.Error):
             provider.override(providers.Callable(object))
 
+    def test_many_overridden_by_factory(self):
+        provider = providers.AbstractFactory(object)
+        provider.override(providers.Factory(Example))
+
+        instances = provider.many(2)
+
+        self.assertIsInstance(instances[0], Example)
+        self.assertIsInstance(instances[1], Example)
+
+    def test_many_not_overridden(self):
+        provider = providers.AbstractFactory(object)
+
+        with self.assertRaises(errors.Error):
+            provider.many(2)
+
     def test_provide_not_implemented(self):
         provider = providers.AbstractFactory(Example)
 
@@ -25,6 +25,23 @@ class PositionalInjectionTests(unittest.TestCase):
         self.assertIs(type(obj2), object)
         self.assertIsNot(obj1, obj2)
 
+    def test_get_value_with_overridden_factory(self):
+        provider = providers.Factory(object)
+        injection = providers.PositionalInjection(provider)
+
+        provider.override(providers.Object(123))
+
+        self.assertEqual(injection.get_value(), 123)
+
+    def test_get_value_with_custom_call(self):
+        class _Provider(providers.Provider):
+            def __call__(self, *args, **kwargs):
+                return 'custom'
+
+        injection = providers.PositionalInjection(_Provider())
+
+        self.assertEqual(injection.get_value(), 'custom')
+
     def test_get_original_value(self):
         provider = providers.Factory(object)
         injection = providers.PositionalInjection(provider)
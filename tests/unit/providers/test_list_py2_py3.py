@@ -61,6 +61,13 @@ class ListTests(unittest.TestCase):
         self.assertEqual(instance1, [3, 4])
         self.assertEqual(instance2, [3, 4])
 
+    def test_related(self):
+        provider1 = providers.Object(1)
+        provider2 = providers.Object(2)
+        provider = providers.List(provider1, 2, provider2)
+
+        self.assertEqual(provider.related, (provider1, provider2))
+
     def test_deepcopy(self):
         provider = providers.List(1, 2)
 
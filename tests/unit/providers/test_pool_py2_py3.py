@@ -0,0 +1,298 @@
+"""Dependency injector pool providers unit tests."""
+
+import gc
+import threading
+import time
+
+import unittest2 as unittest
+
+from dependency_injector import (
+    providers,
+    errors,
+)
+
+
+class Example(object):
+
+    def __init__(self, init_arg1=None, init_arg2=None):
+        self.init_arg1 = init_arg1
+        self.init_arg2 = init_arg2
+
+        self.attribute1 = None
+        self.healthy = True
+        self.resets = 0
+
+
+class PoolTests(unittest.TestCase):
+
+    def test_is_provider(self):
+        self.assertTrue(providers.is_provider(providers.Pool(Example)))
+
+    def test_init_with_valid_provided_type(self):
+        class ExampleProvider(providers.Pool):
+            provided_type = Example
+
+        example_provider = ExampleProvider(Example, 1, 2)
+
+        self.assertIsInstance(example_provider(), Example)
+
+    def test_init_with_invalid_provided_type(self):
+        class ExampleProvider(providers.Pool):
+            provided_type = list
+
+        with self.assertRaises(errors.Error):
+            ExampleProvider(Example)
+
+    def test_call_with_injections(self):
+        provider = providers.Pool(Example, 1, init_arg2=providers.Factory(list))
+        provider.add_attributes(attribute1=3)
+
+        instance = provider()
+
+        self.assertEqual(instance.init_arg1, 1)
+        self.assertEqual(instance.init_arg2, [])
+        self.assertEqual(instance.attribute1, 3)
+
+    def test_call_reuses_released_instance(self):
+        provider = providers.Pool(Example)
+
+        instance1 = provider()
+        provider.release(instance1)
+        instance2 = provider()
+
+        self.assertIs(instance1, instance2)
+
+    def test_call_creates_instances_up_to_max_size(self):
+        provider = providers.Pool(Example).set_max_size(2)
+
+        instance1 = provider()
+        instance2 = provider()
+
+        self.assertIsNot(instance1, instance2)
+        self.assertEqual(provider.stats()['size'], 2)
+
+    def test_call_waits_for_released_instance(self):
+        provider = providers.Pool(Example).set_max_size(1)
+        instance = provider()
+        acquired = list()
+
+        thread = threading.Thread(target=lambda: acquired.append(provider()))
+        thread.start()
+
+        while provider.stats()['waits'] == 0:
+            time.sleep(0.001)
+        self.assertEqual(acquired, [])
+
+        provider.release(instance)
+        thread.join()
+
+        self.assertEqual(acquired, [instance])
+
+    def test_call_with_acquire_timeout(self):
+        provider = providers.Pool(Example).set_max_size(1)
+        provider.set_acquire_timeout(0.01)
+        instance = provider()
+
+        with self.assertRaises(errors.Error):
+            provider()
+
+        self.assertEqual(provider.acquire_timeout, 0.01)
+        self.assertEqual(provider.stats()['waits'], 1)
+
+        provider.release(instance)
+        self.assertIs(provider(), instance)
+
+    def test_call_with_not_unique_instances(self):
+        instance = Example()
+        provider = providers.Pool(lambda: instance)
+
+        self.assertIs(provider(), instance)
+        with self.assertRaises(errors.Error):
+            provider()
+
+        self.assertEqual(provider.stats()['size'], 1)
+        self.assertEqual(provider.stats()['in_use'], 1)
+
+    def test_call_keeps_acquired_instances(self):
+        provider = providers.Pool(Example)
+        provider()
+        gc.collect()
+
+        with self.assertRaises(errors.Error):
+            provider.release(Example())
+
+        self.assertEqual(provider.stats()['in_use'], 1)
+
+    def test_call_with_failing_instantiation(self):
+        def _fail():
+            raise RuntimeError()
+
+        provider = providers.Pool(_fail).set_max_size(1)
+
+        with self.assertRaises(RuntimeError):
+            provider()
+
+        self.assertEqual(provider.stats()['size'], 0)
+
+    def test_call_overridden(self):
+        provider = providers.Pool(Example)
+        overriding_instance = object()
+
+        provider.override(providers.Object(overriding_instance))
+
+        self.assertIs(provider(), overriding_instance)
+        provider.release(overriding_instance)
+
+    def test_acquire(self):
+        provider = providers.Pool(Example)
+
+        with provider.acquire(init_arg1=1) as instance:
+            self.assertEqual(instance.init_arg1, 1)
+            self.assertEqual(provider.stats()['in_use'], 1)
+
+        self.assertEqual(provider.stats()['in_use'], 0)
+        self.assertEqual(provider.stats()['idle'], 1)
+
+    def test_release_not_acquired_instance(self):
+        provider = providers.Pool(Example)
+
+        with self.assertRaises(errors.Error):
+            provider.release(Example())
+
+    def test_release_twice(self):
+        provider = providers.Pool(Example)
+        instance = provider()
+        provider.release(instance)
+
+        with self.assertRaises(errors.Error):
+            provider.release(instance)
+
+    def test_set_max_size_invalid(self):
+        with self.assertRaises(errors.Error):
+            providers.Pool(Example).set_max_size(0)
+
+    def test_release_over_max_size(self):
+        provider = providers.Pool(Example).set_max_size(2)
+        instance1 = provider()
+        instance2 = provider()
+
+        provider.set_max_size(1)
+        provider.release(instance1)
+        provider.release(instance2)
+
+        self.assertEqual(provider.stats()['size'], 1)
+        self.assertIs(provider(), instance2)
+
+    def test_idle_timeout(self):
+        provider = providers.Pool(Example).set_idle_timeout(0)
+        instance1 = provider()
+        provider.release(instance1)
+
+        time.sleep(0.01)
+        instance2 = provider()
+
+        self.assertIsNot(instance1, instance2)
+        self.assertEqual(provider.stats()['evictions'], 1)
+
+    def test_health_check(self):
+        provider = providers.Pool(Example)
+        provider.set_health_check(lambda instance: instance.healthy)
+
+        instance1 = provider()
+        instance1.healthy = False
+        provider.release(instance1)
+        instance2 = provider()
+
+        self.assertIsNot(instance1, instance2)
+        self.assertEqual(provider.stats()['evictions'], 1)
+        self.assertEqual(provider.stats()['size'], 1)
+
+    def test_reset_hook(self):
+        def _reset(instance):
+            instance.resets += 1
+
+        provider = providers.Pool(Example).set_reset_hook(_reset)
+
+        instance = provider()
+        provider.release(instance)
+
+        self.assertEqual(instance.resets, 1)
+        self.assertIs(provider.reset_hook, _reset)
+
+    def test_failing_reset_hook(self):
+        def _reset(instance):
+            raise RuntimeError()
+
+        provider = providers.Pool(Example).set_reset_hook(_reset)
+        instance = provider()
+
+        with self.assertRaises(RuntimeError):
+            provider.release(instance)
+
+        self.assertEqual(provider.stats()['size'], 0)
+        self.assertIsNot(provider(), instance)
+
+    def test_reset(self):
+        provider = providers.Pool(Example)
+        instance1 = provider()
+        instance2 = provider()
+        provider.release(instance1)
+
+        provider.reset()
+        provider.release(instance2)
+
+        self.assertEqual(provider.stats()['size'], 1)
+        self.assertIs(provider(), instance2)
+
+    def test_stats(self):
+        provider = providers.Pool(Example).set_max_size(3)
+
+        instance = provider()
+        provider.release(instance)
+        provider()
+        provider()
+
+        self.assertEqual(
+            provider.stats(),
+            dict(
+                max_size=3,
+                size=2,
+                idle=0,
+                in_use=2,
+                hits=1,
+                misses=2,
+                waits=0,
+                evictions=0,
+            ),
+        )
+
+    def test_related(self):
+        provider1 = providers.Object(1)
+        provider2 = providers.Object(2)
+        provider = providers.Pool(Example, provider1, init_arg2=provider2)
+
+        self.assertEqual(provider.related, (provider1, provider2))
+
+    def test_deepcopy(self):
+        provider = providers.Pool(Example, providers.Factory(list))
+        provider.set_max_size(5).set_idle_timeout(1).set_acquire_timeout(2)
+        provider.release(provider())
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertIsNot(provider, provider_copy)
+        self.assertIsInstance(provider_copy, providers.Pool)
+        self.assertIsNot(provider.args[0], provider_copy.args[0])
+        self.assertEqual(provider_copy.max_size, 5)
+        self.assertEqual(provider_copy.idle_timeout, 1)
+        self.assertEqual(provider_copy.acquire_timeout, 2)
+        self.assertEqual(provider_copy.stats()['size'], 0)
+
+    def test_repr(self):
+        provider = providers.Pool(Example)
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         'Pool({0}) at {1}>'.format(
+                             repr(Example),
+                             hex(id(provider))))
@@ -0,0 +1,126 @@
+"""Dependency injector pool providers asyncio unit tests."""
+
+import asyncio
+
+import unittest2 as unittest
+
+from dependency_injector import providers, errors
+
+
+class Example(object):
+    pass
+
+
+class AsyncPoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def _run(self, f):
+        return self.loop.run_until_complete(f)
+
+    def test_async_acquire(self):
+        provider = providers.Pool(Example)
+
+        instance = self._run(provider.async_acquire())
+
+        self.assertIsInstance(instance, Example)
+        self.assertEqual(provider.stats()['in_use'], 1)
+
+    def test_async_with(self):
+        provider = providers.Pool(Example)
+
+        async def _main():
+            async with provider.acquire() as instance:
+                self.assertEqual(provider.stats()['in_use'], 1)
+            return instance
+
+        instance = self._run(_main())
+
+        self.assertIsInstance(instance, Example)
+        self.assertEqual(provider.stats()['in_use'], 0)
+        self.assertEqual(provider.stats()['idle'], 1)
+
+    def test_async_waits_for_released_instance(self):
+        provider = providers.Pool(Example).set_max_size(1)
+        events = list()
+
+        async def _worker(name):
+            async with provider.acquire() as instance:
+                events.append((name, 'acquired'))
+                await asyncio.sleep(0.01)
+                events.append((name, 'released'))
+            return instance
+
+        instances = self._run(asyncio.gather(_worker(1), _worker(2)))
+
+        self.assertIs(instances[0], instances[1])
+        self.assertEqual(
+            events,
+            [(1, 'acquired'), (1, 'released'), (2, 'acquired'), (2, 'released')],
+        )
+        self.assertEqual(provider.stats()['waits'], 1)
+
+    def test_async_acquire_timeout(self):
+        provider = providers.Pool(Example).set_max_size(1)
+        provider.set_acquire_timeout(0.01)
+        instance = self._run(provider.async_acquire())
+
+        with self.assertRaises(errors.Error):
+            self._run(provider.async_acquire())
+
+        provider.release(instance)
+        self.assertIs(self._run(provider.async_acquire()), instance)
+
+    def test_async_acquire_timeout_timer_is_cancelled(self):
+        provider = providers.Pool(Example).set_max_size(2)
+        provider.set_acquire_timeout(10)
+
+        async def _main():
+            instances = [await provider.async_acquire(),
+                         await provider.async_acquire()]
+            await asyncio.sleep(0)
+            return instances
+
+        self._run(_main())
+
+        self.assertEqual(
+            [timer for timer in self.loop._scheduled
+             if not timer.cancelled()],
+            [],
+        )
+
+    def test_async_cancelled_waiter(self):
+        provider = providers.Pool(Example).set_max_size(1)
+        instance = provider()
+
+        async def _main():
+            cancelled = provider.async_acquire()
+            waiting = provider.async_acquire()
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            provider.release(instance)
+            return await waiting
+
+        self.assertIs(self._run(_main()), instance)
+        self.assertEqual(provider.stats()['in_use'], 1)
+
+    def test_async_acquire_overridden(self):
+        provider = providers.Pool(Example)
+        overriding_instance = object()
+        provider.override(providers.Object(overriding_instance))
+
+        async def _main():
+            async with provider.acquire() as instance:
+                return instance
+
+        self.assertIs(self._run(_main()), overriding_instance)
+
+
+if __name__ == '__main__':
+    unittest.main()
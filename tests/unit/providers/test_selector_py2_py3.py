@@ -77,6 +77,20 @@ class SelectorTests(unittest.TestCase):
         with self.selector.override('sample'):
             self.assertEqual(provider(), 3)
 
+    def test_related(self):
+        provider_one = providers.Object(1)
+        provider_two = providers.Object(2)
+        provider = providers.Selector(
+            self.selector,
+            one=provider_one,
+            two=provider_two,
+        )
+
+        self.assertEqual(
+            provider.related,
+            (self.selector, provider_one, provider_two),
+        )
+
     def test_deepcopy(self):
         provider = providers.Selector(self.selector)
 
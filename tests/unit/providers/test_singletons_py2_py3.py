@@ -1,9 +1,17 @@
 """Dependency injector singleton providers unit tests."""
 
+import gc
 import sys
+import threading
+import weakref
 
 import unittest2 as unittest
 
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
 from dependency_injector import (
     providers,
     errors,
@@ -233,6 +241,16 @@ class _BaseSingletonTestCase(object):
         self.assertIsInstance(instance1, list)
         self.assertIsInstance(instance2, list)
 
+    def test_related(self):
+        provider1 = providers.Object(1)
+        provider2 = providers.Object(2)
+        provider3 = providers.Object(3)
+
+        provider = self.singleton_cls(Example, provider1, init_arg2=provider2)
+        provider.add_attributes(attribute1=provider3)
+
+        self.assertEqual(provider.related, (provider1, provider2, provider3))
+
     def test_deepcopy(self):
         provider = self.singleton_cls(Example)
 
@@ -410,6 +428,281 @@ class ThreadLocalSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
 
         self.assertIsNot(instance1, instance2)
 
+    def test_reset_not_created(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        provider.reset()
+
+    def test_instances_of_threads(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        instances = []
+
+        def _run():
+            instances.append(provider())
+            instances.append(provider())
+
+        thread = threading.Thread(target=_run)
+        thread.start()
+        thread.join()
+
+        self.assertIs(instances[0], instances[1])
+        self.assertIsNot(provider(), instances[0])
+
+    def test_reset_in_thread(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        instance = provider()
+
+        thread = threading.Thread(target=provider.reset)
+        thread.start()
+        thread.join()
+
+        self.assertIs(provider(), instance)
+
+    def test_reset_all(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        instance = provider()
+        created = threading.Event()
+        reset = threading.Event()
+        instances = []
+
+        def _run():
+            instances.append(provider())
+            created.set()
+            reset.wait()
+            instances.append(provider())
+
+        thread = threading.Thread(target=_run)
+        thread.start()
+        created.wait()
+
+        provider.reset_all()
+        reset.set()
+        thread.join()
+
+        self.assertIsNot(provider(), instance)
+        self.assertIsNot(instances[0], instances[1])
+
+    def test_exception_is_not_swallowed(self):
+        def _fail():
+            raise RuntimeError()
+
+        provider = providers.ThreadLocalSingleton(_fail)
+
+        with self.assertRaises(RuntimeError):
+            provider()
+
+    def test_none_instance(self):
+        calls = []
+
+        def _create():
+            calls.append(1)
+
+        provider = providers.ThreadLocalSingleton(_create)
+
+        self.assertIsNone(provider())
+        self.assertIsNone(provider())
+        self.assertEqual(len(calls), 1)
+
+    def test_instance_is_released_when_thread_finishes(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        references = []
+
+        thread = threading.Thread(
+            target=lambda: references.append(weakref.ref(provider())),
+        )
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        self.assertIsNone(references[0]())
+
+    def test_instances_are_released_with_provider(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        reference = weakref.ref(provider())
+
+        del provider
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_deepcopy_has_own_instances(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        instance = provider()
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertIsNot(provider_copy(), instance)
+        self.assertIs(provider(), instance)
+
+
+@unittest.skipIf(contextvars is None, 'contextvars is not available')
+class ContextLocalSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
+
+    singleton_cls = providers.ContextLocalSingleton
+
+    def test_repr(self):
+        provider = providers.ContextLocalSingleton(Example)
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         'ContextLocalSingleton({0}) at {1}>'.format(
+                             repr(Example),
+                             hex(id(provider))))
+
+    def test_provider_is_not_delegated_provider(self):
+        provider = providers.ContextLocalSingleton(object)
+        self.assertFalse(providers.is_delegated(provider))
+
+    def test_instances_of_contexts(self):
+        provider = providers.ContextLocalSingleton(Example)
+
+        instance = contextvars.copy_context().run(provider)
+
+        self.assertIs(provider(), provider())
+        self.assertIsNot(provider(), instance)
+
+    def test_copied_context_shares_instance(self):
+        provider = providers.ContextLocalSingleton(Example)
+        instance = provider()
+
+        self.assertIs(contextvars.copy_context().run(provider), instance)
+
+    def test_reset(self):
+        provider = providers.ContextLocalSingleton(Example)
+        instance = provider()
+
+        provider.reset()
+
+        self.assertIsNot(provider(), instance)
+
+    def test_none_instance(self):
+        calls = []
+        provider = providers.ContextLocalSingleton(lambda: calls.append(1))
+
+        self.assertIsNone(provider())
+        self.assertIsNone(provider())
+        self.assertEqual(len(calls), 1)
+
+    def test_scope(self):
+        provider = providers.ContextLocalSingleton(Example)
+        instance = provider()
+
+        with providers.Scope() as scope:
+            scoped_instance = provider()
+            self.assertIs(provider(), scoped_instance)
+            self.assertIsNot(scoped_instance, instance)
+            self.assertEqual(scope.instances, {provider: scoped_instance})
+
+        self.assertIs(provider(), instance)
+        self.assertEqual(scope.instances, dict())
+
+    def test_scopes_have_own_instances(self):
+        provider = providers.ContextLocalSingleton(Example)
+
+        with providers.Scope():
+            instance1 = provider()
+        with providers.Scope():
+            instance2 = provider()
+
+        self.assertIsNot(instance1, instance2)
+
+    def test_nested_scope(self):
+        provider = providers.ContextLocalSingleton(Example)
+
+        with providers.Scope():
+            instance = provider()
+            with providers.Scope():
+                self.assertIsNot(provider(), instance)
+            self.assertIs(provider(), instance)
+
+    def test_scope_with_providers(self):
+        provider = providers.ContextLocalSingleton(Example)
+        other_provider = providers.ContextLocalSingleton(Example)
+        other_instance = other_provider()
+
+        with providers.Scope():
+            outer_instance = provider()
+            with providers.Scope(providers=[other_provider]) as scope:
+                self.assertIs(provider(), outer_instance)
+                self.assertIsNot(other_provider(), other_instance)
+                self.assertEqual(scope.providers, frozenset([other_provider]))
+                self.assertEqual(list(scope.instances), [other_provider])
+
+        self.assertIs(other_provider(), other_instance)
+
+    def test_reset_in_scope(self):
+        provider = providers.ContextLocalSingleton(Example)
+
+        with providers.Scope():
+            instance = provider()
+            provider.reset()
+            self.assertIsNot(provider(), instance)
+
+    def test_teardown(self):
+        torn_down = []
+        provider1 = providers.ContextLocalSingleton(Example).set_teardown(
+            lambda instance: torn_down.append((1, instance)),
+        )
+        provider2 = providers.ContextLocalSingleton(
+            Example,
+            init_arg1=provider1,
+        ).set_teardown(lambda instance: torn_down.append((2, instance)))
+
+        with providers.Scope():
+            instance2 = provider2()
+            instance1 = provider1()
+
+        self.assertEqual(torn_down, [(2, instance2), (1, instance1)])
+
+    def test_teardown_errors(self):
+        torn_down = []
+
+        def _fail(_):
+            raise RuntimeError()
+
+        provider1 = providers.ContextLocalSingleton(Example).set_teardown(
+            torn_down.append,
+        )
+        provider2 = providers.ContextLocalSingleton(Example).set_teardown(
+            _fail,
+        )
+
+        with self.assertRaises(RuntimeError):
+            with providers.Scope():
+                instance = provider1()
+                provider2()
+
+        self.assertEqual(torn_down, [instance])
+
+    def test_scope_is_not_reentrant(self):
+        scope = providers.Scope()
+
+        with scope:
+            with self.assertRaises(errors.Error):
+                scope.activate()
+
+    def test_deactivate_not_active_scope(self):
+        with self.assertRaises(errors.Error):
+            providers.Scope().deactivate()
+
+    def test_deepcopy_teardown(self):
+        teardown = object()
+        provider = providers.ContextLocalSingleton(Example).set_teardown(
+            teardown,
+        )
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertIs(provider_copy.teardown, teardown)
+        self.assertIsNot(provider_copy(), provider())
+
+
+@unittest.skipIf(contextvars is None, 'contextvars is not available')
+class DelegatedContextLocalSingletonTests(unittest.TestCase):
+
+    def test_is_delegated_provider(self):
+        provider = providers.DelegatedContextLocalSingleton(object)
+        self.assertTrue(providers.is_delegated(provider))
+
 
 class DelegatedThreadLocalSingletonTests(_BaseSingletonTestCase,
                                          unittest.TestCase):
@@ -443,6 +736,62 @@ class ThreadSafeSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
                              repr(Example),
                              hex(id(provider))))
 
+    def test_call_from_multiple_threads(self):
+        provider = self.singleton_cls(Example)
+        instances = []
+
+        def _worker():
+            instances.append(provider())
+
+        workers = [threading.Thread(target=_worker) for _ in range(10)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(len(instances), 10)
+        self.assertTrue(all(instance is instances[0] for instance in instances))
+
+    def test_call_with_singleton_dependency(self):
+        dependency = self.singleton_cls(Example)
+        provider = self.singleton_cls(Example, init_arg1=dependency)
+
+        instance = provider()
+
+        self.assertIs(instance.init_arg1, dependency())
+
+    def test_locks_are_not_shared(self):
+        creation_started = threading.Event()
+        creation_allowed = threading.Event()
+
+        def _slow_example():
+            creation_started.set()
+            creation_allowed.wait(5)
+            return Example()
+
+        slow_provider = self.singleton_cls(_slow_example)
+        provider = self.singleton_cls(Example)
+
+        worker = threading.Thread(target=slow_provider)
+        worker.start()
+        try:
+            self.assertTrue(creation_started.wait(5))
+            self.assertIsInstance(provider(), Example)
+        finally:
+            creation_allowed.set()
+            worker.join()
+
+    def test_shared_storage_lock(self):
+        class ExampleProvider(self.singleton_cls):
+            storage_lock = threading.RLock()
+
+        provider1 = ExampleProvider(Example)
+        provider2 = ExampleProvider(Example, init_arg1=provider1)
+
+        instance = provider2()
+
+        self.assertIs(instance.init_arg1, provider1())
+
 
 class DelegatedThreadSafeSingletonTests(_BaseSingletonTestCase,
                                         unittest.TestCase):
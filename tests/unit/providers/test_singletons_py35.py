@@ -0,0 +1,337 @@
+"""Dependency injector singleton providers asyncio unit tests."""
+
+import asyncio
+
+import unittest2 as unittest
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+from dependency_injector import (
+    providers,
+    errors,
+)
+
+
+class Example(object):
+
+    def __init__(self, init_arg1=None, init_arg2=None):
+        self.init_arg1 = init_arg1
+        self.init_arg2 = init_arg2
+
+
+class AsyncSingletonTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.calls = 0
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def _run(self, f):
+        return self.loop.run_until_complete(f)
+
+    async def _create(self, value=None):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return Example(value)
+
+    async def _fail(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.calls == 1:
+            raise RuntimeError('failed')
+        return Example()
+
+    def test_is_coroutine_function(self):
+        provider = providers.AsyncSingleton(self._create)
+        self.assertTrue(asyncio.iscoroutinefunction(provider))
+
+    def test_call(self):
+        provider = providers.AsyncSingleton(self._create, 1)
+
+        instance1 = self._run(provider())
+        instance2 = self._run(provider())
+
+        self.assertIs(instance1, instance2)
+        self.assertIsInstance(instance1, Example)
+        self.assertEqual(instance1.init_arg1, 1)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(provider.initialized)
+
+    def test_call_with_class(self):
+        provider = providers.AsyncSingleton(Example, init_arg1=1)
+
+        instance1 = self._run(provider())
+        instance2 = self._run(provider())
+
+        self.assertIs(instance1, instance2)
+        self.assertEqual(instance1.init_arg1, 1)
+
+    def test_call_with_async_injections(self):
+        provider = providers.AsyncSingleton(
+            Example,
+            init_arg1=providers.Coroutine(self._create, 1),
+        )
+        provider.add_attributes(attr=providers.Coroutine(self._create, 2))
+
+        instance = self._run(provider())
+
+        self.assertIsInstance(instance.init_arg1, Example)
+        self.assertEqual(instance.init_arg1.init_arg1, 1)
+        self.assertEqual(instance.attr.init_arg1, 2)
+
+    def test_call_with_async_provides_and_injections(self):
+        provider = providers.AsyncSingleton(
+            self._create,
+            providers.Coroutine(self._create, 1),
+        )
+        provider.add_attributes(attr=providers.Coroutine(self._create, 2))
+
+        instance = self._run(provider())
+
+        self.assertIsInstance(instance, Example)
+        self.assertEqual(instance.init_arg1.init_arg1, 1)
+        self.assertEqual(instance.attr.init_arg1, 2)
+
+    def test_concurrent_calls_create_single_instance(self):
+        provider = providers.AsyncSingleton(self._create)
+
+        async def _main():
+            return await asyncio.gather(*[provider() for _ in range(10)])
+
+        instances = self._run(_main())
+
+        self.assertEqual(len(set(id(instance) for instance in instances)), 1)
+        self.assertEqual(self.calls, 1)
+
+    def test_failure_is_not_cached(self):
+        provider = providers.AsyncSingleton(self._fail)
+
+        async def _main():
+            return await asyncio.gather(provider(), provider(),
+                                        return_exceptions=True)
+
+        results = self._run(_main())
+
+        self.assertIsInstance(results[0], RuntimeError)
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertFalse(provider.initialized)
+
+        instance = self._run(provider())
+
+        self.assertIsInstance(instance, Example)
+        self.assertEqual(self.calls, 2)
+
+    def test_cancelled_caller_does_not_cancel_creation(self):
+        provider = providers.AsyncSingleton(self._create)
+
+        async def _main():
+            task = asyncio.ensure_future(provider())
+            await asyncio.sleep(0)
+            task.cancel()
+            return await provider()
+
+        instance = self._run(_main())
+
+        self.assertIsInstance(instance, Example)
+        self.assertEqual(self.calls, 1)
+
+    def test_reset(self):
+        provider = providers.AsyncSingleton(self._create)
+
+        instance1 = self._run(provider())
+        self.assertIsNone(provider.reset())
+        self.assertFalse(provider.initialized)
+        instance2 = self._run(provider())
+
+        self.assertIsNot(instance1, instance2)
+        self.assertEqual(self.calls, 2)
+
+    def test_async_reset(self):
+        provider = providers.AsyncSingleton(self._create)
+
+        instance1 = self._run(provider())
+        self._run(provider.async_reset())
+        instance2 = self._run(provider())
+
+        self.assertIsNot(instance1, instance2)
+        self.assertEqual(self.calls, 2)
+
+    def test_reset_cancels_creation_in_progress(self):
+        started = asyncio.Event()
+
+        async def _create():
+            started.set()
+            await asyncio.sleep(10)
+
+        provider = providers.AsyncSingleton(_create)
+
+        async def _main():
+            task = asyncio.ensure_future(provider())
+            await started.wait()
+            provider.reset()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self._run(_main())
+
+        self.assertFalse(provider.initialized)
+
+    def test_async_reset_waits_for_cancelled_creation(self):
+        started = asyncio.Event()
+        finished = []
+
+        async def _create():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            finally:
+                finished.append(True)
+
+        provider = providers.AsyncSingleton(_create)
+
+        async def _main():
+            task = asyncio.ensure_future(provider())
+            await started.wait()
+            await provider.async_reset()
+            self.assertEqual(finished, [True])
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self._run(_main())
+
+        self.assertFalse(provider.initialized)
+
+    def test_reset_in_progress_does_not_cache_new_instance(self):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _create():
+            started.set()
+            await release.wait()
+            return object()
+
+        provider = providers.AsyncSingleton(_create)
+
+        async def _main():
+            task = asyncio.ensure_future(provider())
+            await started.wait()
+            provider.reset()
+            release.set()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return await provider()
+
+        instance = self._run(_main())
+
+        self.assertTrue(provider.initialized)
+        self.assertIs(self._run(provider()), instance)
+
+    def test_deepcopy(self):
+        provider = providers.AsyncSingleton(self._create)
+        self._run(provider())
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertFalse(provider_copy.initialized)
+        self.assertIsNot(self._run(provider_copy()), self._run(provider()))
+
+    def test_delegated(self):
+        provider = providers.DelegatedAsyncSingleton(self._create)
+        self.assertTrue(providers.is_delegated(provider))
+
+    def test_overridden(self):
+        provider = providers.AsyncSingleton(self._create)
+        provider.override(providers.Object('overridden'))
+
+        self.assertEqual(provider(), 'overridden')
+
+
+@unittest.skipIf(contextvars is None, 'contextvars is not available')
+class ContextLocalSingletonTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.torn_down = []
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def _run(self, f):
+        return self.loop.run_until_complete(f)
+
+    async def _teardown(self, instance):
+        await asyncio.sleep(0)
+        self.torn_down.append(instance)
+
+    def test_tasks_have_own_instances(self):
+        provider = providers.ContextLocalSingleton(Example)
+
+        async def _get():
+            await asyncio.sleep(0)
+            return provider(), provider()
+
+        async def _test():
+            return await asyncio.gather(_get(), _get())
+
+        (instance1, instance2), (instance3, instance4) = self._run(_test())
+
+        self.assertIs(instance1, instance2)
+        self.assertIs(instance3, instance4)
+        self.assertIsNot(instance1, instance3)
+
+    def test_scope_is_shared_by_tasks(self):
+        provider = providers.ContextLocalSingleton(Example).set_teardown(
+            self._teardown,
+        )
+
+        async def _get():
+            await asyncio.sleep(0)
+            return provider()
+
+        async def _request():
+            async with providers.Scope():
+                return await asyncio.gather(_get(), _get())
+
+        instance1, instance2 = self._run(_request())
+        instance3, _ = self._run(_request())
+
+        self.assertIs(instance1, instance2)
+        self.assertIsNot(instance1, instance3)
+        self.assertEqual(self.torn_down, [instance1, instance3])
+
+    def test_concurrent_scopes(self):
+        provider = providers.ContextLocalSingleton(Example)
+
+        async def _request():
+            async with providers.Scope():
+                instance = provider()
+                await asyncio.sleep(0)
+                self.assertIs(provider(), instance)
+                return instance
+
+        async def _test():
+            return await asyncio.gather(_request(), _request())
+
+        instance1, instance2 = self._run(_test())
+
+        self.assertIsNot(instance1, instance2)
+
+    def test_async_teardown_requires_async_scope(self):
+        provider = providers.ContextLocalSingleton(Example).set_teardown(
+            self._teardown,
+        )
+
+        with self.assertRaises(errors.Error):
+            with providers.Scope():
+                provider()
+
+        self.assertEqual(self.torn_down, [])
@@ -0,0 +1,225 @@
+"""Dependency injector providers tracing unit tests."""
+
+import unittest2 as unittest
+
+from dependency_injector import (
+    providers,
+    errors,
+)
+
+
+class Service(object):
+
+    def __init__(self, database, cache=None):
+        self.database = database
+        self.cache = cache
+
+
+class Database(object):
+    pass
+
+
+class RecordingTracer(providers.Tracer):
+
+    def __init__(self):
+        self.events = []
+
+    def on_provide_start(self, span):
+        self.events.append(('start', span.name))
+
+    def on_provide_end(self, span):
+        self.events.append(('end', span.name))
+
+
+class TracingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = providers.InMemoryExporter()
+        providers.add_tracer(self.exporter)
+
+    def tearDown(self):
+        for tracer in providers.get_tracers():
+            providers.remove_tracer(tracer)
+
+    def test_add_and_remove_tracer(self):
+        tracer = RecordingTracer()
+
+        providers.add_tracer(tracer)
+        self.assertEqual(providers.get_tracers(), (self.exporter, tracer))
+
+        providers.remove_tracer(tracer)
+        self.assertEqual(providers.get_tracers(), (self.exporter,))
+
+    def test_hooks(self):
+        tracer = RecordingTracer()
+        providers.add_tracer(tracer)
+        provider = providers.Factory(
+            Service,
+            database=providers.Singleton(Database),
+        )
+
+        provider()
+
+        self.assertEqual(tracer.events, [
+            ('start', 'Factory(Service)'),
+            ('start', 'Singleton(Database)'),
+            ('end', 'Singleton(Database)'),
+            ('end', 'Factory(Service)'),
+        ])
+
+    def test_factory_batch(self):
+        provider = providers.Factory(Database)
+
+        provider.many(2)
+        provider.map([{}])
+
+        self.assertEqual([span.name for span in self.exporter.spans],
+                         ['Factory(Database)'] * 3)
+
+    def test_providers_with_own_call(self):
+        abstract = providers.AbstractFactory(Database)
+        abstract.override(providers.Factory(Database))
+        dependency = providers.Dependency(instance_of=Database)
+        dependency.override(providers.Factory(Database))
+        aggregate = providers.FactoryAggregate(
+            database=providers.Factory(Database),
+        )
+
+        abstract()
+        dependency()
+        aggregate('database')
+
+        spans = self.exporter.spans
+        self.assertEqual([span.provider for span in spans],
+                         [abstract, dependency, aggregate])
+        self.assertEqual([span.children[0].name for span in spans],
+                         ['Factory(Database)'] * 3)
+
+    def test_span_tree(self):
+        database = providers.Singleton(Database)
+        provider = providers.Factory(
+            Service,
+            database,
+            cache=providers.Callable(dict),
+        )
+
+        provider()
+
+        spans = self.exporter.spans
+        self.assertEqual(len(spans), 1)
+
+        root = spans[0]
+        self.assertIs(root.provider, provider)
+        self.assertIsNone(root.parent)
+        self.assertIsNone(root.injection)
+        self.assertIsNone(root.error)
+        self.assertEqual([child.name for child in root.children],
+                         ['Singleton(Database)', 'Callable(dict)'])
+        self.assertEqual([child.injection for child in root.children],
+                         [0, 'cache'])
+        self.assertIs(root.children[0].parent, root)
+        self.assertEqual(root.children[0].frame, '0=Singleton(Database)')
+        self.assertEqual(root.children[1].frame, 'cache=Callable(dict)')
+
+    def test_span_timing(self):
+        provider = providers.Factory(Service, providers.Factory(Database))
+
+        provider()
+
+        root = self.exporter.spans[0]
+        child = root.children[0]
+        self.assertGreaterEqual(child.start, root.start)
+        self.assertLessEqual(child.end, root.end)
+        self.assertEqual(root.duration, root.end - root.start)
+        self.assertEqual(root.self_duration,
+                         root.duration - child.duration)
+
+    def test_attribute_injection(self):
+        provider = providers.Factory(Service, None)
+        provider.add_attributes(extra=providers.Factory(Database))
+
+        provider()
+
+        child = self.exporter.spans[0].children[0]
+        self.assertEqual(child.injection, 'extra')
+
+    def test_selector(self):
+        provider = providers.Selector(
+            providers.Object('database'),
+            database=providers.Factory(Database),
+        )
+
+        provider()
+
+        root = self.exporter.spans[0]
+        self.assertEqual(root.name, 'Selector')
+        self.assertEqual([child.name for child in root.children],
+                         ['Object', 'Factory(Database)'])
+
+    def test_overriding(self):
+        provider = providers.Factory(Service)
+        provider.override(providers.Factory(Database))
+
+        provider()
+
+        root = self.exporter.spans[0]
+        self.assertEqual(root.name, 'Factory(Service)')
+        self.assertEqual(root.children[0].name, 'Factory(Database)')
+
+    def test_error(self):
+        provider = providers.Factory(Service, providers.Callable(_fail))
+
+        with self.assertRaises(RuntimeError):
+            provider()
+
+        root = self.exporter.spans[0]
+        self.assertIsInstance(root.error, RuntimeError)
+        self.assertIsInstance(root.children[0].error, RuntimeError)
+
+    def test_clear(self):
+        providers.Factory(Database)()
+
+        self.exporter.clear()
+
+        self.assertEqual(self.exporter.spans, [])
+
+    def test_disabled_tracing(self):
+        providers.remove_tracer(self.exporter)
+
+        providers.Factory(Database)()
+
+        self.assertEqual(self.exporter.spans, [])
+
+    def test_span_init(self):
+        with self.assertRaises(errors.Error):
+            providers.Span()
+
+    def test_render_collapsed_stacks(self):
+        provider = providers.Factory(
+            Service,
+            providers.Factory(Database),
+            cache=providers.Factory(Database),
+        )
+
+        provider()
+        provider()
+
+        lines = providers.render_collapsed_stacks(
+            self.exporter.spans,
+        ).splitlines()
+
+        self.assertEqual([line.rsplit(' ', 1)[0] for line in lines], [
+            'Factory(Service)',
+            'Factory(Service);0=Factory(Database)',
+            'Factory(Service);cache=Factory(Database)',
+        ])
+        for line in lines:
+            self.assertGreaterEqual(int(line.rsplit(' ', 1)[1]), 0)
+
+
+def _fail():
+    raise RuntimeError()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Dependency injector providers tracing asyncio unit tests."""
+
+import asyncio
+
+import unittest2 as unittest
+
+from dependency_injector import providers
+
+
+async def _sleep(value):
+    await asyncio.sleep(0.01)
+    return value
+
+
+async def _fail():
+    await asyncio.sleep(0.01)
+    raise RuntimeError()
+
+
+class AsyncTracingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.exporter = providers.InMemoryExporter()
+        providers.add_tracer(self.exporter)
+        providers.enable_instrumentation()
+
+    def tearDown(self):
+        providers.disable_instrumentation()
+        providers.remove_tracer(self.exporter)
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def _run(self, f):
+        return self.loop.run_until_complete(f)
+
+    def test_coroutine(self):
+        provider = providers.Coroutine(_sleep, 1)
+
+        self.assertEqual(self._run(provider()), 1)
+
+        span = self.exporter.spans[0]
+        self.assertIs(span.provider, provider)
+        self.assertGreaterEqual(span.duration, 10000000)
+        self.assertGreaterEqual(provider.call_stats.total_time, 10000000)
+
+    def test_coroutine_error(self):
+        provider = providers.Coroutine(_fail)
+
+        with self.assertRaises(RuntimeError):
+            self._run(provider())
+
+        self.assertIsInstance(self.exporter.spans[0].error, RuntimeError)
+        self.assertEqual(provider.call_stats.calls, 1)
+
+    def test_future(self):
+        provider = providers.Callable(asyncio.ensure_future,
+                                      providers.Coroutine(_sleep, 1))
+
+        self.assertEqual(self._run(provider()), 1)
+
+        span = self.exporter.spans[0]
+        self.assertIs(span.provider, provider)
+        self.assertGreaterEqual(span.duration, 10000000)
+
+    def test_sync_call_after_coroutine(self):
+        provider = providers.Coroutine(_sleep, 1)
+        coroutine = provider()
+
+        providers.Factory(object)()
+        self._run(coroutine)
+
+        self.assertEqual([span.name for span in self.exporter.spans],
+                         ['Factory(object)', 'Coroutine(_sleep)'])
@@ -0,0 +1,178 @@
+"""Dependency injector providers graph unit tests."""
+
+import json
+
+import unittest2 as unittest
+
+from dependency_injector import (
+    containers,
+    providers,
+    graph,
+    errors,
+)
+
+
+class Container(containers.DeclarativeContainer):
+    config = providers.Object({'dsn': 'sqlite://'})
+    database = providers.Singleton(dict, dsn=config)
+    cache = providers.Singleton(dict)
+    users = providers.Factory(dict, database, cache=cache)
+    users.add_attributes(config=config)
+    handlers = providers.List(users, providers.Callable(len, database))
+    selector = providers.Selector(config, users=users, cache=cache)
+    aggregate = providers.FactoryAggregate(users=users)
+    delegate = providers.Delegate(users)
+
+
+class GraphTests(unittest.TestCase):
+
+    def setUp(self):
+        self.container = Container()
+        self.graph = graph.build_graph(self.container)
+
+    def test_nodes(self):
+        self.assertEqual(len(self.graph), 9)
+        for provider in self.container.providers.values():
+            self.assertIn(provider, self.graph)
+
+    def test_names(self):
+        self.assertEqual(self.graph.get_name(self.container.users), 'users')
+        self.assertIsNone(
+            self.graph.get_name(self.container.handlers.args[1]),
+        )
+
+    def test_edges(self):
+        edges = set((self.graph.get_name(edge.source),
+                     self.graph.get_name(edge.target),
+                     edge.kind,
+                     edge.name)
+                    for edge in self.graph.edges)
+
+        self.assertIn(('database', 'config', 'kwarg', 'dsn'), edges)
+        self.assertIn(('users', 'database', 'arg', 0), edges)
+        self.assertIn(('users', 'cache', 'kwarg', 'cache'), edges)
+        self.assertIn(('users', 'config', 'attribute', 'config'), edges)
+        self.assertIn(('handlers', 'users', 'arg', 0), edges)
+        self.assertIn(('selector', 'users', 'provider', 'users'), edges)
+        self.assertIn(('selector', 'config', 'related', None), edges)
+        self.assertIn(('aggregate', 'users', 'factory', 'users'), edges)
+        self.assertIn(('delegate', 'users', 'provides', None), edges)
+
+    def test_override_edges(self):
+        overriding = providers.Object({})
+        self.container.cache.override(overriding)
+
+        providers_graph = graph.build_graph(self.container)
+
+        self.assertIn(overriding, providers_graph)
+        self.assertIn(
+            graph.Edge(self.container.cache, overriding, 'override', None),
+            providers_graph.edges,
+        )
+
+    def test_dependencies_container(self):
+        dependencies = providers.DependenciesContainer(
+            database=providers.Object(1),
+        )
+
+        providers_graph = graph.build_graph({'dependencies': dependencies})
+
+        self.assertEqual(providers_graph.fan_out(dependencies), 1)
+
+    def test_dependencies_and_dependents(self):
+        self.assertEqual(
+            self.graph.dependencies(self.container.users),
+            (self.container.database,
+             self.container.cache,
+             self.container.config),
+        )
+        self.assertIn(self.container.users,
+                      self.graph.dependents(self.container.database))
+
+    def test_fan_in_and_fan_out(self):
+        self.assertEqual(self.graph.fan_in(self.container.users), 4)
+        self.assertEqual(self.graph.fan_out(self.container.users), 3)
+        self.assertEqual(self.graph.fan_out(self.container.config), 0)
+
+    def test_stats(self):
+        stats = self.graph.stats()
+
+        self.assertEqual(stats[0]['name'], 'users')
+        self.assertEqual(stats[0]['fan_in'], 4)
+        self.assertEqual(stats[0]['type'],
+                         'dependency_injector.providers.Factory')
+
+    def test_topological_order(self):
+        order = self.graph.topological_order()
+
+        self.assertEqual(len(order), len(self.graph))
+        positions = dict((id(provider), index)
+                         for index, provider in enumerate(order))
+        for edge in self.graph.edges:
+            self.assertLess(positions[id(edge.target)],
+                            positions[id(edge.source)])
+
+    def test_topological_order_deep_chain(self):
+        provider = providers.Object(0)
+        chain = [provider]
+        for _ in range(3000):
+            provider = providers.Callable(int, provider)
+            chain.append(provider)
+
+        providers_graph = graph.build_graph({'last': provider})
+
+        self.assertEqual(providers_graph.topological_order(), tuple(chain))
+        self.assertEqual(providers_graph.find_cycles(), tuple())
+
+    def test_find_cycles(self):
+        self.assertEqual(self.graph.find_cycles(), tuple())
+
+        provider1 = providers.Factory(dict)
+        provider2 = providers.Factory(dict, provider1)
+        provider1.add_args(provider2)
+        provider3 = providers.Factory(dict)
+        provider3.add_kwargs(itself=provider3)
+
+        providers_graph = graph.build_graph({'provider1': provider1,
+                                             'provider3': provider3})
+        cycles = providers_graph.find_cycles()
+
+        self.assertEqual(len(cycles), 2)
+        self.assertEqual(set(cycles[0]), {provider1, provider2})
+        self.assertEqual(cycles[1], (provider3,))
+
+    def test_topological_order_with_cycle(self):
+        provider1 = providers.Factory(dict)
+        provider2 = providers.Factory(dict, provider1)
+        provider1.add_args(provider2)
+
+        providers_graph = graph.build_graph({'provider1': provider1})
+
+        with self.assertRaises(errors.Error):
+            providers_graph.topological_order()
+
+    def test_to_json(self):
+        data = json.loads(self.graph.to_json())
+
+        self.assertEqual(len(data['nodes']), len(self.graph.nodes))
+        self.assertEqual(len(data['edges']), len(self.graph.edges))
+        self.assertIn({'id': 'n1',
+                       'name': 'database',
+                       'type': 'dependency_injector.providers.Singleton'},
+                      data['nodes'])
+
+    def test_to_dot(self):
+        dot = self.graph.to_dot()
+
+        self.assertTrue(dot.startswith('digraph "providers" {\n'))
+        self.assertIn(
+            'n1 [label="database '
+            '(dependency_injector.providers.Singleton)"];',
+            dot,
+        )
+        self.assertIn('n1 -> n0 [label="kwarg dsn"];', dot)
+        self.assertTrue(dot.endswith('}\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()